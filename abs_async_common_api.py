@@ -0,0 +1,66 @@
+""""
+This is the module that provides an abstract interface for a class with the
+functions used in common in all estimators whose requests are coroutines.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+from abs_common_api import AbsCommonApi
+from config import Config
+
+
+class AbsAsyncCommonApi(AbsCommonApi, metaclass=ABCMeta):
+    """
+    Variant of AbsCommonApi in which the methods that make requests to the
+    search engine are coroutines, so that many requests can be in flight at once.
+    """
+
+    @property
+    @abstractmethod
+    def concurrency_limit(self):
+        """
+        Returns the maximum number of coroutines run at once by execute_concurrently.
+        """
+        pass
+
+    @abstractmethod
+    async def download_entire_data_set(self):
+        """
+        Returns a list with all the documents from the data set.
+        """
+        pass
+
+    @abstractmethod
+    async def retrieve_number_matches(self, query):
+        """
+        Returns the number of matches in the search engine for the given query.
+        """
+        pass
+
+    @abstractmethod
+    async def download(self, query, is_to_download_id=True, is_to_download_content=True, limit=Config.SEARCH_ENGINE_LIMIT):
+        """
+        Returns the a list with documents retrieved by the given query with
+        the max size set by the given limit.
+        """
+        pass
+
+    @abstractmethod
+    async def download_if_in_range(self, query, min_number_matches, max_number_matches, is_to_download_id=True,
+                                   is_to_download_content=True):
+        """
+        Returns a search result with the number of matches of the given query and,
+        only if that number is between the given limits, its documents.
+        """
+        pass
+
+    @abstractmethod
+    async def execute_concurrently(self, collection, callback, is_to_return_results=False):
+        """
+        Awaits the coroutine function callback once for each item of the collection,
+        with at most concurrency_limit calls in progress. Exceptions raised by the
+        callback are raised again in the caller. If is_to_return_results is true,
+        returns a list with the values returned by the callback in the order of the
+        collection.
+        """
+        pass
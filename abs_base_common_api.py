@@ -1,13 +1,27 @@
 from abc import ABCMeta, abstractmethod
-from threading import Thread, Lock
+from contextlib import contextmanager
+from threading import Lock, local
+import random
 import re
+import time
+from urllib.parse import quote
 
 from abs_common_api import AbsCommonApi
+from abs_request_tracer import AbsRequestTracer
 from common_api_factory import CommonApiFactory
 from config import Config
 
 
 class AbsBaseCommonApi(AbsCommonApi, metaclass=ABCMeta):
+    # A word is a run of letters and hyphens that is followed by some other character.
+    _WORD_PATTERN = re.compile(r"[a-zA-Z-]+(?=[^a-zA-Z-])")
+    _WORD_CACHE_MAX_NUMBER_DOCUMENTS = 10000
+    # Whether query pool files are read through a memory mapping.
+    IS_QUERY_POOL_MEMORY_MAPPED = False
+    # Shared by every common API in the process, so each query pool file is read once.
+    _QUERY_POOL_REGISTRY = None
+    _LOCK_QUERY_POOL_REGISTRY = Lock()
+
     @property
     @abstractmethod
     def query_pool_file_path(self):
@@ -26,6 +40,29 @@ class AbsBaseCommonApi(AbsCommonApi, metaclass=ABCMeta):
     def download_count(self, val):
         self.__download_count = val
 
+    @property
+    def cache_statistics(self):
+        return None
+
+    @property
+    def request_tracer(self):
+        charged_common_api = self._get_charged_common_api()
+        if charged_common_api is not None:
+            return charged_common_api.request_tracer
+        return self.__request_tracer
+
+    @property
+    def transport(self):
+        with self.__lock_transport:
+            if self.__transport is None:
+                self.__transport = self.factory.create_live_transport()
+            return self.__transport
+
+    @transport.setter
+    def transport(self, val):
+        with self.__lock_transport:
+            self.__transport = val
+
     @property
     def factory(self):
         return self.__factory
@@ -34,10 +71,54 @@ class AbsBaseCommonApi(AbsCommonApi, metaclass=ABCMeta):
     def factory(self, val):
         self.__factory = val
 
+    @property
+    def worker_pool(self):
+        with self.__lock_worker_pool:
+            if self.__worker_pool is None:
+                self.__worker_pool = self.factory.create_worker_pool(self.thread_limit)
+            return self.__worker_pool
+
+    @property
+    def degree_cache_file_path(self):
+        return None
+
+    @property
+    def degree_cache(self):
+        with self.__lock_degree_cache:
+            if self.__degree_cache is None:
+                self.__degree_cache = self.factory.create_document_degree_cache(self.degree_cache_file_path)
+            return self.__degree_cache
+
+    @property
+    def query_pool_registry(self):
+        with AbsBaseCommonApi._LOCK_QUERY_POOL_REGISTRY:
+            if AbsBaseCommonApi._QUERY_POOL_REGISTRY is None:
+                AbsBaseCommonApi._QUERY_POOL_REGISTRY = self.factory.create_query_pool_registry()
+            return AbsBaseCommonApi._QUERY_POOL_REGISTRY
+
+    @property
+    def word_cache(self):
+        with self.__lock_word_cache:
+            if self.__word_cache is None:
+                self.__word_cache = self.factory.create_cache(AbsBaseCommonApi._WORD_CACHE_MAX_NUMBER_DOCUMENTS)
+            return self.__word_cache
+
     def __init__(self):
         self.__download_count = 0
         self.__factory = CommonApiFactory()
+        self.__request_tracer = self.__factory.create_request_tracer()
         self.__lock = Lock()
+        self.__local = local()
+        self.__transport = None
+        self.__lock_transport = Lock()
+        self.__worker_pool = None
+        self.__lock_worker_pool = Lock()
+        self.__degree_cache = None
+        self.__lock_degree_cache = Lock()
+        self.__word_cache = None
+        self.__lock_word_cache = Lock()
+        self.__query_pool = None
+        self.__lock_query_pool = Lock()
 
     @abstractmethod
     def download(self, query, is_to_download_id=True, is_to_download_content=True,
@@ -48,50 +129,96 @@ class AbsBaseCommonApi(AbsCommonApi, metaclass=ABCMeta):
     def download_entire_data_set(self):
         pass
 
+    def download_if_in_range(self, query, min_number_matches, max_number_matches, is_to_download_id=True,
+                             is_to_download_content=True):
+        number_matches = self.retrieve_number_matches(query)
+        if not min_number_matches <= number_matches <= max_number_matches:
+            return self.factory.create_search_result(number_matches, [])
+        return self.download(query, is_to_download_id, is_to_download_content)
+
+    def stream(self, query, is_to_download_id=True, is_to_download_content=True, page_size=Config.STREAM_PAGE_SIZE):
+        search_result = self.download(query, is_to_download_id, is_to_download_content)
+        return self.factory.create_streaming_search_result(search_result.number_results, iter(search_result.results))
+
+    def sample_documents(self, sample_size):
+        sample = []
+        for index, document in enumerate(self._stream_entire_data_set()):
+            if index < sample_size:
+                sample.append(document)
+            else:
+                random_index = random.randrange(index + 1)
+                if random_index < sample_size:
+                    sample[random_index] = document
+        if len(sample) < sample_size:
+            raise ValueError("Sample larger than population")
+        return sample
+
+    def _stream_entire_data_set(self):
+        return iter(self.download_entire_data_set().results)
+
     def read_query_pool(self):
-        query_pool = []
-        # noinspection PyTypeChecker
-        with open(self.query_pool_file_path) as archive:
-            for line in archive:
-                query_pool.append(line.rstrip("\n").rstrip("\r"))
-        return query_pool
+        # Checked before locking as well, since the estimators read the pool for every query they sample.
+        if self.__query_pool is None:
+            with self.__lock_query_pool:
+                if self.__query_pool is None:
+                    self.__query_pool = self.query_pool_registry.load(self.query_pool_file_path,
+                                                                      AbsBaseCommonApi.IS_QUERY_POOL_MEMORY_MAPPED)
+        return self.__query_pool
+
+    def _escape_query(self, query):
+        # The queries of a loaded pool were escaped when it was loaded. The pool is not loaded here, so that
+        # downloads do not depend on the pool file.
+        query_pool = self.__query_pool
+        if query_pool is None:
+            return quote(query)
+        return query_pool.escape(query)
 
     def retrieve_number_matches(self, query):
         search_result = self.download(query, True, False, 0, 1)
         return search_result.number_results
 
     def inc_download(self):
+        start = time.perf_counter()
         with self.__lock:
+            lock_wait = time.perf_counter() - start
             self.download_count += 1
-
-    def execute_in_parallel(self, collection, callback):
-        thread_list = []
-        for item in collection:
-            if len(thread_list) >= self.thread_limit:
-                thread_list[0].join()
-                del (thread_list[0])
-            thread = Thread(target=callback, args=(item,))
-            thread_list.append(thread)
-            thread.start()
-        for thread in thread_list:
-            thread.join()
+        self.request_tracer.record(AbsRequestTracer.LOCK_WAIT_STAGE, lock_wait)
+        charged_common_api = self._get_charged_common_api()
+        if charged_common_api is not None:
+            charged_common_api.inc_download()
+
+    @contextmanager
+    def charge_requests(self, common_api):
+        previous_common_api = self._get_charged_common_api()
+        self.__local.charged_common_api = common_api
+        try:
+            yield
+        finally:
+            self.__local.charged_common_api = previous_common_api
+
+    def _get_charged_common_api(self):
+        return getattr(self.__local, "charged_common_api", None)
+
+    def execute_in_parallel(self, collection, callback, is_to_return_results=False):
+        return self.worker_pool.execute(collection, callback, is_to_return_results)
 
     def report_progress(self, progress, total):
         print("Progress: " + str(progress) + "/" + str(total))
 
     def extract_words(self, text):
-        word = []
-        word_dictionary = {}
-        count = 0
-        letter_or_hyphen_pattern = re.compile(r"[a-z]|[A-Z]|-")
-        for character in text:
-            if letter_or_hyphen_pattern.match(character) is not None:
-                word.append(character)
-            else:
-                word = str.join("", word)
-                word = word.lower().strip("-").strip("-")
-                if len(word) > 0 and word not in word_dictionary:
-                    word_dictionary[word] = count
-                    count += 1
-                word = []
-        return list(word_dictionary.keys())
+        word_iterator = (x.lower().strip("-") for x in AbsBaseCommonApi._WORD_PATTERN.findall(text))
+        return list(dict.fromkeys(x for x in word_iterator if len(x) > 0))
+
+    def extract_document_words(self, document):
+        if document.identifier is None:
+            return self.extract_words(document.content)
+        words = self.word_cache.get(document.identifier)
+        if words is None:
+            words = self.extract_words(document.content)
+            self.word_cache.put(document.identifier, words)
+        return words
+
+    def _filter_result_content(self, search_result, is_to_have_id, is_to_have_content):
+        if is_to_have_id == is_to_have_content:
+            return search_result
+        return self.factory.create_projected_search_result(search_result, is_to_have_id, is_to_have_content)
@@ -1,5 +1,7 @@
+import random
 import signal
 from datetime import datetime, timedelta
+from multiprocessing import Pool
 
 from abs_executor import AbsExecutor
 from abc import ABCMeta, abstractmethod
@@ -7,6 +9,13 @@ from abc import ABCMeta, abstractmethod
 
 class AbsBaseExecutor(AbsExecutor, metaclass=ABCMeta):
     NUMBER_ITERATIONS = 1
+    NUMBER_PROCESSES = 1
+    _SEED_LIMIT = 2 ** 32
+    # Estimator of the current worker process when the iterations run in a process pool.
+    _process_estimator = None
+
+    class FatalFailure(Exception):
+        pass
 
     @abstractmethod
     def __init__(self):
@@ -39,10 +48,9 @@ class AbsBaseExecutor(AbsExecutor, metaclass=ABCMeta):
         self.__estimator = val
 
     # noinspection PyUnusedLocal
-    def _on_fatal_failure(self, signal_param, frame):
-        class FatalFailure(Exception):
-            pass
-        raise FatalFailure
+    @staticmethod
+    def _on_fatal_failure(signal_param, frame):
+        raise AbsBaseExecutor.FatalFailure
 
     def execute(self):
         signal.signal(signal.SIGUSR1, self._on_fatal_failure)
@@ -52,13 +60,46 @@ class AbsBaseExecutor(AbsExecutor, metaclass=ABCMeta):
         estimation_list = []
         duration_sum = timedelta()
         connections_sum = 0
-        for i in range(0, AbsBaseExecutor.NUMBER_ITERATIONS):
-            start = datetime.now()
-            estimation = self.estimator.estimate()
-            end = datetime.now()
+        if AbsBaseExecutor.NUMBER_PROCESSES > 1:
+            iteration_result_iterator = self._execute_in_processes()
+        else:
+            iteration_result_iterator = self._execute_sequentially()
+        for iteration_number, estimation, duration, connections, cache_statistics, trace_statistics \
+                in iteration_result_iterator:
             estimation_list.append(estimation)
-            self.logger.write_result_iteration(i + 1, estimation, end - start, self.estimator.download_count)
-            duration_sum += end - start
-            connections_sum += self.estimator.download_count
+            self.logger.write_result_iteration(iteration_number, estimation, duration, connections, cache_statistics,
+                                               trace_statistics)
+            duration_sum += duration
+            connections_sum += connections
         if AbsBaseExecutor.NUMBER_ITERATIONS > 1:
             self.logger.write_final_result(estimation_list, duration_sum, connections_sum)
+
+    def _execute_sequentially(self):
+        for i in range(0, AbsBaseExecutor.NUMBER_ITERATIONS):
+            yield AbsBaseExecutor._execute_iteration_with_estimator(self.estimator, i)
+
+    def _execute_in_processes(self):
+        seed_generator = random.SystemRandom()
+        task_list = [(i, seed_generator.randrange(AbsBaseExecutor._SEED_LIMIT))
+                     for i in range(0, AbsBaseExecutor.NUMBER_ITERATIONS)]
+        with Pool(AbsBaseExecutor.NUMBER_PROCESSES, AbsBaseExecutor._initialize_process, (self.factory,)) as pool:
+            yield from pool.imap_unordered(AbsBaseExecutor._execute_iteration_in_process, task_list)
+
+    @staticmethod
+    def _initialize_process(factory):
+        signal.signal(signal.SIGUSR1, AbsBaseExecutor._on_fatal_failure)
+        AbsBaseExecutor._process_estimator = factory.create_estimator()
+
+    @staticmethod
+    def _execute_iteration_in_process(task):
+        iteration_index, seed = task
+        random.seed(seed)
+        return AbsBaseExecutor._execute_iteration_with_estimator(AbsBaseExecutor._process_estimator, iteration_index)
+
+    @staticmethod
+    def _execute_iteration_with_estimator(estimator, iteration_index):
+        start = datetime.now()
+        estimation = estimator.estimate()
+        end = datetime.now()
+        return (iteration_index + 1, estimation, end - start, estimator.download_count, estimator.cache_statistics,
+                estimator.trace_statistics)
@@ -0,0 +1,22 @@
+""""
+Module with an abstract class for measuring the performance of the estimators.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsBenchmark(metaclass=ABCMeta):
+    """"
+    Runs estimators against a mock Solr server backed by a synthetic corpus and
+    measures them.
+    """
+
+    @abstractmethod
+    def run(self):
+        """
+        Runs every estimator and returns a dictionary, serializable as JSON, with
+        the parameters of the benchmark and, for each estimator, the estimation,
+        its error, the wall time, the number of requests, the requests per second
+        and the peak resident set size.
+        """
+        pass
@@ -0,0 +1,37 @@
+""""
+Module with an abstract class for a pool of long-lived browser sessions.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsBrowserPool(metaclass=ABCMeta):
+    """"
+    Keeps a bounded number of browser sessions alive and lends them out one
+    request at a time, so a browser is not started for every page fetched.
+    """
+
+    @property
+    @abstractmethod
+    def size(self):
+        """
+        The maximum number of browser sessions alive at the same time.
+        """
+        pass
+
+    @abstractmethod
+    def checkout(self):
+        """
+        Returns a context manager that lends a healthy browser session, blocking
+        while all of them are in use. The session is given back when the context
+        exits. It is discarded if the context exits with an exception or if it
+        has been used the maximum number of times.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """
+        Quits the browser sessions that are not in use.
+        """
+        pass
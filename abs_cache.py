@@ -0,0 +1,73 @@
+""""
+Module with an abstract class for an in-memory cache.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsCache(metaclass=ABCMeta):
+    """"
+    Class that keeps values in memory, evicting the least recently used ones when
+    its size limit is exceeded.
+    """
+
+    @property
+    @abstractmethod
+    def hit_count(self):
+        """
+        The number of lookups that found a value.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def miss_count(self):
+        """
+        The number of lookups that did not find a value.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def max_size(self):
+        """
+        The limit of the sum of the sizes of the cached values.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def size(self):
+        """
+        The sum of the sizes of the cached values.
+        """
+        pass
+
+    @abstractmethod
+    def get(self, key):
+        """
+        Returns the value cached for the key or None if there is none or it expired.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key, value, size=1):
+        """
+        Caches the value for the key, counting the given size against the limit.
+        Values larger than the limit are not cached.
+        """
+        pass
+
+    @abstractmethod
+    def reset_statistics(self):
+        """
+        Sets the hit and miss counts to zero.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """
+        Removes every cached value.
+        """
+        pass
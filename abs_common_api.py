@@ -29,6 +29,41 @@ class AbsCommonApi(metaclass=ABCMeta):
         """
         pass
 
+    @property
+    @abstractmethod
+    def cache_statistics(self):
+        """
+        Returns a dictionary with the number of cache hits and misses since the
+        download count was last reset, or None if the requests are not cached.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def request_tracer(self):
+        """
+        Returns the instance of an AbsRequestTracer class timing the stages of the
+        requests.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def transport(self):
+        """
+        Returns the instance of an AbsTransport class through which the raw responses
+        are fetched, so that they can be recorded and replayed.
+        """
+        pass
+
+    @transport.setter
+    @abstractmethod
+    def transport(self, val):
+        """
+        Sets the instance of an AbsTransport class.
+        """
+        pass
+
     @property
     @abstractmethod
     def factory(self):
@@ -45,11 +80,19 @@ class AbsCommonApi(metaclass=ABCMeta):
         """
         pass
 
+    @property
+    @abstractmethod
+    def degree_cache(self):
+        """
+        Returns the instance of an AbsDocumentDegreeCache class shared by the estimators.
+        """
+        pass
+
     @abstractmethod
     def read_query_pool(self):
         """
-        Returns a list with the queries specified in the query pool file,
-        whose path is set in the Config class.
+        Returns the AbsQueryPool with the queries specified in the query pool file.
+        The pool is loaded once and shared, so it must not be modified.
         """
         pass
 
@@ -60,6 +103,15 @@ class AbsCommonApi(metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def sample_documents(self, sample_size):
+        """
+        Returns a list with a uniform random sample, without replacement, of the
+        documents of the data set. Backends that can fetch documents at random
+        offsets may override the default streaming implementation.
+        """
+        pass
+
     @abstractmethod
     def retrieve_number_matches(self, query):
         """
@@ -67,6 +119,24 @@ class AbsCommonApi(metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def inc_download(self):
+        """
+        Increments the number of downloads by one.
+        """
+        pass
+
+    @abstractmethod
+    def charge_requests(self, common_api):
+        """
+        Returns a context manager within which the downloads made by the current
+        thread are also counted by the inc_download method of the given object, an
+        AbsCommonApi or any other with that method and a request_tracer property, and
+        their stages are timed by its request tracer, so that views sharing this
+        instance measure only their own requests.
+        """
+        pass
+
     @abstractmethod
     def download(self, query, is_to_download_id=True, is_to_download_content=True, limit=Config.SEARCH_ENGINE_LIMIT):
         """
@@ -76,10 +146,31 @@ class AbsCommonApi(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def execute_in_parallel(self, collection, callback):
+    def download_if_in_range(self, query, min_number_matches, max_number_matches, is_to_download_id=True,
+                             is_to_download_content=True):
         """
-        Executes a function in multiple threads, for each thread
-        the callback receives an item from the collection.
+        Returns a search result with the number of matches of the given query and,
+        only if that number is between the given limits, its documents. Backends
+        that learn the number of matches from the first page of results avoid a
+        separate request for it.
+        """
+        pass
+
+    @abstractmethod
+    def stream(self, query, is_to_download_id=True, is_to_download_content=True, page_size=Config.STREAM_PAGE_SIZE):
+        """
+        Returns a search result for the given query whose results are an iterator
+        that fetches the documents a page at a time while it is consumed.
+        """
+        pass
+
+    @abstractmethod
+    def execute_in_parallel(self, collection, callback, is_to_return_results=False):
+        """
+        Executes a function in a pool of reusable threads, the callback receives
+        an item from the collection at each call. Exceptions raised by the callback
+        are raised again in the caller. If is_to_return_results is true, returns a
+        list with the values returned by the callback in the order of the collection.
         """
         pass
 
@@ -96,3 +187,12 @@ class AbsCommonApi(metaclass=ABCMeta):
         Returns the words in the text as keys of a dictionary.
         """
         pass
+
+    @abstractmethod
+    def extract_document_words(self, document):
+        """
+        Returns the words in the content of the document, as extract_words does,
+        reusing the words extracted before for the same document identifier.
+        The returned list must not be modified.
+        """
+        pass
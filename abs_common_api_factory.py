@@ -17,9 +17,186 @@ class AbsCommonApiFactory(metaclass=ABCMeta):
         """
         pass
 
+    @abstractmethod
+    def create_columnar_search_result(self, number_results, identifier_iterable, content_iterable):
+        """
+        Instantiates an object derived from the AbsSearchResult class from the
+        identifiers and the contents of its documents, in the same order.
+        """
+        pass
+
+    @abstractmethod
+    def create_projected_search_result(self, search_result, is_to_have_id, is_to_have_content):
+        """
+        Instantiates an object derived from the AbsSearchResult class that is a view
+        of the given search result exposing only the identifiers, only the contents
+        or both, without copying its documents.
+        """
+        pass
+
+    @abstractmethod
+    def create_streaming_search_result(self, number_results, results):
+        """
+        Instantiates an object derived from the AbsSearchResult class whose results
+        are an iterator.
+        """
+        pass
+
     @abstractmethod
     def create_data(self, identifier, content):
         """
         Instantiates an object derived from the AbsData class.
         """
         pass
+
+    @abstractmethod
+    def create_worker_pool(self, size):
+        """
+        Instantiates an object derived from the AbsWorkerPool class.
+        """
+        pass
+
+    @abstractmethod
+    def create_browser_pool(self, size, create_browser, max_number_uses):
+        """
+        Instantiates an object derived from the AbsBrowserPool class, whose browsers
+        are started by calling create_browser.
+        """
+        pass
+
+    @abstractmethod
+    def create_rate_limiter(self, rate, burst_size):
+        """
+        Instantiates an object derived from the AbsRateLimiter class, allowing rate
+        requests per second and bursts of up to burst_size requests per key.
+        """
+        pass
+
+    @abstractmethod
+    def create_id_interning_table(self):
+        """
+        Instantiates an object derived from the AbsIdInterningTable class.
+        """
+        pass
+
+    @abstractmethod
+    def create_query_pool(self, file_path, is_memory_mapped=False):
+        """
+        Instantiates an object derived from the AbsQueryPool class with the queries of
+        the file, reading it through a memory mapping if is_memory_mapped is true.
+        """
+        pass
+
+    @abstractmethod
+    def create_query_pool_registry(self):
+        """
+        Instantiates an object derived from the AbsQueryPoolRegistry class.
+        """
+        pass
+
+    @abstractmethod
+    def create_query_sampler(self, query_pool, index_sequence):
+        """
+        Instantiates an object derived from the AbsQuerySampler class that draws the
+        queries of the pool at the indices of the sequence, in its order.
+        """
+        pass
+
+    @abstractmethod
+    def create_query_matcher(self, query_pool):
+        """
+        Instantiates an object derived from the AbsQueryMatcher class for an
+        AbsQueryPool.
+        """
+        pass
+
+    @abstractmethod
+    def create_incidence_matrix(self, degree_cache, query_matcher):
+        """
+        Instantiates an object derived from the AbsIncidenceMatrix class whose rows
+        are filled from the degree cache for the query pool of the matcher.
+        """
+        pass
+
+    @abstractmethod
+    def create_document_degree_cache(self, file_path=None):
+        """
+        Instantiates an object derived from the AbsDocumentDegreeCache class.
+        """
+        pass
+
+    @abstractmethod
+    def create_result_store(self, file_path, page_size):
+        """
+        Instantiates an object derived from the AbsResultStore class.
+        """
+        pass
+
+    @abstractmethod
+    def create_response_archive(self, file_path):
+        """
+        Instantiates an object derived from the AbsResponseArchive class.
+        """
+        pass
+
+    @abstractmethod
+    def create_live_transport(self):
+        """
+        Instantiates an object derived from the AbsTransport class that fetches every
+        response from the data source.
+        """
+        pass
+
+    @abstractmethod
+    def create_recording_transport(self, archive):
+        """
+        Instantiates an object derived from the AbsTransport class that fetches every
+        response from the data source and saves it in the archive.
+        """
+        pass
+
+    @abstractmethod
+    def create_replay_transport(self, archive, latency=0.0):
+        """
+        Instantiates an object derived from the AbsTransport class that serves every
+        response from the archive, waiting latency seconds for each one.
+        """
+        pass
+
+    @abstractmethod
+    def create_caching_common_api(self, common_api):
+        """
+        Instantiates an object derived from the AbsCommonApi class that caches the
+        requests made to the given one.
+        """
+        pass
+
+    @abstractmethod
+    def create_session_common_api(self, common_api, shared_with):
+        """
+        Instantiates an object derived from the AbsCommonApi class that caches the
+        requests made to the given one in the caches of shared_with, counting only
+        its own downloads.
+        """
+        pass
+
+    @abstractmethod
+    def create_cache(self, max_size, time_to_live=None):
+        """
+        Instantiates an object derived from the AbsCache class.
+        """
+        pass
+
+    @abstractmethod
+    def create_latency_histogram(self):
+        """
+        Instantiates an object derived from the AbsLatencyHistogram class.
+        """
+        pass
+
+    @abstractmethod
+    def create_request_tracer(self):
+        """
+        Instantiates an object derived from the AbsRequestTracer class.
+        """
+        pass
@@ -9,6 +9,7 @@ class AbsData(metaclass=ABCMeta):
     """"
     Class that represents the data taken from a search engine.
     """
+    __slots__ = ()
 
     @property
     @abstractmethod
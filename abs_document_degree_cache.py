@@ -0,0 +1,41 @@
+""""
+Module with an abstract class for caching which queries of a query pool match a document.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsDocumentDegreeCache(metaclass=ABCMeta):
+    """"
+    Class that stores, for each document and query pool, the queries of the pool that
+    match the document and their number, that is, the degree of the document.
+    """
+
+    @abstractmethod
+    def retrieve_matching_indices(self, document, query_matcher):
+        """
+        Returns a tuple with the indices in the query pool of the queries that match the
+        document, computing them with the query matcher if they are not cached.
+        """
+        pass
+
+    @abstractmethod
+    def retrieve_matching_queries(self, document, query_matcher):
+        """
+        Returns a list with the queries of the pool that match the document.
+        """
+        pass
+
+    @abstractmethod
+    def retrieve_degree(self, document, query_matcher):
+        """
+        Returns the number of queries of the pool that match the document.
+        """
+        pass
+
+    @abstractmethod
+    def save(self):
+        """
+        Writes the cache to disk, if it has a file path.
+        """
+        pass
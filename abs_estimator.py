@@ -33,6 +33,7 @@ class AbsEstimator(metaclass=ABCMeta):
         Returns the estimation of the size of the data set.
         """
         self.common_api.download_count = 0
+        self.common_api.request_tracer.reset()
 
     @property
     @abstractmethod
@@ -45,3 +46,11 @@ class AbsEstimator(metaclass=ABCMeta):
     @property
     def download_count(self):
         return self.common_api.download_count
+
+    @property
+    def cache_statistics(self):
+        return self.common_api.cache_statistics
+
+    @property
+    def trace_statistics(self):
+        return self.common_api.request_tracer.statistics
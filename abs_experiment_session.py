@@ -0,0 +1,45 @@
+""""
+Module with an abstract class for running many estimators over the same data set.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsExperimentSession(metaclass=ABCMeta):
+    """"
+    Runs a list of estimators over one common API, sharing its cache among them so
+    that a query is fetched only once per session.
+    """
+
+    @property
+    @abstractmethod
+    def common_api(self):
+        """
+        Returns the AbsCommonApi shared by the estimators.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def estimator_list(self):
+        """
+        Returns the estimators of the session.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def logger(self):
+        """
+        Returns the AbsLogger that receives the combined log of the session.
+        """
+        pass
+
+    @abstractmethod
+    def execute(self):
+        """
+        Runs every estimator, concurrently or in sequence, and logs for each one the
+        estimation, the duration and the number of requests with and without the
+        benefit of the shared cache.
+        """
+        pass
@@ -0,0 +1,31 @@
+""""
+Module with an abstract class for mapping document identifiers to integers.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsIdInterningTable(metaclass=ABCMeta):
+    """"
+    Assigns to each distinct document identifier a dense integer, starting from
+    zero in the order the identifiers are first seen, so that per-document values
+    can be kept in arrays indexed by them.
+    """
+
+    @property
+    @abstractmethod
+    def size(self):
+        """
+        Returns the number of distinct identifiers seen so far.
+        """
+        pass
+
+    @abstractmethod
+    def intern(self, identifier_iterable):
+        """
+        Returns an array with the integers of the given identifiers, assigning new
+        integers to the identifiers not seen before. The identifiers are all read
+        before the table is locked, so a streamed result should be interned a page at
+        a time.
+        """
+        pass
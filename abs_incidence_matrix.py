@@ -0,0 +1,68 @@
+""""
+Module with an abstract class for the incidence matrix between documents and the queries of a pool.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsIncidenceMatrix(metaclass=ABCMeta):
+    """"
+    Sparse matrix with a row for each document seen during an estimation and a column
+    for each query of the pool, whose entries tell which queries match which documents.
+    Rows are added as documents arrive, with the matching queries given by the
+    document degree cache, and documents with the same identifier share a row.
+    """
+
+    @property
+    @abstractmethod
+    def query_matcher(self):
+        """
+        The AbsQueryMatcher of the query pool the columns correspond to.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def number_rows(self):
+        """
+        Returns the number of rows added so far.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def number_columns(self):
+        """
+        Returns the number of queries in the pool.
+        """
+        pass
+
+    @abstractmethod
+    def add_document(self, document):
+        """
+        Returns the row of the document, adding it if the document was not seen before.
+        """
+        pass
+
+    @abstractmethod
+    def retrieve_columns(self, row):
+        """
+        Returns a sorted array with the columns, that is, the indices in the query
+        pool, of the queries that match the document of the row.
+        """
+        pass
+
+    @abstractmethod
+    def retrieve_degrees(self, row_list):
+        """
+        Returns an array with the number of queries that match the document of each
+        row in the list.
+        """
+        pass
+
+    @abstractmethod
+    def count_nonzero_rows(self, row_list):
+        """
+        Returns the number of rows in the list whose document matches some query.
+        """
+        pass
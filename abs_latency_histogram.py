@@ -0,0 +1,43 @@
+""""
+Module with an abstract class for a histogram of latencies.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsLatencyHistogram(metaclass=ABCMeta):
+    """"
+    Histogram of durations in seconds with a fixed relative precision, whose memory
+    does not grow with the number of recorded durations.
+    """
+
+    @property
+    @abstractmethod
+    def count(self):
+        """
+        Returns the number of recorded durations.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def total(self):
+        """
+        Returns the sum of the recorded durations.
+        """
+        pass
+
+    @abstractmethod
+    def record(self, duration):
+        """
+        Adds a duration to the histogram.
+        """
+        pass
+
+    @abstractmethod
+    def percentile(self, percentage):
+        """
+        Returns the duration below which the given percentage of the recorded
+        durations fall, or None if nothing was recorded.
+        """
+        pass
@@ -18,9 +18,27 @@ class AbsLogger(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def write_result_iteration(self, iteration_number, estimation, duration, connections):
+    def write_result_iteration(self, iteration_number, estimation, duration, connections, cache_statistics=None,
+                               trace_statistics=None):
         """
-        Writes the result of an iteration of the experiment.
+        Writes the result of an iteration of the experiment, with the cache hits and
+        misses next to the number of connections when the requests are cached. The
+        latency percentiles of each traced stage are written to the details log.
+        """
+        pass
+
+    @abstractmethod
+    def write_session_header(self):
+        """
+        Writes the header of the combined log of an experiment session.
+        """
+        pass
+
+    @abstractmethod
+    def write_session_result(self, estimator_name, estimation, duration, connections, connections_without_cache):
+        """
+        Writes the result of one estimator of an experiment session, with the number
+        of requests it sent and the number it would have sent without the shared cache.
         """
         pass
 
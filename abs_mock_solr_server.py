@@ -0,0 +1,57 @@
+""""
+Module with an abstract class for an in-process HTTP server imitating Solr.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsMockSolrServer(metaclass=ABCMeta):
+    """"
+    Serves an AbsSyntheticCorpus through the subset of the Solr select JSON API
+    used by SolrCommonApi: q, start, rows, fl, sort and cursorMark.
+    """
+
+    @property
+    @abstractmethod
+    def select_url(self):
+        """
+        Returns the select URL to give to SolrCommonApi.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def request_count(self):
+        """
+        Returns the number of requests answered since the last reset.
+        """
+        pass
+
+    @abstractmethod
+    def start(self):
+        """
+        Starts answering requests in background threads.
+        """
+        pass
+
+    @abstractmethod
+    def stop(self):
+        """
+        Stops answering requests and releases the port.
+        """
+        pass
+
+    @abstractmethod
+    def answer(self, parameter_dict):
+        """
+        Returns the JSON dictionary answering a select request, given its parsed query
+        string parameters.
+        """
+        pass
+
+    @abstractmethod
+    def reset_request_count(self):
+        """
+        Sets the number of answered requests back to zero.
+        """
+        pass
@@ -0,0 +1,67 @@
+""""
+Module with an abstract class for extracting the search results from the web
+pages of a website.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+import lxml.etree
+import lxml.html
+
+
+class AbsPageExtractor(metaclass=ABCMeta):
+    """"
+    Extracts the number of matches and the documents from the source of a page of
+    search results, parsing it once and visiting only the elements found by XPath.
+    Extractors hold no reference to a common API, so they can be sent to other
+    processes, and return documents as (identifier, content) tuples. A document
+    that cannot be extracted is returned as (None, source of its element).
+    """
+
+    @abstractmethod
+    def _extract_number_matches(self, tree):
+        """
+        Returns the number of matches in the parsed page, 0 if it says there are no
+        results, or -1 if the page is not loaded yet.
+        """
+        pass
+
+    @abstractmethod
+    def _extract_record_list(self, tree):
+        """
+        Returns the list of (identifier, content) tuples of the documents in the
+        parsed page.
+        """
+        pass
+
+    def extract(self, page_source):
+        """
+        Returns a tuple with the number of matches in the page, as returned by
+        _extract_number_matches, and the list of documents in it.
+        """
+        try:
+            tree = lxml.html.document_fromstring(page_source)
+        except (lxml.etree.ParserError, ValueError):
+            return -1, []
+        number_matches = self._extract_number_matches(tree)
+        if number_matches <= 0:
+            return number_matches, []
+        return number_matches, self._extract_record_list(tree)
+
+    @staticmethod
+    def _create_class_condition(value):
+        """
+        Returns an XPath condition on the class attribute matching elements the way
+        BeautifulSoup does: a value with many classes must match the whole
+        attribute, a single class must be one of the classes of the element.
+        """
+        if " " in value:
+            return "normalize-space(@class)='" + value + "'"
+        return "contains(concat(' ', normalize-space(@class), ' '), ' " + value + " ')"
+
+    @staticmethod
+    def _find_first(element, path):
+        element_list = element.xpath(path)
+        if len(element_list) == 0:
+            return None
+        return element_list[0]
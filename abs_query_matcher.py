@@ -0,0 +1,59 @@
+""""
+Module with an abstract class that finds which queries of a query pool occur in a text.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsQueryMatcher(metaclass=ABCMeta):
+    """"
+    Class built once for a query pool that finds, in a single pass over a text, every
+    query of the pool that occurs in it. A query occurs in a text when its lower case
+    form is a substring of the lower case form of the text.
+    """
+
+    @property
+    @abstractmethod
+    def query_pool(self):
+        """
+        The AbsQueryPool the matcher was built for.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def fingerprint(self):
+        """
+        A digest of the query pool, equal for matchers built for equal query pools.
+        """
+        pass
+
+    @abstractmethod
+    def match_indices(self, text):
+        """
+        Returns a sorted list with the indices in the query pool of the queries that
+        occur in the text.
+        """
+        pass
+
+    @abstractmethod
+    def match(self, text):
+        """
+        Returns a list with the queries that occur in the text, in the order of the
+        query pool.
+        """
+        pass
+
+    @abstractmethod
+    def count_matches(self, text):
+        """
+        Returns the number of queries of the pool that occur in the text.
+        """
+        pass
+
+    @abstractmethod
+    def has_match(self, text):
+        """
+        Returns whether any query of the pool occurs in the text.
+        """
+        pass
@@ -0,0 +1,67 @@
+""""
+Module with an abstract class for the query pool shared by the estimators.
+"""
+
+from abc import abstractmethod
+from collections.abc import Sequence
+
+
+class AbsQueryPool(Sequence):
+    """"
+    Read-only sequence of the distinct queries of a query pool file, in the order of
+    the file. The lower case and URL escaped forms of the queries are computed once,
+    when the pool is loaded.
+    """
+
+    @property
+    @abstractmethod
+    def file_path(self):
+        """
+        The path of the file the pool was loaded from.
+        """
+        pass
+
+    @abstractmethod
+    def __getitem__(self, index):
+        pass
+
+    @abstractmethod
+    def __len__(self):
+        pass
+
+    @abstractmethod
+    def __contains__(self, query):
+        """
+        Returns whether the query is in the pool, in constant time.
+        """
+        pass
+
+    @abstractmethod
+    def index(self, query, start=0, stop=None):
+        """
+        Returns the index of the query in the pool, in constant time, or raises
+        ValueError if it is not there.
+        """
+        pass
+
+    @abstractmethod
+    def lower(self, index):
+        """
+        Returns the lower case form of the query at the index.
+        """
+        pass
+
+    @abstractmethod
+    def escape(self, query):
+        """
+        Returns the URL escaped form of the query, whether it is in the pool or not.
+        """
+        pass
+
+    @abstractmethod
+    def create_sampler(self, sample_size=None):
+        """
+        Returns an AbsQuerySampler that draws queries of the pool in a random order
+        without replacement, up to sample_size queries or the whole pool if it is None.
+        """
+        pass
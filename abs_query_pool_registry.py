@@ -0,0 +1,20 @@
+""""
+Module with an abstract class that shares query pools between their users.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsQueryPoolRegistry(metaclass=ABCMeta):
+    """"
+    Keeps the query pools loaded in the process, so that each query pool file is
+    read once however many estimators and iterations use it.
+    """
+
+    @abstractmethod
+    def load(self, file_path, is_memory_mapped=False):
+        """
+        Returns the AbsQueryPool of the file, loading it only the first time or when
+        the file changed since it was loaded.
+        """
+        pass
@@ -0,0 +1,19 @@
+""""
+Module with an abstract class for drawing queries of a query pool without replacement.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsQuerySampler(metaclass=ABCMeta):
+    """"
+    Draws the queries of a random permutation of a query pool, one at a time. Any
+    number of threads may draw at once without locking.
+    """
+
+    @abstractmethod
+    def take(self):
+        """
+        Returns the next query of the permutation, or None once all were drawn.
+        """
+        pass
@@ -0,0 +1,19 @@
+""""
+Module with an abstract class for limiting the rate of requests to web domains.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsRateLimiter(metaclass=ABCMeta):
+    """"
+    Enforces, for each key, usually a web domain, a sustained rate of requests
+    while allowing short bursts above it.
+    """
+
+    @abstractmethod
+    def acquire(self, key):
+        """
+        Blocks until a request to the given key is allowed, then accounts for it.
+        """
+        pass
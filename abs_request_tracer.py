@@ -0,0 +1,61 @@
+""""
+Module with an abstract class for timing the stages of the requests.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsRequestTracer(metaclass=ABCMeta):
+    """"
+    Times the stages of the requests sent to a data source and aggregates the
+    timings of each stage in an AbsLatencyHistogram.
+
+    Attributes:
+        URL_BUILD_STAGE         Building the URL of a request.
+        FETCH_STAGE             Sending a request and receiving its response.
+        DECODE_STAGE            Decoding or parsing the response.
+        CONSTRUCTION_STAGE      Building the search result and its documents.
+        CACHE_READ_STAGE        Looking up a result or count in a cache or a result store.
+        CACHE_WRITE_STAGE       Storing a result or count in a cache, a result store or a file.
+        LOCK_WAIT_STAGE         Waiting for the lock of the download count.
+        RATE_LIMIT_STAGE        Waiting for the rate limiter of a web domain.
+    """
+    URL_BUILD_STAGE = "url_build"
+    FETCH_STAGE = "fetch"
+    DECODE_STAGE = "decode"
+    CONSTRUCTION_STAGE = "construction"
+    CACHE_READ_STAGE = "cache_read"
+    CACHE_WRITE_STAGE = "cache_write"
+    LOCK_WAIT_STAGE = "lock_wait"
+    RATE_LIMIT_STAGE = "rate_limit_wait"
+
+    @property
+    @abstractmethod
+    def statistics(self):
+        """
+        Returns a dictionary with, for each stage, a dictionary with the number of
+        timings, their total and the 50th, 95th and 99th percentiles in seconds.
+        """
+        pass
+
+    @abstractmethod
+    def trace(self, stage):
+        """
+        Returns a context manager that records the time spent inside it under the
+        given stage.
+        """
+        pass
+
+    @abstractmethod
+    def record(self, stage, duration):
+        """
+        Records the duration in seconds of an occurrence of the given stage.
+        """
+        pass
+
+    @abstractmethod
+    def reset(self):
+        """
+        Discards every recorded timing.
+        """
+        pass
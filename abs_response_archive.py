@@ -0,0 +1,34 @@
+""""
+Module with an abstract class for keeping the raw responses of a data source.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsResponseArchive(metaclass=ABCMeta):
+    """"
+    Keeps raw responses, bytes or str, by key so that they can be served again
+    without the data source.
+    """
+
+    @abstractmethod
+    def load(self, key):
+        """
+        Returns the response stored with the key, of the type it was saved with, or
+        None if there is none.
+        """
+        pass
+
+    @abstractmethod
+    def save(self, key, response):
+        """
+        Stores the response with the key, replacing the previous one.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """
+        Releases the resources held by the archive.
+        """
+        pass
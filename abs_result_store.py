@@ -0,0 +1,59 @@
+""""
+Module with an abstract class for storing the results of searches.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsResultStore(metaclass=ABCMeta):
+    """"
+    Class that keeps the results of searches so that they are not downloaded again. The
+    results are kept page by page: page n of a query holds its results from position
+    n * page_size onwards. Pages are only appended, so a page that was saved is never
+    written again and the pages saved before an interruption are kept.
+    """
+
+    @property
+    @abstractmethod
+    def page_size(self):
+        """
+        Returns the number of results in each full page.
+        """
+        pass
+
+    @abstractmethod
+    def load_number_results(self, query):
+        """
+        Returns the number of results of the query or None if nothing was stored for it.
+        """
+        pass
+
+    @abstractmethod
+    def load_pages(self, query, first_page_number, last_page_number):
+        """
+        Returns a dictionary from page number to the list of AbsData objects of each
+        stored page of the query between the first and the last page numbers, inclusive.
+        """
+        pass
+
+    @abstractmethod
+    def save_page(self, query, number_results, page_number, data_list):
+        """
+        Stores a page of results of the query, unless the page is already stored.
+        """
+        pass
+
+    @abstractmethod
+    def save_many(self, query_result_list):
+        """
+        Stores a list of (query, search result) pairs at once, split into pages. Pages
+        already stored are kept.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """
+        Releases the resources held by the store.
+        """
+        pass
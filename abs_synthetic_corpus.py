@@ -0,0 +1,52 @@
+""""
+Module with an abstract class for a generated data set used by the benchmarks.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsSyntheticCorpus(metaclass=ABCMeta):
+    """"
+    Data set of generated documents whose words follow a Zipfian distribution over
+    a fixed vocabulary.
+    """
+
+    @property
+    @abstractmethod
+    def size(self):
+        """
+        Returns the number of documents.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def vocabulary(self):
+        """
+        Returns the list of words the documents are made of, most frequent first.
+        """
+        pass
+
+    @abstractmethod
+    def retrieve_document(self, index):
+        """
+        Returns the pair (identifier, content) of the document at the given position.
+        The documents are ordered by identifier.
+        """
+        pass
+
+    @abstractmethod
+    def match(self, word_list):
+        """
+        Returns the ordered positions of the documents containing any of the words,
+        or of every document when the list contains "*".
+        """
+        pass
+
+    @abstractmethod
+    def write_query_pool(self, file_path):
+        """
+        Writes the vocabulary to a file, one word per line, so it can be used as
+        query pool.
+        """
+        pass
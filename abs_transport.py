@@ -0,0 +1,38 @@
+""""
+Module with an abstract class for fetching the raw responses of a data source.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsTransport(metaclass=ABCMeta):
+    """"
+    Sits between a common API and its data source, so that the raw responses can be
+    recorded into an archive and served back from it later without the network.
+    """
+
+    @abstractmethod
+    def fetch(self, key, download, decode):
+        """
+        Returns the decoded response identified by the key, usually its URL. The
+        download function fetches it from the data source and returns a pair with the
+        raw response, bytes or str, and the decoded response, or (None, None) on
+        failure. The decode function turns a raw response into the decoded one.
+        Raises LookupError when the response cannot be served without the data source.
+        """
+        pass
+
+    @abstractmethod
+    async def fetch_async(self, key, download, decode):
+        """
+        Does the same as fetch, for a download coroutine function, without blocking
+        the event loop.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """
+        Releases the resources held by the transport.
+        """
+        pass
@@ -1,28 +1,33 @@
 import os
-import pickle
 import signal
 import itertools
 import re
-import time
-import math
+from multiprocessing import get_context
+from threading import Lock
+from urllib.parse import urlsplit
 from abc import ABCMeta, abstractmethod
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.support.wait import WebDriverWait
 
 from config import Config
 from abs_base_common_api import AbsBaseCommonApi
-from abs_search_result import AbsSearchResult
+from abs_request_tracer import AbsRequestTracer
 
 
 class AbsWebsiteCommonApi(AbsBaseCommonApi, metaclass=ABCMeta):
-    _DATA_FILE_EXTENSION = ".pkl"
+    _DEGREE_CACHE_FILE_SUFFIX = "_degrees.pkl"
     _PAGE_LOAD_TIMEOUT = 30
-    _CRAWL_DELAY = 1
+    # Sustained requests per second to a web domain, and the number of requests allowed at once above that rate.
+    _REQUESTS_PER_SECOND = 1
+    _BURST_SIZE = 4
+    _PAGE_THREADS_PER_THREAD = 4
     _DOWNLOAD_TRY_NUMBER = 10000
+    _BROWSER_MAX_NUMBER_USES = 100
     _OFFSET_MASK = "<<offset>>"
     _QUERY_MASK = "<<query>>"
-    _HTML_PARSER = "lxml"
+    # Parsing runs in this many processes, or in the fetching thread if it is zero.
+    NUMBER_PARSE_PROCESSES = 0
+    _PROCESS_START_METHOD = "spawn"
     _JAVASCRIPT_GET_PAGE_SOURCE_CODE = "return document.getElementsByTagName('html')[0].innerHTML"
 
     @property
@@ -50,18 +55,83 @@ class AbsWebsiteCommonApi(AbsBaseCommonApi, metaclass=ABCMeta):
     def data_folder_path(self):
         pass
 
+    @property
     @abstractmethod
-    def _extract_data_list_from_soup(self, soup):
+    def result_store_file_path(self):
         pass
 
+    @property
+    def result_store(self):
+        with self.__lock_result_store:
+            if self.__result_store is None:
+                self.__result_store = self.factory.create_result_store(self.result_store_file_path,
+                                                                       self.max_results_per_page)
+            return self.__result_store
+
+    @property
+    def page_thread_limit(self):
+        return self.thread_limit * AbsWebsiteCommonApi._PAGE_THREADS_PER_THREAD
+
+    @property
+    def browser_pool(self):
+        with self.__lock_browser_pool:
+            if self.__browser_pool is None:
+                self.__browser_pool = self.factory.create_browser_pool(self.page_thread_limit, webdriver.PhantomJS,
+                                                                       AbsWebsiteCommonApi._BROWSER_MAX_NUMBER_USES)
+            return self.__browser_pool
+
+    @property
+    def page_worker_pool(self):
+        # Separate from worker_pool, which runs the calls made from its own threads inline.
+        with self.__lock_page_worker_pool:
+            if self.__page_worker_pool is None:
+                self.__page_worker_pool = self.factory.create_worker_pool(self.page_thread_limit)
+            return self.__page_worker_pool
+
+    @property
+    def rate_limiter(self):
+        with self.__lock_rate_limiter:
+            if self.__rate_limiter is None:
+                self.__rate_limiter = self.factory.create_rate_limiter(AbsWebsiteCommonApi._REQUESTS_PER_SECOND,
+                                                                       AbsWebsiteCommonApi._BURST_SIZE)
+            return self.__rate_limiter
+
+    @property
+    def degree_cache_file_path(self):
+        return self.data_folder_path + AbsWebsiteCommonApi._DEGREE_CACHE_FILE_SUFFIX
+
+    @property
     @abstractmethod
-    def _extract_number_matches_from_soup(self, soup):
+    def page_extractor(self):
         pass
 
+    @property
+    def parse_process_pool(self):
+        if AbsWebsiteCommonApi.NUMBER_PARSE_PROCESSES <= 0:
+            return None
+        with self.__lock_parse_process_pool:
+            if self.__parse_process_pool is None:
+                context = get_context(AbsWebsiteCommonApi._PROCESS_START_METHOD)
+                self.__parse_process_pool = context.Pool(AbsWebsiteCommonApi.NUMBER_PARSE_PROCESSES)
+            return self.__parse_process_pool
+
     @abstractmethod
     def _calculate_real_offset(self, offset):
         pass
 
+    def __init__(self):
+        super().__init__()
+        self.__result_store = None
+        self.__lock_result_store = Lock()
+        self.__browser_pool = None
+        self.__lock_browser_pool = Lock()
+        self.__page_worker_pool = None
+        self.__lock_page_worker_pool = Lock()
+        self.__rate_limiter = None
+        self.__lock_rate_limiter = Lock()
+        self.__parse_process_pool = None
+        self.__lock_parse_process_pool = Lock()
+
     def download_entire_data_set(self):
         print("ERROR - Invalid operation")
         os.kill(os.getpid(), signal.SIGUSR1)
@@ -69,130 +139,132 @@ class AbsWebsiteCommonApi(AbsBaseCommonApi, metaclass=ABCMeta):
 
     def download(self, query, is_to_download_id=True, is_to_download_content=True, offset=0,
                  limit=Config.SEARCH_ENGINE_LIMIT):
-        file_path = self._build_file_path(query)
-        if os.path.exists(file_path):
-            search_result = self._get_saved_result(file_path)
-            if search_result is not None:
-                if search_result.number_results == 0:
-                    return search_result
-                number_downloaded_results = len(search_result.results)
-                number_additional_downloads = self._calculate_number_additional_downloads(search_result.number_results,
-                                                                                          number_downloaded_results, limit)
-                if number_additional_downloads > 0:
-                    data_list = self._do_additional_downloads(query, number_downloaded_results, number_additional_downloads)
-                    data_list = list(itertools.chain(search_result.results, data_list))
-                    search_result = self.factory.create_search_result(search_result.number_results, data_list)
-                    self._save_result(file_path, search_result)
-                search_result = self._filter_result_content(search_result, is_to_download_id, is_to_download_content)
-                return search_result
-        web_page = self._attempt_download(query, offset)
-        soup = BeautifulSoup(web_page, AbsWebsiteCommonApi._HTML_PARSER)
-        number_matches = self._extract_number_matches_from_soup(soup)
-        if number_matches == 0:
-            search_result = self.factory.create_search_result(0, [])
-            self._save_result(file_path, search_result)
-            return search_result
-        data_list = self._extract_data_list_from_soup(soup)
-        # noinspection PyTypeChecker
-        number_downloaded_results = len(data_list)
-        # noinspection PyTypeChecker
-        number_additional_downloads = self._calculate_number_additional_downloads(number_matches,
-                                                                                  number_downloaded_results, limit)
-        if number_additional_downloads > 0:
-            additional_data_list = self._do_additional_downloads(query, number_downloaded_results,
-                                                                 number_additional_downloads)
-            data_list = list(itertools.chain(data_list, additional_data_list))
+        # Only the pages covering [offset, offset + limit) are read, and only the ones not yet stored are fetched.
+        first_page_number = offset // self.max_results_per_page
+        number_matches = self._get_saved_number_results(query)
+        page_dictionary = {}
+        if number_matches is None:
+            number_matches, record_list = self._attempt_download(query, first_page_number * self.max_results_per_page)
+            data_list = self._create_data_list(record_list)
+            self._save_page(query, number_matches, first_page_number, data_list)
+            page_dictionary[first_page_number] = data_list
+        end = min(number_matches, offset + limit)
+        if end <= offset:
+            return self.factory.create_search_result(number_matches, [])
+        last_page_number = (end - 1) // self.max_results_per_page
+        if len(page_dictionary) == 0:
+            page_dictionary = self._get_saved_pages(query, first_page_number, last_page_number)
+        missing_page_number_list = [x for x in range(first_page_number, last_page_number + 1)
+                                    if x not in page_dictionary]
+        if len(missing_page_number_list) > 0:
+            data_list_list = self._do_additional_downloads(query, number_matches, missing_page_number_list)
+            page_dictionary.update(zip(missing_page_number_list, data_list_list))
+        data_list = list(itertools.chain.from_iterable(page_dictionary[x]
+                                                       for x in range(first_page_number, last_page_number + 1)))
+        first_index = offset - first_page_number * self.max_results_per_page
+        data_list = data_list[first_index:first_index + end - offset]
         search_result = self.factory.create_search_result(number_matches, data_list)
-        self._save_result(file_path, search_result)
         search_result = self._filter_result_content(search_result, is_to_download_id, is_to_download_content)
         return search_result
 
-    def _build_file_path(self, query):
-        return self.data_folder_path + os.path.sep + query + AbsWebsiteCommonApi._DATA_FILE_EXTENSION
+    def download_if_in_range(self, query, min_number_matches, max_number_matches, is_to_download_id=True,
+                             is_to_download_content=True):
+        search_result = self.download(query, is_to_download_id, is_to_download_content, 0, self.max_results_per_page)
+        if not min_number_matches <= search_result.number_results <= max_number_matches:
+            return self.factory.create_search_result(search_result.number_results, [])
+        return self.download(query, is_to_download_id, is_to_download_content)
 
-    def _get_saved_result(self, file_path):
-        try:
-            with open(file_path, "rb") as archive:
-                search_result = pickle.load(archive)
-                assert (isinstance(search_result, AbsSearchResult))
-        except:
-            search_result = None
-        return search_result
+    def _get_saved_number_results(self, query):
+        with self.request_tracer.trace(AbsRequestTracer.CACHE_READ_STAGE):
+            return self.result_store.load_number_results(query)
+
+    def _get_saved_pages(self, query, first_page_number, last_page_number):
+        with self.request_tracer.trace(AbsRequestTracer.CACHE_READ_STAGE):
+            return self.result_store.load_pages(query, first_page_number, last_page_number)
+
+    def _extract_page(self, page_source):
+        with self.request_tracer.trace(AbsRequestTracer.DECODE_STAGE):
+            if self.parse_process_pool is None:
+                return self.page_extractor.extract(page_source)
+            return self.parse_process_pool.apply(self.page_extractor.extract, (page_source,))
+
+    def _create_data_list(self, record_list):
+        with self.request_tracer.trace(AbsRequestTracer.CONSTRUCTION_STAGE):
+            data_list = []
+            for identifier, content in record_list:
+                if identifier is None:
+                    print(content)
+                    print("ERROR - Data extraction failure")
+                    os.kill(os.getpid(), signal.SIGUSR1)
+                    continue
+                data_list.append(self.factory.create_data(identifier, content))
+            return data_list
+
+    def _do_additional_downloads(self, query, number_matches, page_number_list):
+        # The pages are downloaded by other threads, so they are charged to the common API of the calling thread.
+        charged_common_api = self._get_charged_common_api()
 
-    def _do_additional_downloads(self, query, number_downloaded_results, number_additional_downloads):
-        data_list = []
-        for i in range(0, number_additional_downloads):
-            # noinspection PyTypeChecker
-            offset = number_downloaded_results + i * self.max_results_per_page
-            web_page = self._attempt_download(query, offset)
-            soup = BeautifulSoup(web_page, AbsWebsiteCommonApi._HTML_PARSER)
-            list_from_soup = self._extract_data_list_from_soup(soup)
-            data_list = itertools.chain(data_list, list_from_soup)
-        data_list = list(data_list)
+        def download_page(page_number):
+            with self.charge_requests(charged_common_api):
+                return self._download_page(query, number_matches, page_number)
+
+        return self.page_worker_pool.execute(page_number_list, download_page, True)
+
+    def _download_page(self, query, number_matches, page_number):
+        # Each page is saved as soon as it is downloaded, so an interruption loses only the pages in progress.
+        page_number_matches, record_list = self._attempt_download(query, page_number * self.max_results_per_page)
+        data_list = self._create_data_list(record_list)
+        self._save_page(query, number_matches, page_number, data_list)
         return data_list
 
     def test_page_loaded(self, web_page):
+        # The source and the extracted page are returned through WebDriverWait.until, so the page is parsed only once.
         page_source = web_page.execute_script(AbsWebsiteCommonApi._JAVASCRIPT_GET_PAGE_SOURCE_CODE)
-        soup = BeautifulSoup(page_source, AbsWebsiteCommonApi._HTML_PARSER)
-        return self._extract_number_matches_from_soup(soup) >= 0
+        page = self._extract_page(page_source)
+        if page[0] < 0:
+            return False
+        return page_source, page
 
     def _attempt_download(self, query, offset):
         real_offset = self._calculate_real_offset(offset)
         real_offset = int(real_offset)
-        dictionary = {AbsWebsiteCommonApi._QUERY_MASK: query, AbsWebsiteCommonApi._OFFSET_MASK: str(real_offset)}
-        url = self._multiple_replace(dictionary, self.base_url)
-        page_source = None
+        dictionary = {AbsWebsiteCommonApi._QUERY_MASK: self._escape_query(query),
+                      AbsWebsiteCommonApi._OFFSET_MASK: str(real_offset)}
+        with self.request_tracer.trace(AbsRequestTracer.URL_BUILD_STAGE):
+            url = self._multiple_replace(dictionary, self.base_url)
+        page = self.transport.fetch(url, lambda: self._download_page_source(url), self._extract_page)
+        if page is None:
+            print("ERROR - Internet connection failure")
+            os.kill(os.getpid(), signal.SIGUSR1)
+            return page
+        self.inc_download()
+        return page
+
+    def _download_page_source(self, url):
+        domain = urlsplit(url).netloc
         for i in range(0, AbsWebsiteCommonApi._DOWNLOAD_TRY_NUMBER):
-            time.sleep(AbsWebsiteCommonApi._CRAWL_DELAY)
-            web_page = None
+            with self.request_tracer.trace(AbsRequestTracer.RATE_LIMIT_STAGE):
+                self.rate_limiter.acquire(domain)
             try:
-                web_page = webdriver.PhantomJS()
-                web_page.get(url)
-                wait = WebDriverWait(web_page, AbsWebsiteCommonApi._PAGE_LOAD_TIMEOUT)
-                wait.until(self.test_page_loaded)
+                # A session that raises is discarded by the pool and replaced on the next attempt.
+                with self.browser_pool.checkout() as web_page:
+                    with self.request_tracer.trace(AbsRequestTracer.FETCH_STAGE):
+                        web_page.get(url)
+                        wait = WebDriverWait(web_page, AbsWebsiteCommonApi._PAGE_LOAD_TIMEOUT)
+                        return wait.until(self.test_page_loaded)
             except Exception as exception:
                 print(str(exception))
-                if web_page is not None:
-                    web_page.close()
-                page_source = None
-                continue
-            page_source = web_page.execute_script(AbsWebsiteCommonApi._JAVASCRIPT_GET_PAGE_SOURCE_CODE)
-            web_page.close()
-            self.inc_download()
-            break
-        if page_source is None:
-            print("ERROR - Internet connection failure")
-            os.kill(os.getpid(), signal.SIGUSR1)
-        return page_source
+        return None, None
 
     def _multiple_replace(self, dictionary, string):
         dictionary = dict((re.escape(k), v) for k, v in dictionary.items())
         pattern = re.compile("|".join(dictionary.keys()))
         return pattern.sub(lambda m: dictionary[re.escape(m.group(0))], string)
 
-    def _calculate_number_additional_downloads(self, number_matches, number_downloaded_results, limit):
-        if (number_matches <= self.max_results_per_page or
-                number_downloaded_results == number_matches or
-                number_downloaded_results >= limit):
-            return 0
-        elif number_matches > limit:
-            return math.ceil((limit - number_downloaded_results) / self.max_results_per_page)
-        else:
-            return math.ceil((number_matches - number_downloaded_results) / self.max_results_per_page)
-
-    def _save_result(self, file_path, search_result):
-        if search_result.number_results < len(search_result.results):
-            print("ERROR - Search result corrupted - " + file_path)
+    def _save_page(self, query, number_matches, page_number, data_list):
+        if number_matches < len(data_list):
+            print("ERROR - Search result corrupted - " + query)
             os.kill(os.getpid(), signal.SIGUSR1)
             return
-        with open(file_path, "wb") as archive:
-            pickle.dump(search_result, archive)
-
-    def _filter_result_content(self, search_result, is_to_have_id, is_to_have_content):
-        if is_to_have_content and not is_to_have_id:
-            data_list = [self.factory.create_data(None, x.content) for x in search_result.results]
-        elif is_to_have_id and not is_to_have_content:
-            data_list = [self.factory.create_data(x.identifier, None) for x in search_result.results]
-        else:
-            return search_result
-        return self.factory.create_search_result(search_result.number_results, data_list)
+        with self.request_tracer.trace(AbsRequestTracer.CACHE_WRITE_STAGE):
+            self.result_store.save_page(query, number_matches, page_number, data_list)
@@ -0,0 +1,37 @@
+""""
+Module with an abstract class for a pool of long-lived worker threads.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+
+class AbsWorkerPool(metaclass=ABCMeta):
+    """"
+    Class that executes callbacks over the items of a collection using a bounded
+    number of worker threads that are reused across calls.
+    """
+
+    @property
+    @abstractmethod
+    def size(self):
+        """
+        The number of worker threads.
+        """
+        pass
+
+    @abstractmethod
+    def execute(self, collection, callback, is_to_return_results=False):
+        """
+        Calls the callback once for each item of the collection, blocking until all
+        calls are finished. An exception raised by a callback is raised again in the
+        caller. If is_to_return_results is true, returns a list with the values
+        returned by the callback in the order of the collection.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """
+        Stops the worker threads.
+        """
+        pass
@@ -1,5 +1,6 @@
 from abs_executor_factory import AbsExecutorFactory
 from acm_common_api import ACMCommonApi
+from config import Config
 from logger import Logger
 from mhr import Mhr
 
@@ -9,7 +10,10 @@ class ACMExecutorFactory(AbsExecutorFactory):
     _EXPERIMENT_DETAILS_FILE_PATH = "/home/fabio/GitProjects/EstimationMethods/Logs/ACM/Log.txt"
 
     def create_estimator(self):
-        return Mhr(ACMCommonApi())
+        common_api = ACMCommonApi()
+        if Config.IS_TO_CACHE_REQUESTS:
+            common_api = common_api.factory.create_caching_common_api(common_api)
+        return Mhr(common_api)
 
     def create_logger(self):
         return Logger(ACMExecutorFactory._EXPERIMENT_DETAILS_FILE_PATH,
@@ -0,0 +1,44 @@
+import os
+
+from abs_page_extractor import AbsPageExtractor
+
+
+class ACMPageExtractor(AbsPageExtractor):
+    _WEB_DOMAIN = "http://dl.acm.org/"
+    _NO_RESULTS_PATH = "//font[@size='+1']"
+    _NUMBER_MATCHES_PATH = "//b"
+    _TITLE_PATH = "//a[" + AbsPageExtractor._create_class_condition("medium-text") + "]"
+    _ABSTRACT_PATH = ".//div[" + AbsPageExtractor._create_class_condition("abstract2") + "]"
+    _TITLE_ID_ATTRIBUTE = "href"
+    # The abstract of a result is inside the great-grandparent of its title.
+    _TITLE_TO_RESULT_DEPTH = 3
+
+    def _extract_number_matches(self, tree):
+        if self._find_first(tree, ACMPageExtractor._NO_RESULTS_PATH) is not None:
+            return 0
+        html_element = self._find_first(tree, ACMPageExtractor._NUMBER_MATCHES_PATH)
+        if html_element is None:
+            return -1
+        try:
+            return int(str(html_element.text_content().replace(",", "")))
+        except ValueError:
+            return -1
+
+    def _extract_record_list(self, tree):
+        record_list = []
+        for title_element in tree.xpath(ACMPageExtractor._TITLE_PATH):
+            result_element = title_element
+            for i in range(0, ACMPageExtractor._TITLE_TO_RESULT_DEPTH):
+                result_element = result_element.getparent()
+            abstract_element = self._find_first(result_element, ACMPageExtractor._ABSTRACT_PATH)
+            record_list.append(self._create_record(title_element.get(ACMPageExtractor._TITLE_ID_ATTRIBUTE),
+                                                   title_element.text_content(), abstract_element))
+        return record_list
+
+    def _create_record(self, href, title, abstract_element):
+        identifier = ACMPageExtractor._WEB_DOMAIN + href[0:href.find("&")]
+        if abstract_element is not None:
+            content = str(title) + os.linesep + str(abstract_element.text_content())
+        else:
+            content = str(title)
+        return identifier, content
@@ -0,0 +1,21 @@
+import asyncio
+
+from broder_etal import BroderEtAl
+from estimation_math import EstimationMath
+
+
+class AsyncBroderEtAl(BroderEtAl):
+
+    def __init__(self, common_api):
+        super().__init__(common_api)
+
+    def _calculate_average_query_weight(self, query_sample, incidence_matrix):
+
+        async def download_iteration(query):
+            return (await self.common_api.download(query)).results
+
+        result_list = asyncio.run(self.common_api.execute_concurrently(query_sample, download_iteration, True))
+        weight_list = self.common_api.execute_in_parallel(
+            result_list, lambda results: self._calculate_query_weight(results, incidence_matrix), True)
+        average_weight = EstimationMath.mean(weight_list)
+        return average_weight
@@ -0,0 +1,20 @@
+import asyncio
+
+from mhr import Mhr
+
+
+class AsyncMhr(Mhr):
+
+    def __init__(self, common_api):
+        super().__init__(common_api)
+
+    def _collect_data(self):
+        return asyncio.run(self.common_api.execute_concurrently(range(0, Mhr._NUMBER_QUERIES),
+                                                                self._collect_data_for_estimation_async, True))
+
+    # noinspection PyUnusedLocal
+    async def _collect_data_for_estimation_async(self, number):
+        query = self._take_query()
+        search_result = await self.common_api.download_if_in_range(query, Mhr._MIN_NUMBER_MATCHES,
+                                                                   Mhr._MAX_NUMBER_MATCHES, True, False)
+        return self._count_documents(search_result)
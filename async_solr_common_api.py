@@ -0,0 +1,144 @@
+import asyncio
+import itertools
+from urllib.parse import urlsplit
+
+from abs_async_common_api import AbsAsyncCommonApi
+from abs_request_tracer import AbsRequestTracer
+from config import Config
+from solr_common_api import SolrCommonApi
+
+
+class AsyncSolrCommonApi(SolrCommonApi, AbsAsyncCommonApi):
+    _CONCURRENCY_LIMIT = 200
+    _DEFAULT_PORT = 80
+    _HTTP_REQUEST = ("GET ::PATH:: HTTP/1.1\r\nHost: ::HOST::\r\nAccept-Encoding: identity\r\n"
+                     + "Connection: close\r\n\r\n")
+    _PATH_MASK = "::PATH::"
+    _HOST_MASK = "::HOST::"
+    _HEADER_END = b"\r\n\r\n"
+    _LINE_END = b"\r\n"
+    _HEADER_SEPARATOR = ":"
+    _HEADER_ENCODING = "iso-8859-1"
+    _CONTENT_LENGTH_HEADER = "content-length"
+    _TRANSFER_ENCODING_HEADER = "transfer-encoding"
+    _CHUNKED_TRANSFER_ENCODING = "chunked"
+    _STATUS_OK = 200
+
+    @property
+    def concurrency_limit(self):
+        return AsyncSolrCommonApi._CONCURRENCY_LIMIT
+
+    def __init__(self, select_url=SolrCommonApi._SELECT_URL, query_pool_file_path=SolrCommonApi._QUERY_POOL_FILE_PATH,
+                 degree_cache_file_path=SolrCommonApi._DEGREE_CACHE_FILE_PATH):
+        super().__init__(select_url, query_pool_file_path, degree_cache_file_path)
+
+    async def download_entire_data_set(self):
+        return await self._download_async("*", True, True, 0, 1000000, "*")
+
+    async def download(self, query, is_to_download_id=True, is_to_download_content=True,
+                       offset=0, limit=Config.SEARCH_ENGINE_LIMIT):
+        return await self._download_async(query, is_to_download_id, is_to_download_content, offset, limit,
+                                          SolrCommonApi._FIELD_TO_SEARCH)
+
+    async def retrieve_number_matches(self, query):
+        search_result = await self.download(query, True, False, 0, 1)
+        return search_result.number_results
+
+    async def download_if_in_range(self, query, min_number_matches, max_number_matches, is_to_download_id=True,
+                                   is_to_download_content=True):
+        search_result = await self.download(query, is_to_download_id, is_to_download_content, 0,
+                                            Config.STREAM_PAGE_SIZE)
+        if not min_number_matches <= search_result.number_results <= max_number_matches:
+            return self.factory.create_search_result(search_result.number_results, [])
+        number_downloaded_results = len(search_result.results)
+        if search_result.number_results > number_downloaded_results:
+            remaining_result = await self.download(query, is_to_download_id, is_to_download_content,
+                                                   number_downloaded_results,
+                                                   Config.SEARCH_ENGINE_LIMIT - number_downloaded_results)
+            data_list = list(itertools.chain(search_result.results, remaining_result.results))
+            search_result = self.factory.create_search_result(search_result.number_results, data_list)
+        return search_result
+
+    async def execute_concurrently(self, collection, callback, is_to_return_results=False):
+        item_iterator = enumerate(collection)
+        result_dict = {}
+
+        async def work():
+            nonlocal item_iterator, result_dict
+            for index, item in item_iterator:
+                result_dict[index] = await callback(item)
+
+        task_list = [asyncio.ensure_future(work()) for i in range(0, self.concurrency_limit)]
+        try:
+            await asyncio.gather(*task_list)
+        finally:
+            for task in task_list:
+                task.cancel()
+        if is_to_return_results:
+            return [result_dict[i] for i in range(0, len(result_dict))]
+
+    async def _download_async(self, query, is_to_download_id, is_to_download_content, offset, limit,
+                              field_to_search):
+        with self.request_tracer.trace(AbsRequestTracer.URL_BUILD_STAGE):
+            url = self._build_url(query, is_to_download_id, is_to_download_content, offset, limit, field_to_search)
+        url = str(url)
+
+        async def download():
+            # The fetch time includes the time spent waiting for the other coroutines of the event loop.
+            with self.request_tracer.trace(AbsRequestTracer.FETCH_STAGE):
+                body = await self._fetch(url)
+            return body, self._create_search_result(body)
+
+        search_result = await self.transport.fetch_async(self._create_transport_key(url), download,
+                                                         self._create_search_result)
+        self.inc_download()
+        return search_result
+
+    async def _fetch(self, url):
+        split_url = urlsplit(url)
+        path = split_url.path
+        if split_url.query:
+            path += "?" + split_url.query
+        reader, writer = await asyncio.open_connection(split_url.hostname,
+                                                       split_url.port or AsyncSolrCommonApi._DEFAULT_PORT)
+        try:
+            request = AsyncSolrCommonApi._HTTP_REQUEST.replace(AsyncSolrCommonApi._PATH_MASK, path)
+            request = request.replace(AsyncSolrCommonApi._HOST_MASK, split_url.netloc)
+            writer.write(request.encode(AsyncSolrCommonApi._HEADER_ENCODING))
+            await writer.drain()
+            header_block = await reader.readuntil(AsyncSolrCommonApi._HEADER_END)
+            status, header_dict = self._parse_header_block(header_block)
+            if header_dict.get(AsyncSolrCommonApi._TRANSFER_ENCODING_HEADER, "").lower() == \
+                    AsyncSolrCommonApi._CHUNKED_TRANSFER_ENCODING:
+                body = await self._read_chunked_body(reader)
+            elif AsyncSolrCommonApi._CONTENT_LENGTH_HEADER in header_dict:
+                body = await reader.readexactly(int(header_dict[AsyncSolrCommonApi._CONTENT_LENGTH_HEADER]))
+            else:
+                body = await reader.read()
+        finally:
+            writer.close()
+        if status != AsyncSolrCommonApi._STATUS_OK:
+            raise IOError("HTTP Error " + str(status) + ": " + url)
+        return body
+
+    def _parse_header_block(self, header_block):
+        line_list = header_block.decode(AsyncSolrCommonApi._HEADER_ENCODING).split("\r\n")
+        status = int(line_list[0].split()[1])
+        header_dict = {}
+        for line in line_list[1:]:
+            if AsyncSolrCommonApi._HEADER_SEPARATOR in line:
+                key, value = line.split(AsyncSolrCommonApi._HEADER_SEPARATOR, 1)
+                header_dict[key.strip().lower()] = value.strip()
+        return status, header_dict
+
+    async def _read_chunked_body(self, reader):
+        chunk_list = []
+        while True:
+            size_line = await reader.readuntil(AsyncSolrCommonApi._LINE_END)
+            chunk_size = int(size_line.split(b";")[0].strip(), 16)
+            if chunk_size == 0:
+                await reader.readuntil(AsyncSolrCommonApi._LINE_END)
+                break
+            chunk_list.append(await reader.readexactly(chunk_size))
+            await reader.readexactly(len(AsyncSolrCommonApi._LINE_END))
+        return b"".join(chunk_list)
@@ -0,0 +1,78 @@
+import asyncio
+import random
+
+from sum_est import SumEst
+
+
+class AsyncSumEst(SumEst):
+    # The coroutines run in an order that depends on the network, so they do not draw from the global generator.
+    _SEED_BITS = 64
+
+    def __init__(self, common_api):
+        super().__init__(common_api)
+
+    def _estimate_pool_size(self, query_pool):
+        query_pool_size = len(query_pool)
+        query_list = [query_pool[random.randrange(0, query_pool_size)] for i in range(0, SumEst._POOL_SAMPLE_SIZE)]
+
+        async def iteration(query):
+            document_list = (await self.common_api.download(query)).results
+            return self._verify_any_match(query, document_list)
+
+        match_list = asyncio.run(self.common_api.execute_concurrently(query_list, iteration, True))
+        count = sum(1 for x in match_list if x)
+        return len(query_pool) * count / SumEst._POOL_SAMPLE_SIZE
+
+    def _calculate_partial_estimations(self, incidence_matrix, pool_size):
+        progress = 0
+        seed_list = [random.getrandbits(AsyncSumEst._SEED_BITS) for i in range(0, SumEst._ITERATION_NUMBER)]
+
+        async def iteration(seed):
+            nonlocal incidence_matrix, pool_size, progress
+            generator = random.Random(seed)
+            query_document_pair = await self._select_query_document_pair_async(
+                incidence_matrix.query_matcher.query_pool, generator)
+            document = query_document_pair[SumEst._PAIR_DOCUMENT_INDEX]
+            query = query_document_pair[SumEst._PAIR_QUERY_INDEX]
+            document_inverse_degree = await self._calculate_document_inverse_degree_async(document,
+                                                                                          incidence_matrix,
+                                                                                          generator)
+            degree_query = await self._calculate_degree_query_async(query)
+            progress += 1
+            self.common_api.report_progress(progress, SumEst._ITERATION_NUMBER)
+            return pool_size * degree_query * document_inverse_degree
+
+        return asyncio.run(self.common_api.execute_concurrently(seed_list, iteration, True))
+
+    async def _select_query_document_pair_async(self, query_pool, generator):
+        list_size = len(query_pool)
+        while True:
+            random_index = generator.randrange(list_size)
+            random_query = query_pool[random_index]
+            try:
+                document_list = (await self.common_api.download(random_query)).results
+            except Exception:
+                continue
+            random_document = self._select_matching_document(random_query, document_list, generator)
+            if random_document is not None:
+                return [random_query, random_document]
+
+    async def _calculate_degree_query_async(self, query):
+        document_list = (await self.common_api.download(query)).results
+        return self._count_matching_documents(query, document_list)
+
+    async def _calculate_document_inverse_degree_async(self, document, incidence_matrix, generator):
+        # Matching the document against the query pool and reading the degree cache would block the event loop.
+        matching_query_list = await asyncio.get_running_loop().run_in_executor(None, self._get_matching_query_list,
+                                                                               document, incidence_matrix)
+        i = 1
+        while True:
+            random_index = generator.randrange(0, len(matching_query_list))
+            query = matching_query_list[random_index]
+            try:
+                document_list = (await self.common_api.download(query)).results
+            except Exception:
+                continue
+            if self._contains_document(document, document_list):
+                return i / len(matching_query_list)
+            i += 1
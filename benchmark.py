@@ -0,0 +1,149 @@
+import argparse
+import contextlib
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from multiprocessing import get_context
+
+from abs_benchmark import AbsBenchmark
+from synthetic_corpus import SyntheticCorpus
+from mock_solr_server import MockSolrServer
+from solr_common_api import SolrCommonApi
+from async_solr_common_api import AsyncSolrCommonApi
+from mhr import Mhr
+from async_mhr import AsyncMhr
+from broder_etal import BroderEtAl
+from async_broder_etal import AsyncBroderEtAl
+from sum_est import SumEst
+from async_sum_est import AsyncSumEst
+from random_walk import RandomWalk
+
+
+class Benchmark(AbsBenchmark):
+    NUMBER_DOCUMENTS = 20000
+    VOCABULARY_SIZE = 5000
+    DOCUMENT_LENGTH = 100
+    ZIPF_EXPONENT = 1.0
+    LATENCY = 0.0
+    SEED = 0
+    LIVE_MODE = "live"
+    RECORD_MODE = "record"
+    REPLAY_MODE = "replay"
+    MODE_LIST = [LIVE_MODE, RECORD_MODE, REPLAY_MODE]
+    _ESTIMATOR_DICT = {"Mhr": (Mhr, SolrCommonApi),
+                       "AsyncMhr": (AsyncMhr, AsyncSolrCommonApi),
+                       "BroderEtAl": (BroderEtAl, SolrCommonApi),
+                       "AsyncBroderEtAl": (AsyncBroderEtAl, AsyncSolrCommonApi),
+                       "SumEst": (SumEst, SolrCommonApi),
+                       "AsyncSumEst": (AsyncSumEst, AsyncSolrCommonApi),
+                       "RandomWalk": (RandomWalk, SolrCommonApi)}
+    _QUERY_POOL_FILE_NAME = "query_pool.txt"
+    # Each estimator runs in a fresh process, so the peak resident set size is its own.
+    _PROCESS_START_METHOD = "spawn"
+    _KILOBYTE = 1024
+    # Replayed responses are keyed by their request parameters, so no server answers at this URL.
+    _REPLAY_SELECT_URL = "http://localhost/solr/replay/select?"
+
+    def __init__(self, estimator_name_list=None, number_documents=NUMBER_DOCUMENTS, vocabulary_size=VOCABULARY_SIZE,
+                 document_length=DOCUMENT_LENGTH, zipf_exponent=ZIPF_EXPONENT, latency=LATENCY, seed=SEED,
+                 mode=LIVE_MODE, archive_file_path=None):
+        if estimator_name_list is None:
+            estimator_name_list = list(Benchmark._ESTIMATOR_DICT.keys())
+        self.__estimator_name_list = estimator_name_list
+        self.__parameter_dict = {"number_documents": number_documents, "vocabulary_size": vocabulary_size,
+                                 "document_length": document_length, "zipf_exponent": zipf_exponent,
+                                 "latency": latency, "seed": seed, "mode": mode}
+        self.__archive_file_path = archive_file_path
+
+    def run(self):
+        start = time.perf_counter()
+        corpus = SyntheticCorpus(self.__parameter_dict["number_documents"], self.__parameter_dict["vocabulary_size"],
+                                 self.__parameter_dict["document_length"], self.__parameter_dict["zipf_exponent"],
+                                 self.__parameter_dict["seed"])
+        corpus_generation_time = time.perf_counter() - start
+        is_to_replay = self.__parameter_dict["mode"] == Benchmark.REPLAY_MODE
+        server = MockSolrServer(corpus, self.__parameter_dict["latency"])
+        if not is_to_replay:
+            server.start()
+        try:
+            with tempfile.TemporaryDirectory() as folder_path:
+                query_pool_file_path = os.path.join(folder_path, Benchmark._QUERY_POOL_FILE_NAME)
+                corpus.write_query_pool(query_pool_file_path)
+                result_dict = {}
+                for estimator_name in self.__estimator_name_list:
+                    if is_to_replay:
+                        select_url = Benchmark._REPLAY_SELECT_URL
+                    else:
+                        server.reset_request_count()
+                        select_url = server.select_url
+                    result = self._run_estimator_in_process(estimator_name, select_url, query_pool_file_path)
+                    number_downloads = result.pop("downloads")
+                    number_requests = number_downloads if is_to_replay else server.request_count
+                    result["requests"] = number_requests
+                    result["requests_per_second"] = number_requests / result["wall_time"]
+                    result["error"] = abs(corpus.size - result["estimation"]) / corpus.size
+                    result_dict[estimator_name] = result
+        finally:
+            if not is_to_replay:
+                server.stop()
+        return {"parameters": self.__parameter_dict, "corpus_generation_time": corpus_generation_time,
+                "estimators": result_dict}
+
+    def _run_estimator_in_process(self, estimator_name, select_url, query_pool_file_path):
+        with get_context(Benchmark._PROCESS_START_METHOD).Pool(1) as pool:
+            return pool.apply(Benchmark._run_estimator,
+                              (estimator_name, select_url, query_pool_file_path, self.__parameter_dict["seed"],
+                               self.__parameter_dict["mode"], self.__archive_file_path,
+                               self.__parameter_dict["latency"]))
+
+    @staticmethod
+    def _run_estimator(estimator_name, select_url, query_pool_file_path, seed, mode, archive_file_path, latency):
+        estimator_class, common_api_class = Benchmark._ESTIMATOR_DICT[estimator_name]
+        random.seed(seed)
+        common_api = common_api_class(select_url, query_pool_file_path, None)
+        if mode == Benchmark.RECORD_MODE:
+            archive = common_api.factory.create_response_archive(archive_file_path)
+            common_api.transport = common_api.factory.create_recording_transport(archive)
+        elif mode == Benchmark.REPLAY_MODE:
+            archive = common_api.factory.create_response_archive(archive_file_path)
+            common_api.transport = common_api.factory.create_replay_transport(archive, latency)
+        with open(os.devnull, "w") as null_file, contextlib.redirect_stdout(null_file):
+            start = time.perf_counter()
+            estimator = estimator_class(common_api)
+            estimation = estimator.estimate()
+            wall_time = time.perf_counter() - start
+        return {"estimation": estimation, "wall_time": wall_time,
+                "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * Benchmark._KILOBYTE,
+                "downloads": estimator.download_count, "stages": estimator.trace_statistics}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs the estimators against a mock Solr server.")
+    parser.add_argument("--estimators", nargs="+", default=None, choices=list(Benchmark._ESTIMATOR_DICT.keys()))
+    parser.add_argument("--documents", type=int, default=Benchmark.NUMBER_DOCUMENTS)
+    parser.add_argument("--vocabulary", type=int, default=Benchmark.VOCABULARY_SIZE)
+    parser.add_argument("--document-length", type=int, default=Benchmark.DOCUMENT_LENGTH)
+    parser.add_argument("--zipf-exponent", type=float, default=Benchmark.ZIPF_EXPONENT)
+    parser.add_argument("--latency", type=float, default=Benchmark.LATENCY, help="seconds added to every request")
+    parser.add_argument("--seed", type=int, default=Benchmark.SEED)
+    parser.add_argument("--mode", default=Benchmark.LIVE_MODE, choices=Benchmark.MODE_LIST,
+                        help="record the responses into the archive, or replay them from it without a server")
+    parser.add_argument("--archive", default=None, help="file of the recorded responses")
+    parser.add_argument("--output", default=None, help="file to write the JSON report to, instead of stdout")
+    arguments = parser.parse_args()
+    if arguments.mode != Benchmark.LIVE_MODE and arguments.archive is None:
+        parser.error("--archive is required with --mode " + arguments.mode)
+    benchmark = Benchmark(arguments.estimators, arguments.documents, arguments.vocabulary,
+                          arguments.document_length, arguments.zipf_exponent, arguments.latency, arguments.seed,
+                          arguments.mode, arguments.archive)
+    report = benchmark.run()
+    if arguments.output is None:
+        json.dump(report, sys.stdout, indent=4)
+        sys.stdout.write(os.linesep)
+    else:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
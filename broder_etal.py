@@ -1,7 +1,8 @@
-from threading import Lock
 import random
 
 from abs_estimator import AbsEstimator
+from abs_request_tracer import AbsRequestTracer
+from estimation_math import EstimationMath
 
 
 class BroderEtAl(AbsEstimator):
@@ -31,61 +32,50 @@ class BroderEtAl(AbsEstimator):
 
     def estimate(self):
         super().estimate()
-        entire_data_set = self.common_api.download_entire_data_set().results
-        random_document_sample = random.sample(entire_data_set, BroderEtAl._DOCUMENT_RANDOM_SAMPLE_SIZE)
+        random_document_sample = self._download_document_sample()
         self.common_api.report_progress(1, 5)
         query_pool = self.common_api.read_query_pool()
         self.common_api.report_progress(2, 5)
         query_sample = random.sample(query_pool, BroderEtAl._QUERY_RANDOM_SAMPLE_SIZE)
+        query_matcher = self.common_api.factory.create_query_matcher(query_pool)
+        incidence_matrix = self.common_api.factory.create_incidence_matrix(self.common_api.degree_cache,
+                                                                           query_matcher)
         self.common_api.report_progress(3, 5)
-        average_weight = self._calculate_average_query_weight(query_sample, query_pool)
+        average_weight = self._calculate_average_query_weight(query_sample, incidence_matrix)
         self.common_api.report_progress(4, 5)
         number_results_entire_pool = average_weight * len(query_pool)
-        number_visible_pool = self._count_matches(random_document_sample, query_pool)
+        number_visible_pool = self._count_matches(random_document_sample, incidence_matrix)
         self.common_api.report_progress(5, 5)
         probability_visible_pool = number_visible_pool / len(random_document_sample)
         estimation = number_results_entire_pool / probability_visible_pool
+        with self.common_api.request_tracer.trace(AbsRequestTracer.CACHE_WRITE_STAGE):
+            self.common_api.degree_cache.save()
         return estimation
 
+    def _download_document_sample(self):
+        return self.common_api.sample_documents(BroderEtAl._DOCUMENT_RANDOM_SAMPLE_SIZE)
+
     def _verify_match(self, query, document):
         content = document.content.lower()
         if content.find(query.lower()) != -1:
             return True
         return False
 
-    def _calculate_average_query_weight(self, query_sample, query_pool):
-        weight_sum = 0
-        lock = Lock()
+    def _calculate_average_query_weight(self, query_sample, incidence_matrix):
 
         def calc_iteration(query):
-            nonlocal weight_sum, query_pool, lock
+            nonlocal incidence_matrix
             results = self.common_api.download(query).results
-            query_weight = 0
-            for document in results:
-                count = 0
-                for query in query_pool:
-                    if self._verify_match(query, document):
-                        count += 1
-                if count > 0:
-                    query_weight += 1 / count
-            with lock:
-                weight_sum += query_weight
+            return self._calculate_query_weight(results, incidence_matrix)
 
-        self.common_api.execute_in_parallel(query_sample, calc_iteration)
-        average_weight = weight_sum / len(query_sample)
+        weight_list = self.common_api.execute_in_parallel(query_sample, calc_iteration, True)
+        average_weight = EstimationMath.mean(weight_list)
         return average_weight
 
-    def _count_matches(self, document_sample, query_pool):
-        count = 0
-        lock = Lock()
-
-        def iteration(document):
-            nonlocal count, query_pool, lock
-            for query in query_pool:
-                if self._verify_match(query, document):
-                    with lock:
-                        count += 1
-                    return
+    def _calculate_query_weight(self, results, incidence_matrix):
+        row_list = [incidence_matrix.add_document(x) for x in results]
+        return EstimationMath.inverse_degree_sum(incidence_matrix.retrieve_degrees(row_list))
 
-        self.common_api.execute_in_parallel(document_sample, iteration)
-        return count
+    def _count_matches(self, document_sample, incidence_matrix):
+        row_list = self.common_api.execute_in_parallel(document_sample, incidence_matrix.add_document, True)
+        return incidence_matrix.count_nonzero_rows(row_list)
@@ -0,0 +1,97 @@
+import atexit
+from contextlib import contextmanager
+from threading import Condition
+
+from abs_browser_pool import AbsBrowserPool
+
+
+class BrowserPool(AbsBrowserPool):
+
+    class _Session:
+        def __init__(self, browser):
+            self.browser = browser
+            self.number_uses = 0
+
+    @property
+    def size(self):
+        return self.__size
+
+    def __init__(self, size, create_browser, max_number_uses):
+        self.__size = size
+        self.__create_browser = create_browser
+        self.__max_number_uses = max_number_uses
+        self.__idle_session_list = []
+        self.__number_sessions = 0
+        self.__condition = Condition()
+        atexit.register(self.close)
+
+    @contextmanager
+    def checkout(self):
+        session = self._acquire()
+        try:
+            yield session.browser
+        except BaseException:
+            self._release(session, False)
+            raise
+        self._release(session, True)
+
+    def close(self):
+        with self.__condition:
+            session_list = self.__idle_session_list
+            self.__idle_session_list = []
+            self.__number_sessions -= len(session_list)
+            self.__condition.notify_all()
+        for session in session_list:
+            self._quit(session)
+
+    def _acquire(self):
+        while True:
+            with self.__condition:
+                while len(self.__idle_session_list) == 0 and self.__number_sessions >= self.size:
+                    self.__condition.wait()
+                if len(self.__idle_session_list) > 0:
+                    session = self.__idle_session_list.pop()
+                else:
+                    session = None
+                    self.__number_sessions += 1
+            if session is None:
+                try:
+                    return BrowserPool._Session(self.__create_browser())
+                except BaseException:
+                    self._discard(None)
+                    raise
+            if self._is_alive(session):
+                return session
+            self._discard(session)
+
+    def _release(self, session, is_healthy):
+        session.number_uses += 1
+        if not is_healthy or session.number_uses >= self.__max_number_uses:
+            self._discard(session)
+            return
+        with self.__condition:
+            self.__idle_session_list.append(session)
+            self.__condition.notify()
+
+    def _discard(self, session):
+        with self.__condition:
+            self.__number_sessions -= 1
+            self.__condition.notify()
+        if session is not None:
+            self._quit(session)
+
+    @staticmethod
+    def _is_alive(session):
+        try:
+            # noinspection PyStatementEffect
+            session.browser.current_url
+        except Exception:
+            return False
+        return True
+
+    @staticmethod
+    def _quit(session):
+        try:
+            session.browser.quit()
+        except Exception:
+            pass
@@ -0,0 +1,324 @@
+from collections.abc import Sequence
+from threading import Lock
+
+from abs_common_api import AbsCommonApi
+from abs_request_tracer import AbsRequestTracer
+from config import Config
+
+
+class CachingCommonApi(AbsCommonApi):
+    """
+    Wraps any AbsCommonApi, keeping the results of its requests in memory. Requests
+    answered from the cache do not reach the wrapped instance, so they do not
+    increment its download count. A request for only the identifiers or only the
+    contents is answered with a projection of the cached result with both, when
+    there is one. Streamed results are cached once they have been consumed to the
+    end, unless they outgrow the cache. Each cached result keeps the number of
+    downloads it took, which is counted as saved whenever it answers a request.
+    Instances created with shared_with use the caches of another instance while
+    keeping their own statistics.
+    """
+    _RESULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+    _COUNT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    _TIME_TO_LIVE = None
+    _DATA_OVERHEAD_BYTES = 128
+    _COUNT_ENTRY_BYTES = 128
+    # A number of matches is retrieved with a single download.
+    _COUNT_ENTRY_DOWNLOADS = 1
+    _HITS_KEY = "hits"
+    _MISSES_KEY = "misses"
+    _COUNT_HITS_KEY = "count_hits"
+    _COUNT_MISSES_KEY = "count_misses"
+    _RESULT_HITS_KEY = "result_hits"
+    _RESULT_MISSES_KEY = "result_misses"
+    _SAVED_DOWNLOADS_KEY = "saved_downloads"
+    # Marks the end of the results of the wrapped instance, which may include None.
+    _END_OF_RESULTS = object()
+
+    class _Request:
+        # Charged by the wrapped instance with the downloads it makes to answer one request.
+
+        @property
+        def request_tracer(self):
+            return self.__request_tracer
+
+        @property
+        def download_count(self):
+            with self.__lock:
+                return self.__download_count
+
+        def __init__(self, request_tracer, inc_download):
+            self.__request_tracer = request_tracer
+            self.__inc_download = inc_download
+            self.__download_count = 0
+            self.__lock = Lock()
+
+        def inc_download(self):
+            with self.__lock:
+                self.__download_count += 1
+            if self.__inc_download is not None:
+                self.__inc_download()
+
+    @property
+    def common_api(self):
+        return self.__common_api
+
+    @property
+    def result_cache(self):
+        return self.__result_cache
+
+    @property
+    def count_cache(self):
+        return self.__count_cache
+
+    @property
+    def download_count(self):
+        return self.__common_api.download_count
+
+    @download_count.setter
+    def download_count(self, val):
+        # Resetting the download count starts a new measurement, so the cache statistics restart with it.
+        self.__common_api.download_count = val
+        self.reset_statistics()
+
+    @property
+    def cache_statistics(self):
+        with self.__lock_statistics:
+            count_hits = self.__count_hit_count
+            count_misses = self.__count_miss_count
+            result_hits = self.__result_hit_count
+            result_misses = self.__result_miss_count
+            saved_downloads = self.__saved_download_count
+        return {CachingCommonApi._HITS_KEY: count_hits + result_hits,
+                CachingCommonApi._MISSES_KEY: count_misses + result_misses,
+                CachingCommonApi._COUNT_HITS_KEY: count_hits,
+                CachingCommonApi._COUNT_MISSES_KEY: count_misses,
+                CachingCommonApi._RESULT_HITS_KEY: result_hits,
+                CachingCommonApi._RESULT_MISSES_KEY: result_misses,
+                CachingCommonApi._SAVED_DOWNLOADS_KEY: saved_downloads}
+
+    @property
+    def request_tracer(self):
+        return self.__common_api.request_tracer
+
+    @property
+    def transport(self):
+        return self.__common_api.transport
+
+    @transport.setter
+    def transport(self, val):
+        self.__common_api.transport = val
+
+    @property
+    def factory(self):
+        return self.__common_api.factory
+
+    @factory.setter
+    def factory(self, val):
+        self.__common_api.factory = val
+
+    @property
+    def degree_cache(self):
+        return self.__common_api.degree_cache
+
+    def __init__(self, common_api, result_cache_max_bytes=_RESULT_CACHE_MAX_BYTES,
+                 count_cache_max_bytes=_COUNT_CACHE_MAX_BYTES, time_to_live=_TIME_TO_LIVE, shared_with=None):
+        self.__common_api = common_api
+        if shared_with is None:
+            self.__result_cache = common_api.factory.create_cache(result_cache_max_bytes, time_to_live)
+            self.__count_cache = common_api.factory.create_cache(count_cache_max_bytes, time_to_live)
+        else:
+            self.__result_cache = shared_with.result_cache
+            self.__count_cache = shared_with.count_cache
+        self.__count_hit_count = 0
+        self.__count_miss_count = 0
+        self.__result_hit_count = 0
+        self.__result_miss_count = 0
+        self.__saved_download_count = 0
+        self.__lock_statistics = Lock()
+
+    def reset_statistics(self):
+        with self.__lock_statistics:
+            self.__count_hit_count = 0
+            self.__count_miss_count = 0
+            self.__result_hit_count = 0
+            self.__result_miss_count = 0
+            self.__saved_download_count = 0
+
+    def read_query_pool(self):
+        return self.__common_api.read_query_pool()
+
+    def download_entire_data_set(self):
+        request = self._create_request()
+        with self.__common_api.charge_requests(request):
+            search_result = self.__common_api.download_entire_data_set()
+        if isinstance(search_result.results, Sequence):
+            return search_result
+        return self.factory.create_streaming_search_result(search_result.number_results,
+                                                           self._iterate_charged(iter(search_result.results), request))
+
+    def sample_documents(self, sample_size):
+        with self.__common_api.charge_requests(self._create_request()):
+            return self.__common_api.sample_documents(sample_size)
+
+    def retrieve_number_matches(self, query):
+        with self.request_tracer.trace(AbsRequestTracer.CACHE_READ_STAGE):
+            number_matches = self.__count_cache.get(query)
+        self._record_count_lookup(number_matches is not None)
+        if number_matches is None:
+            with self.__common_api.charge_requests(self._create_request()):
+                number_matches = self.__common_api.retrieve_number_matches(query)
+            with self.request_tracer.trace(AbsRequestTracer.CACHE_WRITE_STAGE):
+                self.__count_cache.put(query, number_matches, CachingCommonApi._COUNT_ENTRY_BYTES)
+        return number_matches
+
+    def download(self, query, is_to_download_id=True, is_to_download_content=True,
+                 offset=0, limit=Config.SEARCH_ENGINE_LIMIT):
+        key = (query, is_to_download_id, is_to_download_content, offset, limit)
+        search_result, number_downloads = self._get_cached_result(key)
+        self._record_result_lookup(search_result is not None, number_downloads)
+        if search_result is None:
+            request = self._create_request()
+            with self.__common_api.charge_requests(request):
+                search_result = self.__common_api.download(query, is_to_download_id, is_to_download_content, offset,
+                                                           limit)
+            search_result = self._cache_result(key, search_result, request)
+        return search_result
+
+    def download_if_in_range(self, query, min_number_matches, max_number_matches, is_to_download_id=True,
+                             is_to_download_content=True):
+        key = (query, is_to_download_id, is_to_download_content, 0, Config.SEARCH_ENGINE_LIMIT)
+        search_result, number_downloads = self._get_cached_result(key)
+        if search_result is None:
+            with self.request_tracer.trace(AbsRequestTracer.CACHE_READ_STAGE):
+                number_matches = self.__count_cache.get(query)
+            if number_matches is not None and not min_number_matches <= number_matches <= max_number_matches:
+                self._record_count_lookup(True)
+                return self.factory.create_search_result(number_matches, [])
+            self._record_result_lookup(False, 0)
+            request = self._create_request()
+            with self.__common_api.charge_requests(request):
+                search_result = self.__common_api.download_if_in_range(query, min_number_matches,
+                                                                       max_number_matches, is_to_download_id,
+                                                                       is_to_download_content)
+            if not min_number_matches <= search_result.number_results <= max_number_matches:
+                # Only the number of matches is known, so the empty result must not be cached as the full one.
+                with self.request_tracer.trace(AbsRequestTracer.CACHE_WRITE_STAGE):
+                    self.__count_cache.put(query, search_result.number_results, CachingCommonApi._COUNT_ENTRY_BYTES)
+                return search_result
+            return self._cache_result(key, search_result, request)
+        if not min_number_matches <= search_result.number_results <= max_number_matches:
+            # Without the cache, only the number of matches would have been downloaded.
+            self._record_result_lookup(True, CachingCommonApi._COUNT_ENTRY_DOWNLOADS)
+            return self.factory.create_search_result(search_result.number_results, [])
+        self._record_result_lookup(True, number_downloads)
+        return search_result
+
+    def stream(self, query, is_to_download_id=True, is_to_download_content=True, page_size=Config.STREAM_PAGE_SIZE):
+        key = (query, is_to_download_id, is_to_download_content, 0, Config.SEARCH_ENGINE_LIMIT)
+        search_result, number_downloads = self._get_cached_result(key)
+        self._record_result_lookup(search_result is not None, number_downloads)
+        if search_result is None:
+            request = self._create_request()
+            with self.__common_api.charge_requests(request):
+                search_result = self.__common_api.stream(query, is_to_download_id, is_to_download_content, page_size)
+            return self._cache_result(key, search_result, request)
+        return self.factory.create_streaming_search_result(search_result.number_results, iter(search_result.results))
+
+    def inc_download(self):
+        self.__common_api.inc_download()
+
+    def charge_requests(self, common_api):
+        return self.__common_api.charge_requests(common_api)
+
+    def execute_in_parallel(self, collection, callback, is_to_return_results=False):
+        return self.__common_api.execute_in_parallel(collection, callback, is_to_return_results)
+
+    def report_progress(self, progress, total):
+        self.__common_api.report_progress(progress, total)
+
+    def extract_words(self, text):
+        return self.__common_api.extract_words(text)
+
+    def extract_document_words(self, document):
+        return self.__common_api.extract_document_words(document)
+
+    def _get_cached_result(self, key):
+        # Returns the cached search result, or None, with the number of downloads it took.
+        query, is_to_download_id, is_to_download_content, offset, limit = key
+        with self.request_tracer.trace(AbsRequestTracer.CACHE_READ_STAGE):
+            entry = self.__result_cache.get(key)
+            if entry is None and is_to_download_id != is_to_download_content:
+                entry = self.__result_cache.get((query, True, True, offset, limit))
+                if entry is not None:
+                    search_result, number_downloads = entry
+                    entry = (self.factory.create_projected_search_result(search_result, is_to_download_id,
+                                                                         is_to_download_content), number_downloads)
+        if entry is None:
+            return None, 0
+        return entry
+
+    def _create_request(self):
+        # The tracer is read before the request is charged, since the wrapped instance then asks the request for it.
+        return CachingCommonApi._Request(self.request_tracer, None)
+
+    def _iterate_charged(self, iterator, request):
+        # The wrapped instance may download while the results are consumed, so each one is fetched within the charge.
+        while True:
+            with self.__common_api.charge_requests(request):
+                data = next(iterator, CachingCommonApi._END_OF_RESULTS)
+            if data is CachingCommonApi._END_OF_RESULTS:
+                return
+            yield data
+
+    def _record_count_lookup(self, is_hit):
+        with self.__lock_statistics:
+            if is_hit:
+                self.__count_hit_count += 1
+                self.__saved_download_count += CachingCommonApi._COUNT_ENTRY_DOWNLOADS
+            else:
+                self.__count_miss_count += 1
+
+    def _record_result_lookup(self, is_hit, number_downloads):
+        with self.__lock_statistics:
+            if is_hit:
+                self.__result_hit_count += 1
+                self.__saved_download_count += number_downloads
+            else:
+                self.__result_miss_count += 1
+
+    def _cache_result(self, key, search_result, request):
+        if isinstance(search_result.results, Sequence):
+            self._put_result(key, search_result, sum(self._calculate_data_size(x) for x in search_result.results),
+                             request.download_count)
+            return search_result
+        return self.factory.create_streaming_search_result(search_result.number_results,
+                                                           self._iterate_into_cache(key, search_result, request))
+
+    def _iterate_into_cache(self, key, search_result, request):
+        data_list = []
+        size = 0
+        for data in self._iterate_charged(iter(search_result.results), request):
+            if data_list is not None:
+                size += self._calculate_data_size(data)
+                if size > self.__result_cache.max_size:
+                    data_list = None
+                else:
+                    data_list.append(data)
+            yield data
+        if data_list is not None:
+            self._put_result(key, self.factory.create_search_result(search_result.number_results, data_list), size,
+                             request.download_count)
+
+    def _put_result(self, key, search_result, size, number_downloads):
+        with self.request_tracer.trace(AbsRequestTracer.CACHE_WRITE_STAGE):
+            self.__result_cache.put(key, (search_result, number_downloads), size)
+            self.__count_cache.put(key[0], search_result.number_results, CachingCommonApi._COUNT_ENTRY_BYTES)
+
+    def _calculate_data_size(self, data):
+        size = CachingCommonApi._DATA_OVERHEAD_BYTES
+        if data.identifier is not None:
+            size += len(data.identifier)
+        if data.content is not None:
+            size += len(data.content)
+        return size
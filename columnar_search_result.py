@@ -0,0 +1,105 @@
+from array import array
+from collections.abc import Sequence
+
+from abs_data import AbsData
+from abs_search_result import AbsSearchResult
+
+
+class ColumnarSearchResult(AbsSearchResult):
+    """
+    Search result that keeps the identifiers and the contents of its documents in
+    two columns, each one a single UTF-8 buffer with an array of offsets, instead
+    of one object per document. The results are a sequence that creates a
+    lightweight view of a document when it is accessed.
+    """
+
+    class _TextColumn:
+        __slots__ = ("buffer", "offset_array", "none_mask")
+        _ENCODING = "utf-8"
+        _OFFSET_TYPE = "q"
+
+        def __init__(self, text_iterable):
+            buffer = bytearray()
+            self.offset_array = array(ColumnarSearchResult._TextColumn._OFFSET_TYPE, [0])
+            self.none_mask = None
+            for index, text in enumerate(text_iterable):
+                if text is None:
+                    if self.none_mask is None:
+                        self.none_mask = bytearray(index)
+                    self.none_mask.append(1)
+                else:
+                    buffer += text.encode(ColumnarSearchResult._TextColumn._ENCODING)
+                    if self.none_mask is not None:
+                        self.none_mask.append(0)
+                self.offset_array.append(len(buffer))
+            self.buffer = bytes(buffer)
+
+        def __len__(self):
+            return len(self.offset_array) - 1
+
+        def __getitem__(self, index):
+            if self.none_mask is not None and self.none_mask[index]:
+                return None
+            return str(memoryview(self.buffer)[self.offset_array[index]:self.offset_array[index + 1]],
+                       ColumnarSearchResult._TextColumn._ENCODING)
+
+    class _DataView(AbsData):
+        __slots__ = ("__result", "__index")
+
+        def __init__(self, result, index):
+            self.__result = result
+            self.__index = index
+
+        @property
+        def identifier(self):
+            return self.__result.identifier_column[self.__index]
+
+        @property
+        def content(self):
+            return self.__result.content_column[self.__index]
+
+    class _DataSequence(Sequence):
+        __slots__ = ("__result",)
+
+        def __init__(self, result):
+            self.__result = result
+
+        def __len__(self):
+            return len(self.__result.identifier_column)
+
+        def __getitem__(self, index):
+            if isinstance(index, slice):
+                return [ColumnarSearchResult._DataView(self.__result, i) for i in range(*index.indices(len(self)))]
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("Search result index out of range")
+            return ColumnarSearchResult._DataView(self.__result, index)
+
+        def __iter__(self):
+            for i in range(0, len(self)):
+                yield ColumnarSearchResult._DataView(self.__result, i)
+
+    @property
+    def number_results(self):
+        return self.__number_results
+
+    @property
+    def results(self):
+        return self.__results
+
+    @property
+    def identifier_column(self):
+        return self.__identifier_column
+
+    @property
+    def content_column(self):
+        return self.__content_column
+
+    def __init__(self, number_results, identifier_iterable, content_iterable):
+        self.__number_results = number_results
+        self.__identifier_column = ColumnarSearchResult._TextColumn(identifier_iterable)
+        self.__content_column = ColumnarSearchResult._TextColumn(content_iterable)
+        if len(self.__identifier_column) != len(self.__content_column):
+            raise ValueError("Identifier and content columns of different sizes")
+        self.__results = ColumnarSearchResult._DataSequence(self)
@@ -1,12 +1,103 @@
+from browser_pool import BrowserPool
+from caching_common_api import CachingCommonApi
+from columnar_search_result import ColumnarSearchResult
 from data import Data
+from document_degree_cache import DocumentDegreeCache
+from id_interning_table import IdInterningTable
+from incidence_matrix import IncidenceMatrix
 from abs_common_api_factory import AbsCommonApiFactory
-from search_result import SearchResult
+from latency_histogram import LatencyHistogram
+from live_transport import LiveTransport
+from lru_cache import LruCache
+from projected_search_result import ProjectedSearchResult
+from query_matcher import QueryMatcher
+from query_pool import QueryPool
+from query_pool_registry import QueryPoolRegistry
+from query_sampler import QuerySampler
+from recording_transport import RecordingTransport
+from replay_transport import ReplayTransport
+from request_tracer import RequestTracer
+from session_common_api import SessionCommonApi
+from sqlite_response_archive import SQLiteResponseArchive
+from sqlite_result_store import SQLiteResultStore
+from streaming_search_result import StreamingSearchResult
+from token_bucket_rate_limiter import TokenBucketRateLimiter
+from worker_pool import WorkerPool
 
 
 class CommonApiFactory(AbsCommonApiFactory):
 
     def create_search_result(self, number_results, results):
-        return SearchResult(number_results, results)
+        return ColumnarSearchResult(number_results, [x.identifier for x in results], [x.content for x in results])
+
+    def create_columnar_search_result(self, number_results, identifier_iterable, content_iterable):
+        return ColumnarSearchResult(number_results, identifier_iterable, content_iterable)
+
+    def create_projected_search_result(self, search_result, is_to_have_id, is_to_have_content):
+        return ProjectedSearchResult(search_result, is_to_have_id, is_to_have_content)
+
+    def create_streaming_search_result(self, number_results, results):
+        return StreamingSearchResult(number_results, results)
 
     def create_data(self, identifier, content):
         return Data(identifier, content)
+
+    def create_worker_pool(self, size):
+        return WorkerPool(size)
+
+    def create_browser_pool(self, size, create_browser, max_number_uses):
+        return BrowserPool(size, create_browser, max_number_uses)
+
+    def create_rate_limiter(self, rate, burst_size):
+        return TokenBucketRateLimiter(rate, burst_size)
+
+    def create_id_interning_table(self):
+        return IdInterningTable()
+
+    def create_query_pool(self, file_path, is_memory_mapped=False):
+        return QueryPool(file_path, is_memory_mapped, self)
+
+    def create_query_pool_registry(self):
+        return QueryPoolRegistry(self)
+
+    def create_query_sampler(self, query_pool, index_sequence):
+        return QuerySampler(query_pool, index_sequence)
+
+    def create_query_matcher(self, query_pool):
+        return QueryMatcher(query_pool)
+
+    def create_incidence_matrix(self, degree_cache, query_matcher):
+        return IncidenceMatrix(degree_cache, query_matcher)
+
+    def create_document_degree_cache(self, file_path=None):
+        return DocumentDegreeCache(file_path)
+
+    def create_result_store(self, file_path, page_size):
+        return SQLiteResultStore(file_path, page_size, self)
+
+    def create_response_archive(self, file_path):
+        return SQLiteResponseArchive(file_path)
+
+    def create_live_transport(self):
+        return LiveTransport()
+
+    def create_recording_transport(self, archive):
+        return RecordingTransport(archive)
+
+    def create_replay_transport(self, archive, latency=0.0):
+        return ReplayTransport(archive, latency)
+
+    def create_caching_common_api(self, common_api):
+        return CachingCommonApi(common_api)
+
+    def create_session_common_api(self, common_api, shared_with):
+        return SessionCommonApi(common_api, shared_with)
+
+    def create_cache(self, max_size, time_to_live=None):
+        return LruCache(max_size, time_to_live)
+
+    def create_latency_histogram(self):
+        return LatencyHistogram()
+
+    def create_request_tracer(self):
+        return RequestTracer(self)
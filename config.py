@@ -9,5 +9,9 @@ class Config:
 
     Attributes:
         SEARCH_ENGINE_LIMIT             The limit in the number of results imposed by the search engine.
+        STREAM_PAGE_SIZE                The number of results fetched at a time when streaming a search result.
+        IS_TO_CACHE_REQUESTS            Whether the executors wrap their common API in a CachingCommonApi.
     """
     SEARCH_ENGINE_LIMIT = 5000000
+    STREAM_PAGE_SIZE = 10000
+    IS_TO_CACHE_REQUESTS = False
@@ -2,6 +2,7 @@ from abs_data import AbsData
 
 
 class Data(AbsData):
+    __slots__ = ("__identifier", "__content")
 
     def __init__(self, identifier, content):
         self.__identifier = identifier
@@ -15,3 +16,11 @@ class Data(AbsData):
     def content(self):
         return self.__content
 
+    # The state is kept as the dictionary of the pickles saved before the slots were added, so they still load.
+    def __getstate__(self):
+        return {"_Data__identifier": self.__identifier, "_Data__content": self.__content}
+
+    def __setstate__(self, state):
+        self.__identifier = state["_Data__identifier"]
+        self.__content = state["_Data__content"]
+
@@ -0,0 +1,83 @@
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from threading import Lock
+
+from abs_document_degree_cache import AbsDocumentDegreeCache
+
+
+class DocumentDegreeCache(AbsDocumentDegreeCache):
+    _MAX_NUMBER_ENTRIES = 100000
+    _TEMPORARY_FILE_EXTENSION = ".tmp"
+    _ENTRY_INDICES_INDEX = 0
+    _ENTRY_DEGREE_INDEX = 1
+
+    def __init__(self, file_path=None, max_number_entries=_MAX_NUMBER_ENTRIES):
+        self.__file_path = file_path
+        self.__max_number_entries = max_number_entries
+        self.__entry_dict = OrderedDict()
+        self.__lock = Lock()
+        self._load()
+
+    def retrieve_matching_indices(self, document, query_matcher):
+        return self._retrieve_entry(document, query_matcher)[DocumentDegreeCache._ENTRY_INDICES_INDEX]
+
+    def retrieve_matching_queries(self, document, query_matcher):
+        query_pool = query_matcher.query_pool
+        return [query_pool[x] for x in self.retrieve_matching_indices(document, query_matcher)]
+
+    def retrieve_degree(self, document, query_matcher):
+        return self._retrieve_entry(document, query_matcher)[DocumentDegreeCache._ENTRY_DEGREE_INDEX]
+
+    def save(self):
+        if self.__file_path is None:
+            return
+        with self.__lock:
+            entry_list = list(self.__entry_dict.items())
+        folder_path = os.path.dirname(self.__file_path)
+        if len(folder_path) > 0:
+            os.makedirs(folder_path, exist_ok=True)
+        # Each save writes its own temporary file, so processes saving at once never share one.
+        file_descriptor, temporary_file_path = tempfile.mkstemp(DocumentDegreeCache._TEMPORARY_FILE_EXTENSION,
+                                                                os.path.basename(self.__file_path),
+                                                                folder_path if len(folder_path) > 0 else os.curdir)
+        try:
+            with os.fdopen(file_descriptor, "wb") as archive:
+                pickle.dump(entry_list, archive)
+            os.replace(temporary_file_path, self.__file_path)
+        except:
+            os.remove(temporary_file_path)
+            raise
+
+    def _retrieve_entry(self, document, query_matcher):
+        if document.identifier is None:
+            return self._create_entry(document, query_matcher)
+        key = (document.identifier, query_matcher.fingerprint)
+        with self.__lock:
+            entry = self.__entry_dict.get(key)
+            if entry is not None:
+                self.__entry_dict.move_to_end(key)
+                return entry
+        entry = self._create_entry(document, query_matcher)
+        with self.__lock:
+            self.__entry_dict[key] = entry
+            if len(self.__entry_dict) > self.__max_number_entries:
+                self.__entry_dict.popitem(last=False)
+        return entry
+
+    def _create_entry(self, document, query_matcher):
+        matching_indices = tuple(query_matcher.match_indices(document.content))
+        return matching_indices, len(matching_indices)
+
+    def _load(self):
+        if self.__file_path is None or not os.path.exists(self.__file_path):
+            return
+        try:
+            with open(self.__file_path, "rb") as archive:
+                entry_list = pickle.load(archive)
+        except:
+            print("ERROR - Degree cache corrupted - " + self.__file_path)
+            return
+        for key, entry in entry_list[-self.__max_number_entries:]:
+            self.__entry_dict[key] = entry
@@ -0,0 +1,82 @@
+""""
+Module with the arithmetic shared by the estimators.
+"""
+
+import math
+
+
+class EstimationMath:
+    """
+    Numerically stable formulas used by the estimation algorithms.
+    """
+    _MHR_OVERLAP_EXPONENT = -1.1
+    _INVALID_ESTIMATION = -1
+
+    @staticmethod
+    def pair_count(n):
+        """
+        Returns the binomial coefficient of n and 2 in closed form.
+        """
+        return n * (n - 1) // 2
+
+    @staticmethod
+    def mean(values):
+        """
+        Returns the arithmetic mean of the values, summed without loss of precision.
+        """
+        values = list(values)
+        return math.fsum(values) / len(values)
+
+    @staticmethod
+    def harmonic_mean(values):
+        """
+        Returns the harmonic mean of the values, which must not be zero.
+        """
+        values = list(values)
+        if 0 in values:
+            raise ValueError("Harmonic mean of values including zero")
+        return len(values) / EstimationMath.inverse_degree_sum(values)
+
+    @staticmethod
+    def inverse_degree_sum(degree_list):
+        """
+        Returns the sum of the inverses of the non-zero degrees.
+        """
+        return math.fsum(1 / x for x in degree_list if x != 0)
+
+    @staticmethod
+    def weighted_sum(values, weights):
+        """
+        Returns the sum of the products of the values by the weights.
+        """
+        return math.fsum(x * y for x, y in zip(values, weights))
+
+    @staticmethod
+    def random_walk_estimation(degree_list, frequency_number_nodes_dict):
+        """
+        Returns the RandomWalk estimation given the degrees of the visited nodes and,
+        for each number of visits greater than one, the number of nodes visited that
+        many times.
+        """
+        n = len(degree_list)
+        dw = EstimationMath.mean(degree_list)
+        dh = EstimationMath.harmonic_mean(degree_list)
+        frequency_list = list(frequency_number_nodes_dict.keys())
+        c = EstimationMath.weighted_sum([EstimationMath.pair_count(x) for x in frequency_list],
+                                        [frequency_number_nodes_dict[x] for x in frequency_list])
+        return (dw / dh) * EstimationMath.pair_count(n) / c
+
+    @staticmethod
+    def mhr_estimation(total_matches, total_documents_returned, number_unique_documents_returned):
+        """
+        Returns the Mhr estimation from its overflow and overlapping rates, or -1 if
+        they are not defined.
+        """
+        if total_documents_returned == 0 or number_unique_documents_returned == 0:
+            return EstimationMath._INVALID_ESTIMATION
+        overflow_rate = total_matches / total_documents_returned
+        overlapping_rate = total_documents_returned / number_unique_documents_returned
+        if overlapping_rate == 1:
+            return EstimationMath._INVALID_ESTIMATION
+        return (overflow_rate * number_unique_documents_returned
+                / (1 - overlapping_rate ** EstimationMath._MHR_OVERLAP_EXPONENT))
@@ -1,4 +1,5 @@
 from abs_executor_factory import AbsExecutorFactory
+from config import Config
 from logger import Logger
 # from ieee_abstract_common_api import IEEEAbstractCommonApi
 from acm_common_api import ACMCommonApi
@@ -13,7 +14,10 @@ from mhr import Mhr
 class ExecutorFactory(AbsExecutorFactory):
 
     def create_estimator(self):
-        return Mhr(ACMCommonApi())
+        common_api = ACMCommonApi()
+        if Config.IS_TO_CACHE_REQUESTS:
+            common_api = common_api.factory.create_caching_common_api(common_api)
+        return Mhr(common_api)
 
     def create_logger(self):
         return Logger()
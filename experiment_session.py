@@ -0,0 +1,90 @@
+import signal
+from datetime import datetime
+from threading import Thread
+
+from abs_experiment_session import AbsExperimentSession
+from abs_base_executor import AbsBaseExecutor
+from logger import Logger
+from solr_common_api import SolrCommonApi
+from mhr import Mhr
+from broder_etal import BroderEtAl
+from sum_est import SumEst
+from random_walk import RandomWalk
+
+
+class ExperimentSession(AbsExperimentSession):
+    _ESTIMATOR_INFORMATION = "Estimador"
+
+    @property
+    def common_api(self):
+        return self.__common_api
+
+    @property
+    def estimator_list(self):
+        return self.__estimator_list
+
+    @property
+    def logger(self):
+        return self.__logger
+
+    def __init__(self, common_api, estimator_class_list, logger, is_concurrent=False):
+        self.__common_api = common_api.factory.create_caching_common_api(common_api)
+        self.__estimator_list = [estimator_class(common_api.factory.create_session_common_api(common_api,
+                                                                                            self.__common_api))
+                                 for estimator_class in estimator_class_list]
+        self.__logger = logger
+        self.__is_concurrent = is_concurrent
+
+    def execute(self):
+        signal.signal(signal.SIGUSR1, AbsBaseExecutor._on_fatal_failure)
+        self.logger.write_session_header()
+        for estimator in self.estimator_list:
+            experiment_details = {ExperimentSession._ESTIMATOR_INFORMATION: type(estimator).__name__}
+            experiment_details.update(estimator.experiment_details)
+            self.logger.write_experiment_details(experiment_details)
+        if self.__is_concurrent:
+            result_list = self._execute_concurrently()
+        else:
+            result_list = [self._execute_estimator(estimator) for estimator in self.estimator_list]
+        for estimator, (estimation, duration) in zip(self.estimator_list, result_list):
+            self.logger.write_session_result(type(estimator).__name__, estimation, duration,
+                                             estimator.common_api.download_count,
+                                             estimator.common_api.request_count)
+        return result_list
+
+    def _execute_concurrently(self):
+        result_list = [None] * len(self.estimator_list)
+        exception_list = []
+
+        def execute_estimator(index):
+            try:
+                result_list[index] = self._execute_estimator(self.estimator_list[index])
+            except Exception as exception:
+                exception_list.append(exception)
+
+        thread_list = [Thread(target=execute_estimator, args=(i,)) for i in range(0, len(self.estimator_list))]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+        if len(exception_list) > 0:
+            raise exception_list[0]
+        return result_list
+
+    @staticmethod
+    def _execute_estimator(estimator):
+        start = datetime.now()
+        estimation = estimator.estimate()
+        end = datetime.now()
+        return estimation, end - start
+
+
+if __name__ == "__main__":
+    solr_common_api = SolrCommonApi()
+    session = ExperimentSession(solr_common_api, [Mhr, BroderEtAl, SumEst, RandomWalk],
+                                Logger("/home/fabio/GitProjects/EstimationMethods/Logs/Solr/session_details.txt",
+                                       "/home/fabio/GitProjects/EstimationMethods/Logs/Solr/session_results.csv",
+                                       solr_common_api.retrieve_number_matches("*"),
+                                       solr_common_api.query_pool_file_path),
+                                is_concurrent=True)
+    session.execute()
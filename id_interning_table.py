@@ -0,0 +1,25 @@
+from array import array
+from threading import Lock
+
+from abs_id_interning_table import AbsIdInterningTable
+
+
+class IdInterningTable(AbsIdInterningTable):
+    _INDEX_TYPE = "l"
+
+    @property
+    def size(self):
+        with self.__lock:
+            return len(self.__index_dict)
+
+    def __init__(self):
+        self.__index_dict = {}
+        self.__lock = Lock()
+
+    def intern(self, identifier_iterable):
+        identifier_list = list(identifier_iterable)
+        with self.__lock:
+            index_dict = self.__index_dict
+            # The default is evaluated before the insertion, so a new identifier gets the next integer.
+            return array(IdInterningTable._INDEX_TYPE, [index_dict.setdefault(x, len(index_dict))
+                                                        for x in identifier_list])
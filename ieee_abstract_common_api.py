@@ -1,43 +1,20 @@
-import os
-import signal
-
 from abs_website_common_api import AbsWebsiteCommonApi
+from ieee_page_extractor import IEEEPageExtractor
 
 
 class IEEEAbstractCommonApi(AbsWebsiteCommonApi):
     DATA_SET_SIZE = 3701608
     QUERY_POOL_FILE_PATH = "/home/fabio/SolrCores/WordLists/new_shine.txt"
     _THREAD_LIMIT = 1
-    _WEB_DOMAIN = "http://ieeexplore.ieee.org"
-    _NO_RESULTS_TAG = "li"
-    _NO_RESULTS_TAG_ATTRIBUTE = "class"
-    _NO_RESULTS_TAG_ATTRIBUTE_VALUE = "article-list-item no-results ng-scope"
-    _ITEM_TAG = "li"
-    _ITEM_TAG_ATTRIBUTE = "class"
-    _ITEM_TAG_ATTRIBUTE_VALUE = "article-list-item ng-scope"
-    _TITLE_TAG = True
-    _TITLE_TAG_ATTRIBUTE = "ng-bind-html"
-    _TITLE_TAG_ATTRIBUTE_VALUE = "::record.title"
-    _ABSTRACT_TAG = "span"
-    _ABSTRACT_TAG_ATTRIBUTE = "ng-bind-html"
-    _ABSTRACT_TAG_ATTRIBUTE_VALUE = "::record.abstract"
-    _ID_TAG = "a"
-    _ID_TAG_ATTRIBUTE = "class"
-    _ID_TAG_ATTRIBUTE_VALUE = "icon-pdf ng-scope"
-    _HREF = "href"
     _MAX_RESULTS_PER_PAGE = 100
-    _ELEMENT_WITH_NUMBER_MATCHES_TAG = "span"
-    _ELEMENT_WITH_NUMBER_MATCHES_ATTRIBUTE = "class"
-    _ELEMENT_WITH_NUMBER_MATCHES_ATTRIBUTE_VALUE = "ng-binding ng-scope"
-    _ELEMENT_WITH_NUMBER_MATCHES_WHEN_ONE_RESULT_TAG = "span"
-    _ELEMENT_WITH_NUMBER_MATCHES_WHEN_ONE_RESULT_ATTRIBUTE = "ng-if"
-    _ELEMENT_WITH_NUMBER_MATCHES_WHEN_ONE_RESULT_ATTRIBUTE_VALUE = "records.length === 1"
     _BASE_URL = ("http://ieeexplore.ieee.org/search/searchresult.jsp?"
                  + "queryText=<<query>>&rowsPerPage=100&pageNumber=<<offset>>&resultAction=ROWS_PER_PAGE")
     _DATA_FOLDER_PATH = "/media/fabio/FABIO/ieee"
+    _RESULT_STORE_FILE_PATH = "/media/fabio/FABIO/ieee.sqlite"
 
     def __init__(self):
         super().__init__()
+        self.__page_extractor = IEEEPageExtractor()
 
     @property
     def query_pool_file_path(self):
@@ -59,82 +36,13 @@ class IEEEAbstractCommonApi(AbsWebsiteCommonApi):
     def data_folder_path(self):
         return IEEEAbstractCommonApi._DATA_FOLDER_PATH
 
-    def _calculate_real_offset(self, offset):
-        return (offset + self.max_results_per_page) / self.max_results_per_page
-
-    def _extract_number_matches_from_soup(self, soup):
-        dictionary = {IEEEAbstractCommonApi._NO_RESULTS_TAG_ATTRIBUTE:
-                      IEEEAbstractCommonApi._NO_RESULTS_TAG_ATTRIBUTE_VALUE}
-        no_results_element = soup.find(IEEEAbstractCommonApi._NO_RESULTS_TAG, dictionary)
-        if no_results_element is not None:
-            return 0
-        dictionary = {IEEEAbstractCommonApi._ELEMENT_WITH_NUMBER_MATCHES_WHEN_ONE_RESULT_ATTRIBUTE:
-                      IEEEAbstractCommonApi._ELEMENT_WITH_NUMBER_MATCHES_WHEN_ONE_RESULT_ATTRIBUTE_VALUE}
-        one_result_element = soup.find(IEEEAbstractCommonApi._ELEMENT_WITH_NUMBER_MATCHES_WHEN_ONE_RESULT_TAG,
-                                       dictionary)
-        if one_result_element is not None:
-            return 1
-        dictionary = {IEEEAbstractCommonApi._ELEMENT_WITH_NUMBER_MATCHES_ATTRIBUTE:
-                      IEEEAbstractCommonApi._ELEMENT_WITH_NUMBER_MATCHES_ATTRIBUTE_VALUE}
-        html_element = soup.find(IEEEAbstractCommonApi._ELEMENT_WITH_NUMBER_MATCHES_TAG, dictionary)
-        if html_element is not None:
-            try:
-                contents = html_element.next.strip().split()
-                number_matches = int(str(contents[4].replace(",", "")))
-            except:
-                return -1
-        else:
-            return -1
-        return number_matches
-
-    def _extract_data_list_from_soup(self, soup):
-        dictionary = {IEEEAbstractCommonApi._ITEM_TAG_ATTRIBUTE: IEEEAbstractCommonApi._ITEM_TAG_ATTRIBUTE_VALUE}
-        item_tag_list = soup.find_all(IEEEAbstractCommonApi._ITEM_TAG, dictionary)
-
-        def extract_data(item):
-            dictio = {IEEEAbstractCommonApi._ID_TAG_ATTRIBUTE: IEEEAbstractCommonApi._ID_TAG_ATTRIBUTE_VALUE}
-            identifier_tag = item.find(IEEEAbstractCommonApi._ID_TAG, dictio)
-            dictio = {IEEEAbstractCommonApi._TITLE_TAG_ATTRIBUTE: IEEEAbstractCommonApi._TITLE_TAG_ATTRIBUTE_VALUE}
-            title_tag = item.find(IEEEAbstractCommonApi._TITLE_TAG, dictio)
-            dictio = {IEEEAbstractCommonApi._ABSTRACT_TAG_ATTRIBUTE:
-                      IEEEAbstractCommonApi._ABSTRACT_TAG_ATTRIBUTE_VALUE}
-            abstract_tag = item.find(IEEEAbstractCommonApi._ABSTRACT_TAG, dictio)
-            if identifier_tag is not None and title_tag is not None:
-                if abstract_tag is not None:
-                    data = self._create_data(identifier_tag[IEEEAbstractCommonApi._HREF], title_tag.text,
-                                             abstract_tag.text)
-                else:
-                    data = self._create_data(identifier_tag[IEEEAbstractCommonApi._HREF], title_tag.text)
-                return data
-            elif identifier_tag is None and title_tag is not None:
-                ampersand_index = title_tag[IEEEAbstractCommonApi._HREF].find("&")
-                if abstract_tag is not None:
-                    data = self._create_data(title_tag[IEEEAbstractCommonApi._HREF][0:ampersand_index],
-                                             title_tag.text, abstract_tag.text)
-                else:
-                    data = self._create_data(title_tag[IEEEAbstractCommonApi._HREF][0:ampersand_index],
-                                             title_tag.text)
-                return data
-            else:
-                print(str(item))
-                print("ERROR - Data extraction failure")
-                os.kill(os.getpid(), signal.SIGUSR1)
-                return
-
-        data_list = [extract_data(x) for x in item_tag_list]
-        return data_list
-
-    def _create_data(self, href, title, abstract=None):
-        identifier = self._format_data_id(str(href))
-        content = self._format_data_content(title, abstract)
-        data = self.factory.create_data(identifier, content)
-        return data
+    @property
+    def result_store_file_path(self):
+        return IEEEAbstractCommonApi._RESULT_STORE_FILE_PATH
 
-    def _format_data_id(self, href):
-        return IEEEAbstractCommonApi._WEB_DOMAIN + href
+    @property
+    def page_extractor(self):
+        return self.__page_extractor
 
-    def _format_data_content(self, title, abstract):
-        if abstract is not None:
-            return str(title) + os.linesep + os.linesep + str(abstract)
-        else:
-            return str(title)
+    def _calculate_real_offset(self, offset):
+        return (offset + self.max_results_per_page) / self.max_results_per_page
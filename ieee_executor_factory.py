@@ -1,5 +1,6 @@
 from abs_executor_factory import AbsExecutorFactory
 from ieee_abstract_common_api import IEEEAbstractCommonApi
+from config import Config
 from logger import Logger
 from mhr import Mhr
 
@@ -9,7 +10,10 @@ class IEEEExecutorFactory(AbsExecutorFactory):
     _EXPERIMENT_DETAILS_FILE_PATH = "/home/fabio/GitProjects/EstimationMethods/Logs/IEEE/Log.txt"
 
     def create_estimator(self):
-        return Mhr(IEEEAbstractCommonApi())
+        common_api = IEEEAbstractCommonApi()
+        if Config.IS_TO_CACHE_REQUESTS:
+            common_api = common_api.factory.create_caching_common_api(common_api)
+        return Mhr(common_api)
 
     def create_logger(self):
         return Logger(IEEEExecutorFactory._EXPERIMENT_DETAILS_FILE_PATH,
@@ -0,0 +1,56 @@
+import os
+
+import lxml.html
+
+from abs_page_extractor import AbsPageExtractor
+
+
+class IEEEPageExtractor(AbsPageExtractor):
+    _WEB_DOMAIN = "http://ieeexplore.ieee.org"
+    _NO_RESULTS_PATH = "//li[" + AbsPageExtractor._create_class_condition("article-list-item no-results ng-scope") + "]"
+    _ONE_RESULT_PATH = "//span[@ng-if='records.length === 1']"
+    _NUMBER_MATCHES_PATH = "//span[" + AbsPageExtractor._create_class_condition("ng-binding ng-scope") + "]"
+    _ITEM_PATH = "//li[" + AbsPageExtractor._create_class_condition("article-list-item ng-scope") + "]"
+    _ID_PATH = ".//a[" + AbsPageExtractor._create_class_condition("icon-pdf ng-scope") + "]"
+    _TITLE_PATH = ".//*[@ng-bind-html='::record.title']"
+    _ABSTRACT_PATH = ".//span[@ng-bind-html='::record.abstract']"
+    _HREF = "href"
+    _NUMBER_MATCHES_WORD_INDEX = 4
+    _ENCODING = "unicode"
+
+    def _extract_number_matches(self, tree):
+        if self._find_first(tree, IEEEPageExtractor._NO_RESULTS_PATH) is not None:
+            return 0
+        if self._find_first(tree, IEEEPageExtractor._ONE_RESULT_PATH) is not None:
+            return 1
+        html_element = self._find_first(tree, IEEEPageExtractor._NUMBER_MATCHES_PATH)
+        if html_element is None or html_element.text is None:
+            return -1
+        try:
+            contents = html_element.text.strip().split()
+            return int(str(contents[IEEEPageExtractor._NUMBER_MATCHES_WORD_INDEX].replace(",", "")))
+        except (IndexError, ValueError):
+            return -1
+
+    def _extract_record_list(self, tree):
+        return [self._extract_record(x) for x in tree.xpath(IEEEPageExtractor._ITEM_PATH)]
+
+    def _extract_record(self, item):
+        identifier_element = self._find_first(item, IEEEPageExtractor._ID_PATH)
+        title_element = self._find_first(item, IEEEPageExtractor._TITLE_PATH)
+        abstract_element = self._find_first(item, IEEEPageExtractor._ABSTRACT_PATH)
+        if title_element is None:
+            return None, lxml.html.tostring(item, encoding=IEEEPageExtractor._ENCODING)
+        abstract = None if abstract_element is None else abstract_element.text_content()
+        if identifier_element is not None:
+            href = identifier_element.get(IEEEPageExtractor._HREF)
+        else:
+            href = title_element.get(IEEEPageExtractor._HREF)
+            href = href[0:href.find("&")]
+        return IEEEPageExtractor._WEB_DOMAIN + str(href), self._format_content(title_element.text_content(), abstract)
+
+    def _format_content(self, title, abstract):
+        if abstract is not None:
+            return str(title) + os.linesep + os.linesep + str(abstract)
+        else:
+            return str(title)
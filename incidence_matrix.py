@@ -0,0 +1,64 @@
+from array import array
+from threading import Lock
+
+from abs_incidence_matrix import AbsIncidenceMatrix
+
+
+class IncidenceMatrix(AbsIncidenceMatrix):
+    """
+    Compressed sparse row layout: the columns of row r are
+    column_array[row_start_array[r]:row_start_array[r + 1]].
+    """
+    _OFFSET_TYPE = "q"
+    _COLUMN_TYPE = "l"
+
+    @property
+    def query_matcher(self):
+        return self.__query_matcher
+
+    @property
+    def number_rows(self):
+        return len(self.__row_start_array) - 1
+
+    @property
+    def number_columns(self):
+        return len(self.__query_matcher.query_pool)
+
+    def __init__(self, degree_cache, query_matcher):
+        self.__degree_cache = degree_cache
+        self.__query_matcher = query_matcher
+        self.__row_start_array = array(IncidenceMatrix._OFFSET_TYPE, [0])
+        self.__column_array = array(IncidenceMatrix._COLUMN_TYPE)
+        self.__row_dict = {}
+        self.__lock = Lock()
+
+    def add_document(self, document):
+        identifier = document.identifier
+        if identifier is not None:
+            row = self.__row_dict.get(identifier)
+            if row is not None:
+                return row
+        # Matching runs outside the lock; only appending the row is serialized.
+        column_tuple = self.__degree_cache.retrieve_matching_indices(document, self.__query_matcher)
+        with self.__lock:
+            if identifier is not None:
+                row = self.__row_dict.get(identifier)
+                if row is not None:
+                    return row
+            self.__column_array.extend(column_tuple)
+            self.__row_start_array.append(len(self.__column_array))
+            row = len(self.__row_start_array) - 2
+            if identifier is not None:
+                self.__row_dict[identifier] = row
+            return row
+
+    def retrieve_columns(self, row):
+        return self.__column_array[self.__row_start_array[row]:self.__row_start_array[row + 1]]
+
+    def retrieve_degrees(self, row_list):
+        row_start_array = self.__row_start_array
+        return array(IncidenceMatrix._COLUMN_TYPE, [row_start_array[x + 1] - row_start_array[x] for x in row_list])
+
+    def count_nonzero_rows(self, row_list):
+        row_start_array = self.__row_start_array
+        return sum(1 for x in row_list if row_start_array[x + 1] > row_start_array[x])
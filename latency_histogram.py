@@ -0,0 +1,50 @@
+import math
+
+from abs_latency_histogram import AbsLatencyHistogram
+
+
+class LatencyHistogram(AbsLatencyHistogram):
+    # Buckets grow geometrically from one microsecond, so a percentile is within 5% of the real duration.
+    _MIN_DURATION = 0.000001
+    _BUCKET_GROWTH = 1.05
+    _LOG_BUCKET_GROWTH = math.log(_BUCKET_GROWTH)
+
+    @property
+    def count(self):
+        return self.__count
+
+    @property
+    def total(self):
+        return self.__total
+
+    def __init__(self):
+        self.__bucket_dict = {}
+        self.__count = 0
+        self.__total = 0.0
+        self.__min_duration = None
+        self.__max_duration = None
+
+    def record(self, duration):
+        if duration > LatencyHistogram._MIN_DURATION:
+            bucket = int(math.log(duration / LatencyHistogram._MIN_DURATION) / LatencyHistogram._LOG_BUCKET_GROWTH)
+        else:
+            bucket = 0
+        self.__bucket_dict[bucket] = self.__bucket_dict.get(bucket, 0) + 1
+        self.__count += 1
+        self.__total += duration
+        if self.__min_duration is None or duration < self.__min_duration:
+            self.__min_duration = duration
+        if self.__max_duration is None or duration > self.__max_duration:
+            self.__max_duration = duration
+
+    def percentile(self, percentage):
+        if self.__count == 0:
+            return None
+        rank = max(1, math.ceil(percentage / 100 * self.__count))
+        cumulative_count = 0
+        for bucket in sorted(self.__bucket_dict.keys()):
+            cumulative_count += self.__bucket_dict[bucket]
+            if cumulative_count >= rank:
+                duration = LatencyHistogram._MIN_DURATION * LatencyHistogram._BUCKET_GROWTH ** (bucket + 0.5)
+                return min(max(duration, self.__min_duration), self.__max_duration)
+        return self.__max_duration
@@ -0,0 +1,15 @@
+from abs_transport import AbsTransport
+
+
+class LiveTransport(AbsTransport):
+
+    def fetch(self, key, download, decode):
+        response, value = download()
+        return value
+
+    async def fetch_async(self, key, download, decode):
+        response, value = await download()
+        return value
+
+    def close(self):
+        pass
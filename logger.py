@@ -7,6 +7,10 @@ from abs_logger import AbsLogger
 
 
 class Logger(AbsLogger):
+    _CACHE_HITS_KEY = "hits"
+    _CACHE_MISSES_KEY = "misses"
+    _TRACE_KEY_LIST = ["count", "total", "p50", "p95", "p99"]
+
     def __init__(self, details_file_path, results_file_path, data_set_size, query_pool_file_path):
         self.experiment_details_file_path = details_file_path
         self.experiment_results_file_path = results_file_path
@@ -16,13 +20,39 @@ class Logger(AbsLogger):
     def write_header(self):
         with open(self.experiment_results_file_path, "a+") as file:
             file.write(str(self.data_set_size) + "," + os.linesep)
-            file.write("Iteração,Estimativa,Erro,Duração,Conexões," + os.linesep)
+            file.write("Iteração,Estimativa,Erro,Duração,Conexões,Acertos de cache,Falhas de cache," + os.linesep)
 
-    def write_result_iteration(self, iteration_number, estimation, duration, connections):
+    def write_result_iteration(self, iteration_number, estimation, duration, connections, cache_statistics=None,
+                               trace_statistics=None):
         error = math.fabs(self.data_set_size - estimation) / self.data_set_size
+        cache_hits = ""
+        cache_misses = ""
+        if cache_statistics is not None:
+            cache_hits = str(cache_statistics[Logger._CACHE_HITS_KEY])
+            cache_misses = str(cache_statistics[Logger._CACHE_MISSES_KEY])
         with open(self.experiment_results_file_path, "a+") as file:
             file.write(str(iteration_number) + "," + str(estimation) + "," + str(error) + "," + str(duration) + ","
-                       + str(connections) + "," + os.linesep)
+                       + str(connections) + "," + cache_hits + "," + cache_misses + "," + os.linesep)
+        if trace_statistics is not None:
+            # Kept out of the results file, so that it has a single header and one row per iteration.
+            with open(self.experiment_details_file_path, "a+") as file:
+                file.write("Etapas da iteração " + str(iteration_number) + " (Quantidade,Tempo total,p50,p95,p99):"
+                           + os.linesep)
+                for stage in sorted(trace_statistics.keys()):
+                    file.write(stage + ": "
+                               + ",".join(str(trace_statistics[stage][x]) for x in Logger._TRACE_KEY_LIST)
+                               + os.linesep)
+
+    def write_session_header(self):
+        with open(self.experiment_results_file_path, "a+") as file:
+            file.write(str(self.data_set_size) + "," + os.linesep)
+            file.write("Estimador,Estimativa,Erro,Duração,Conexões,Conexões sem cache," + os.linesep)
+
+    def write_session_result(self, estimator_name, estimation, duration, connections, connections_without_cache):
+        error = math.fabs(self.data_set_size - estimation) / self.data_set_size
+        with open(self.experiment_results_file_path, "a+") as file:
+            file.write(estimator_name + "," + str(estimation) + "," + str(error) + "," + str(duration) + ","
+                       + str(connections) + "," + str(connections_without_cache) + "," + os.linesep)
 
     def write_final_result(self, estimation_list, total_duration, total_connections):
         average = statistics.mean(estimation_list)
@@ -0,0 +1,81 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from abs_cache import AbsCache
+
+
+class LruCache(AbsCache):
+    _ENTRY_VALUE_INDEX = 0
+    _ENTRY_SIZE_INDEX = 1
+    _ENTRY_EXPIRATION_INDEX = 2
+
+    @property
+    def hit_count(self):
+        return self.__hit_count
+
+    @property
+    def miss_count(self):
+        return self.__miss_count
+
+    @property
+    def max_size(self):
+        return self.__max_size
+
+    @property
+    def size(self):
+        return self.__size
+
+    def __init__(self, max_size, time_to_live=None):
+        self.__max_size = max_size
+        self.__time_to_live = time_to_live
+        self.__entry_dict = OrderedDict()
+        self.__size = 0
+        self.__hit_count = 0
+        self.__miss_count = 0
+        self.__lock = Lock()
+
+    def get(self, key):
+        with self.__lock:
+            entry = self.__entry_dict.get(key)
+            if entry is not None and self._is_expired(entry):
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.__miss_count += 1
+                return None
+            self.__entry_dict.move_to_end(key)
+            self.__hit_count += 1
+            return entry[LruCache._ENTRY_VALUE_INDEX]
+
+    def put(self, key, value, size=1):
+        if size > self.__max_size:
+            return
+        expiration = None
+        if self.__time_to_live is not None:
+            expiration = time.monotonic() + self.__time_to_live
+        with self.__lock:
+            if key in self.__entry_dict:
+                self._remove(key)
+            self.__entry_dict[key] = (value, size, expiration)
+            self.__size += size
+            while self.__size > self.__max_size:
+                self._remove(next(iter(self.__entry_dict)))
+
+    def reset_statistics(self):
+        with self.__lock:
+            self.__hit_count = 0
+            self.__miss_count = 0
+
+    def clear(self):
+        with self.__lock:
+            self.__entry_dict.clear()
+            self.__size = 0
+
+    def _is_expired(self, entry):
+        expiration = entry[LruCache._ENTRY_EXPIRATION_INDEX]
+        return expiration is not None and expiration <= time.monotonic()
+
+    def _remove(self, key):
+        entry = self.__entry_dict.pop(key)
+        self.__size -= entry[LruCache._ENTRY_SIZE_INDEX]
@@ -1,7 +1,11 @@
-from threading import Lock
-from random import randrange
+import itertools
+import operator
+from array import array
+from threading import Lock, local
 
 from abs_estimator import AbsEstimator
+from config import Config
+from estimation_math import EstimationMath
 
 
 class Mhr(AbsEstimator):
@@ -11,6 +15,7 @@ class Mhr(AbsEstimator):
     _MAX_NUMBER_MATCHES = 5000000
     _MIN_NUMBER_MATCHES = 1
     _NUMBER_QUERIES = 100
+    _COUNT_TYPE = "l"
 
     @property
     def common_api(self):
@@ -29,58 +34,83 @@ class Mhr(AbsEstimator):
 
     def __init__(self, common_api):
         self.__common_api = common_api
-        self.__lock_accumulators = Lock()
-        self.__lock_query_list = Lock()
         self.__query_count = 0
         self.__total_matches = 0
-        self.__total_documents_returned = 0
-        self.__document_id_dict = {}
-        self.__query_list = self.__common_api.read_query_pool()
-        self.__query_pool_size = len(self.__query_list)
-        self.__progress_count = 0
+        self.__id_interning_table = self.__common_api.factory.create_id_interning_table()
+        self.__thread_data = local()
+        self.__count_array_list = []
+        self.__lock_count_array_list = Lock()
+        self.__document_count_array = array(Mhr._COUNT_TYPE)
+        self.__query_sampler = self.__common_api.read_query_pool().create_sampler(Mhr._NUMBER_QUERIES)
+        self.__progress_counter = itertools.count(1)
 
     def _take_query(self):
-        query = None
-        with self.__lock_query_list:
-            self.__progress_count += 1
-            self.common_api.report_progress(self.__progress_count, Mhr._NUMBER_QUERIES)
-            if self.__query_pool_size > 0:
-                random_index = randrange(self.__query_pool_size)
-                query = self.__query_list[random_index]
-                del (self.__query_list[random_index])
+        query = self.__query_sampler.take()
+        self.common_api.report_progress(next(self.__progress_counter), Mhr._NUMBER_QUERIES)
         return query
 
     # noinspection PyUnusedLocal
     def _collect_data_for_estimation(self, number):
         query = self._take_query()
-        number_matches = self.common_api.retrieve_number_matches(query)
-        if Mhr._MIN_NUMBER_MATCHES <= number_matches <= Mhr._MAX_NUMBER_MATCHES:
-            document_list = self.common_api.download(query, True, False).results
-            id_list = []
-            number_documents_returned = 0
-            for document in document_list:
-                id_list.append(document.identifier)
-                number_documents_returned += 1
-            with self.__lock_accumulators:
-                self.__query_count += 1
-                self.__total_matches += number_matches
-                self.__total_documents_returned += number_documents_returned
-                for id_item in id_list:
-                    self.__document_id_dict[id_item] = self.__document_id_dict.get(id_item, 0) + 1
+        search_result = self.common_api.download_if_in_range(query, Mhr._MIN_NUMBER_MATCHES, Mhr._MAX_NUMBER_MATCHES,
+                                                             True, False)
+        return self._count_documents(search_result)
+
+    def _count_documents(self, search_result):
+        number_matches = search_result.number_results
+        if not Mhr._MIN_NUMBER_MATCHES <= number_matches <= Mhr._MAX_NUMBER_MATCHES:
+            return None
+        count_array = self._retrieve_thread_count_array()
+        identifier_iterator = (x.identifier for x in search_result.results)
+        # Interned a page of the stream at a time, so the identifiers of a result are never all in memory.
+        while True:
+            identifier_list = list(itertools.islice(identifier_iterator, Config.STREAM_PAGE_SIZE))
+            if len(identifier_list) == 0:
+                break
+            index_array = self.__id_interning_table.intern(identifier_list)
+            if len(count_array) < self.__id_interning_table.size:
+                count_array.frombytes(bytes((self.__id_interning_table.size - len(count_array))
+                                            * count_array.itemsize))
+            for index in index_array:
+                count_array[index] += 1
+        return number_matches
+
+    def _retrieve_thread_count_array(self):
+        # Each thread counts the documents it receives in its own array, merged once all queries are done.
+        count_array = getattr(self.__thread_data, "count_array", None)
+        if count_array is None:
+            count_array = array(Mhr._COUNT_TYPE)
+            self.__thread_data.count_array = count_array
+            with self.__lock_count_array_list:
+                self.__count_array_list.append(count_array)
+        return count_array
+
+    def _collect_data(self):
+        return self.common_api.execute_in_parallel(range(0, Mhr._NUMBER_QUERIES),
+                                                   self._collect_data_for_estimation, True)
+
+    def _accumulate(self, collected_data_list):
+        for number_matches in collected_data_list:
+            if number_matches is None:
+                continue
+            self.__query_count += 1
+            self.__total_matches += number_matches
+        document_count_array = array(Mhr._COUNT_TYPE, [0]) * self.__id_interning_table.size
+        for count_array in self.__count_array_list:
+            document_count_array[:len(count_array)] = array(Mhr._COUNT_TYPE,
+                                                            map(operator.add, document_count_array, count_array))
+        self.__document_count_array = document_count_array
 
     def _calculate_estimation(self):
-        estimation = -1
-        number_unique_documents_returned = len(list(self.__document_id_dict.keys()))
-        if self.__total_documents_returned != 0 and number_unique_documents_returned != 0:
-            overflow_rate = self.__total_matches / self.__total_documents_returned
-            overlapping_rate = self.__total_documents_returned / number_unique_documents_returned
-            if overlapping_rate != 1:
-                estimation = overflow_rate * number_unique_documents_returned / (1 - overlapping_rate ** (-1.1))
-        return estimation
+        total_documents_returned = sum(self.__document_count_array)
+        number_unique_documents_returned = len(self.__document_count_array) - self.__document_count_array.count(0)
+        return EstimationMath.mhr_estimation(self.__total_matches, total_documents_returned,
+                                             number_unique_documents_returned)
 
     def estimate(self):
         super().estimate()
         self.__init__(self.common_api)
-        self.common_api.execute_in_parallel(range(0, Mhr._NUMBER_QUERIES), self._collect_data_for_estimation)
+        collected_data_list = self._collect_data()
+        self._accumulate(collected_data_list)
         estimation = self._calculate_estimation()
         return estimation
@@ -0,0 +1,112 @@
+import json
+import time
+from threading import Thread, Lock
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+from abs_mock_solr_server import AbsMockSolrServer
+
+
+class MockSolrServer(AbsMockSolrServer):
+    _HOST = "127.0.0.1"
+    _SELECT_URL = "http://{}:{}/solr/benchmark/select?"
+    _ID_FIELD = "id"
+    _CONTENT_FIELD = "text"
+    _ALL_FIELDS = "*"
+    _FIELD_SEPARATOR = ":"
+    _FIELD_LIST_SEPARATOR = ","
+    _INITIAL_CURSOR_MARK = "*"
+    _DEFAULT_ROWS = 10
+    _CONTENT_TYPE = "application/json"
+    _ENCODING = "utf-8"
+
+    class _Server(ThreadingHTTPServer):
+        request_queue_size = 1024
+        daemon_threads = True
+
+        def __init__(self, address, handler_class, mock):
+            super().__init__(address, handler_class)
+            self.mock = mock
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        # noinspection PyShadowingBuiltins
+        def log_message(self, format, *args):
+            pass
+
+        # noinspection PyPep8Naming
+        def do_GET(self):
+            mock = self.server.mock
+            try:
+                body = json.dumps(mock.answer(parse_qs(urlsplit(self.path).query))).encode(MockSolrServer._ENCODING)
+                status = 200
+            except (KeyError, ValueError) as exception:
+                body = json.dumps({"error": {"msg": str(exception)}}).encode(MockSolrServer._ENCODING)
+                status = 400
+            self.send_response(status)
+            self.send_header("Content-Type", MockSolrServer._CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    @property
+    def select_url(self):
+        host, port = self.__server.server_address[:2]
+        return MockSolrServer._SELECT_URL.format(host, port)
+
+    @property
+    def request_count(self):
+        with self.__lock:
+            return self.__request_count
+
+    def __init__(self, corpus, latency=0.0):
+        self.__corpus = corpus
+        self.__latency = latency
+        self.__request_count = 0
+        self.__lock = Lock()
+        self.__server = MockSolrServer._Server((MockSolrServer._HOST, 0), MockSolrServer._Handler, self)
+        self.__thread = None
+
+    def start(self):
+        self.__thread = Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
+
+    def reset_request_count(self):
+        with self.__lock:
+            self.__request_count = 0
+
+    def answer(self, parameter_dict):
+        with self.__lock:
+            self.__request_count += 1
+        if self.__latency > 0:
+            time.sleep(self.__latency)
+        query = parameter_dict["q"][0]
+        offset = int(parameter_dict.get("start", ["0"])[0])
+        rows = int(parameter_dict.get("rows", [str(MockSolrServer._DEFAULT_ROWS)])[0])
+        field_list = parameter_dict.get("fl", [MockSolrServer._ALL_FIELDS])[0].split(
+            MockSolrServer._FIELD_LIST_SEPARATOR)
+        cursor_mark = parameter_dict.get("cursorMark", [None])[0]
+        if cursor_mark is not None:
+            # The cursor is the position of the next document, as every result is sorted by identifier.
+            offset = 0 if cursor_mark == MockSolrServer._INITIAL_CURSOR_MARK else int(cursor_mark)
+        index_list = self.__corpus.match(query.split(MockSolrServer._FIELD_SEPARATOR, 1)[-1].split())
+        document_list = [self._create_document(i, field_list) for i in index_list[offset:offset + rows]]
+        response = {"response": {"numFound": len(index_list), "start": offset, "docs": document_list}}
+        if cursor_mark is not None:
+            response["nextCursorMark"] = str(offset + len(document_list)) if len(document_list) > 0 else cursor_mark
+        return response
+
+    def _create_document(self, index, field_list):
+        identifier, content = self.__corpus.retrieve_document(index)
+        document = {}
+        if MockSolrServer._ID_FIELD in field_list or MockSolrServer._ALL_FIELDS in field_list:
+            document[MockSolrServer._ID_FIELD] = identifier
+        if MockSolrServer._CONTENT_FIELD in field_list or MockSolrServer._ALL_FIELDS in field_list:
+            document[MockSolrServer._CONTENT_FIELD] = content
+        return document
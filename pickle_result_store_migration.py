@@ -0,0 +1,62 @@
+import os
+import pickle
+import sys
+
+from acm_common_api import ACMCommonApi
+from ieee_abstract_common_api import IEEEAbstractCommonApi
+from search_result import SearchResult
+
+
+class PickleResultStoreMigration:
+    _DATA_FILE_EXTENSION = ".pkl"
+    _BATCH_SIZE = 1000
+
+    def migrate(self, folder_path, result_store):
+        """
+        Imports into the result store every search result saved as a "<query>.pkl"
+        file in the folder, split into pages. Queries already in the store are skipped,
+        so an interrupted migration can be run again. Returns the number of imported
+        results.
+        """
+        query_result_list = []
+        number_imported_results = 0
+        for file_name in os.listdir(folder_path):
+            if not file_name.endswith(PickleResultStoreMigration._DATA_FILE_EXTENSION):
+                continue
+            query = file_name[0:-len(PickleResultStoreMigration._DATA_FILE_EXTENSION)]
+            if result_store.load_number_results(query) is not None:
+                continue
+            search_result = self._load(folder_path + os.path.sep + file_name)
+            if search_result is None:
+                print("ERROR - Search result corrupted - " + file_name)
+                continue
+            query_result_list.append((query, search_result))
+            if len(query_result_list) >= PickleResultStoreMigration._BATCH_SIZE:
+                result_store.save_many(query_result_list)
+                number_imported_results += len(query_result_list)
+                query_result_list = []
+                print("Progress: " + str(number_imported_results))
+        result_store.save_many(query_result_list)
+        number_imported_results += len(query_result_list)
+        return number_imported_results
+
+    def _load(self, file_path):
+        try:
+            with open(file_path, "rb") as archive:
+                search_result = pickle.load(archive)
+                # The pickle files were saved as SearchResult objects holding lists of Data objects.
+                assert (isinstance(search_result, SearchResult))
+        except:
+            search_result = None
+        return search_result
+
+
+if __name__ == "__main__":
+    migration = PickleResultStoreMigration()
+    common_api_list = [ACMCommonApi(), IEEEAbstractCommonApi()]
+    for common_api in common_api_list:
+        if len(sys.argv) > 1 and type(common_api).__name__ not in sys.argv[1:]:
+            continue
+        number_results = migration.migrate(common_api.data_folder_path, common_api.result_store)
+        print(type(common_api).__name__ + ": " + str(number_results) + " results imported")
+        common_api.result_store.close()
@@ -0,0 +1,68 @@
+from collections.abc import Sequence
+
+from abs_data import AbsData
+from abs_search_result import AbsSearchResult
+
+
+class ProjectedSearchResult(AbsSearchResult):
+    """
+    View of another search result whose documents expose only their identifiers or
+    only their contents, the other field being None. The documents are not copied:
+    each one is wrapped in a view when it is accessed.
+    """
+
+    class _DataView(AbsData):
+        __slots__ = ("__data", "__is_to_have_id", "__is_to_have_content")
+
+        def __init__(self, data, is_to_have_id, is_to_have_content):
+            self.__data = data
+            self.__is_to_have_id = is_to_have_id
+            self.__is_to_have_content = is_to_have_content
+
+        @property
+        def identifier(self):
+            return self.__data.identifier if self.__is_to_have_id else None
+
+        @property
+        def content(self):
+            return self.__data.content if self.__is_to_have_content else None
+
+    class _DataSequence(Sequence):
+        __slots__ = ("__results", "__is_to_have_id", "__is_to_have_content")
+
+        def __init__(self, results, is_to_have_id, is_to_have_content):
+            self.__results = results
+            self.__is_to_have_id = is_to_have_id
+            self.__is_to_have_content = is_to_have_content
+
+        def __len__(self):
+            return len(self.__results)
+
+        def __getitem__(self, index):
+            if isinstance(index, slice):
+                return [self._create_view(x) for x in self.__results[index]]
+            return self._create_view(self.__results[index])
+
+        def __iter__(self):
+            for data in self.__results:
+                yield self._create_view(data)
+
+        def _create_view(self, data):
+            return ProjectedSearchResult._DataView(data, self.__is_to_have_id, self.__is_to_have_content)
+
+    @property
+    def number_results(self):
+        return self.__search_result.number_results
+
+    @property
+    def results(self):
+        return self.__results
+
+    def __init__(self, search_result, is_to_have_id, is_to_have_content):
+        self.__search_result = search_result
+        results = search_result.results
+        if isinstance(results, Sequence):
+            self.__results = ProjectedSearchResult._DataSequence(results, is_to_have_id, is_to_have_content)
+        else:
+            # The results of a streaming search result can be consumed only once, so they stay an iterator.
+            self.__results = (ProjectedSearchResult._DataView(x, is_to_have_id, is_to_have_content) for x in results)
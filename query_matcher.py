@@ -0,0 +1,128 @@
+import hashlib
+from collections import deque
+
+from abs_query_matcher import AbsQueryMatcher
+
+
+class QueryMatcher(AbsQueryMatcher):
+    """
+    Aho-Corasick automaton over the lower case forms of the queries.
+    """
+    _ROOT = 0
+    _QUERY_SEPARATOR = "\n"
+    _ENCODING = "utf-8"
+
+    @property
+    def query_pool(self):
+        return self.__query_pool
+
+    @property
+    def fingerprint(self):
+        return self.__fingerprint
+
+    def __init__(self, query_pool):
+        self.__query_pool = query_pool
+        self.__fingerprint = self._calculate_fingerprint()
+        self.__transition_list = [{}]
+        self.__failure_list = [QueryMatcher._ROOT]
+        self.__output_link_list = [None]
+        self.__index_list_by_state = [None]
+        self.__always_matching_index_list = []
+        self._build_trie()
+        self._build_links()
+
+    def match_indices(self, text):
+        index_list = list(self.__always_matching_index_list)
+        for state in self._find_output_states(text):
+            index_list.extend(self.__index_list_by_state[state])
+        index_list.sort()
+        return index_list
+
+    def match(self, text):
+        return [self.__query_pool[x] for x in self.match_indices(text)]
+
+    def count_matches(self, text):
+        count = len(self.__always_matching_index_list)
+        for state in self._find_output_states(text):
+            count += len(self.__index_list_by_state[state])
+        return count
+
+    def has_match(self, text):
+        if len(self.__always_matching_index_list) > 0:
+            return True
+        for state in self._find_output_states(text):
+            return True
+        return False
+
+    def _calculate_fingerprint(self):
+        digest = hashlib.sha1()
+        for query in self.__query_pool:
+            digest.update(query.encode(QueryMatcher._ENCODING))
+            digest.update(QueryMatcher._QUERY_SEPARATOR.encode(QueryMatcher._ENCODING))
+        return digest.hexdigest()
+
+    def _build_trie(self):
+        transition_list = self.__transition_list
+        for index in range(0, len(self.__query_pool)):
+            pattern = self.__query_pool.lower(index)
+            if len(pattern) == 0:
+                self.__always_matching_index_list.append(index)
+                continue
+            state = QueryMatcher._ROOT
+            for character in pattern:
+                next_state = transition_list[state].get(character)
+                if next_state is None:
+                    next_state = len(transition_list)
+                    transition_list.append({})
+                    self.__failure_list.append(QueryMatcher._ROOT)
+                    self.__output_link_list.append(None)
+                    self.__index_list_by_state.append(None)
+                    transition_list[state][character] = next_state
+                state = next_state
+            if self.__index_list_by_state[state] is None:
+                self.__index_list_by_state[state] = []
+            self.__index_list_by_state[state].append(index)
+
+    def _build_links(self):
+        transition_list = self.__transition_list
+        failure_list = self.__failure_list
+        output_link_list = self.__output_link_list
+        index_list_by_state = self.__index_list_by_state
+        state_queue = deque(transition_list[QueryMatcher._ROOT].values())
+        while len(state_queue) > 0:
+            state = state_queue.popleft()
+            for character, next_state in transition_list[state].items():
+                failure = failure_list[state]
+                while failure != QueryMatcher._ROOT and character not in transition_list[failure]:
+                    failure = failure_list[failure]
+                failure = transition_list[failure].get(character, QueryMatcher._ROOT)
+                if failure == next_state:
+                    failure = QueryMatcher._ROOT
+                failure_list[next_state] = failure
+                if index_list_by_state[failure] is not None:
+                    output_link_list[next_state] = failure
+                else:
+                    output_link_list[next_state] = output_link_list[failure]
+                state_queue.append(next_state)
+
+    def _find_output_states(self, text):
+        """
+        Yields once each state that ends a query occurring in the text.
+        """
+        transition_list = self.__transition_list
+        failure_list = self.__failure_list
+        output_link_list = self.__output_link_list
+        index_list_by_state = self.__index_list_by_state
+        visited_state_set = set()
+        state = QueryMatcher._ROOT
+        for character in text.lower():
+            transitions = transition_list[state]
+            while character not in transitions and state != QueryMatcher._ROOT:
+                state = failure_list[state]
+                transitions = transition_list[state]
+            state = transitions.get(character, QueryMatcher._ROOT)
+            output_state = state if index_list_by_state[state] is not None else output_link_list[state]
+            while output_state is not None and output_state not in visited_state_set:
+                visited_state_set.add(output_state)
+                yield output_state
+                output_state = output_link_list[output_state]
@@ -0,0 +1,77 @@
+import mmap
+import random
+from array import array
+from urllib.parse import quote
+
+from abs_query_pool import AbsQueryPool
+
+
+class QueryPool(AbsQueryPool):
+    _ENCODING = "utf-8"
+    _INDEX_TYPE = "l"
+
+    @property
+    def file_path(self):
+        return self.__file_path
+
+    def __init__(self, file_path, is_memory_mapped, factory):
+        self.__file_path = file_path
+        self.__factory = factory
+        if is_memory_mapped:
+            line_iterable = self._read_mapped_lines()
+        else:
+            line_iterable = self._read_lines()
+        self.__index_dict = {}
+        for line in line_iterable:
+            self.__index_dict.setdefault(line.rstrip("\n").rstrip("\r"), len(self.__index_dict))
+        self.__query_list = list(self.__index_dict)
+        self.__lower_query_list = [x.lower() for x in self.__query_list]
+        self.__escaped_query_list = [quote(x) for x in self.__query_list]
+
+    def __getitem__(self, index):
+        return self.__query_list[index]
+
+    def __len__(self):
+        return len(self.__query_list)
+
+    def __iter__(self):
+        return iter(self.__query_list)
+
+    def __contains__(self, query):
+        return query in self.__index_dict
+
+    def index(self, query, start=0, stop=None):
+        index = self.__index_dict.get(query)
+        if index is None or index < start or (stop is not None and index >= stop):
+            raise ValueError(str(query) + " is not in the query pool")
+        return index
+
+    def lower(self, index):
+        return self.__lower_query_list[index]
+
+    def escape(self, query):
+        index = self.__index_dict.get(query)
+        if index is None:
+            return quote(query)
+        return self.__escaped_query_list[index]
+
+    def create_sampler(self, sample_size=None):
+        if sample_size is None or sample_size >= len(self.__query_list):
+            index_sequence = array(QueryPool._INDEX_TYPE, range(0, len(self.__query_list)))
+            random.shuffle(index_sequence)
+        else:
+            index_sequence = array(QueryPool._INDEX_TYPE, random.sample(range(0, len(self.__query_list)), sample_size))
+        return self.__factory.create_query_sampler(self, index_sequence)
+
+    def _read_lines(self):
+        with open(self.__file_path) as archive:
+            yield from archive
+
+    def _read_mapped_lines(self):
+        # The lines are decoded straight from the mapping, without reading the whole file into memory first.
+        with open(self.__file_path, "rb") as archive:
+            if archive.seek(0, 2) == 0:
+                return
+            with mmap.mmap(archive.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                for line in iter(mapping.readline, b""):
+                    yield line.decode(QueryPool._ENCODING)
@@ -0,0 +1,23 @@
+import os
+from threading import Lock
+
+from abs_query_pool_registry import AbsQueryPoolRegistry
+
+
+class QueryPoolRegistry(AbsQueryPoolRegistry):
+
+    def __init__(self, factory):
+        self.__factory = factory
+        self.__entry_dict = {}
+        self.__lock = Lock()
+
+    def load(self, file_path, is_memory_mapped=False):
+        file_path = os.path.abspath(file_path)
+        status = os.stat(file_path)
+        version = (status.st_mtime_ns, status.st_size)
+        with self.__lock:
+            entry = self.__entry_dict.get(file_path)
+            if entry is None or entry[0] != version:
+                entry = (version, self.__factory.create_query_pool(file_path, is_memory_mapped))
+                self.__entry_dict[file_path] = entry
+            return entry[1]
@@ -0,0 +1,18 @@
+import itertools
+
+from abs_query_sampler import AbsQuerySampler
+
+
+class QuerySampler(AbsQuerySampler):
+
+    def __init__(self, query_pool, index_sequence):
+        self.__query_pool = query_pool
+        self.__index_sequence = index_sequence
+        # Drawing from itertools.count is atomic, so every thread gets a different position.
+        self.__position_counter = itertools.count()
+
+    def take(self):
+        position = next(self.__position_counter)
+        if position >= len(self.__index_sequence):
+            return None
+        return self.__query_pool[self.__index_sequence[position]]
@@ -1,7 +1,7 @@
 import random
-import math
 
 from abs_estimator import AbsEstimator
+from estimation_math import EstimationMath
 
 
 class RandomWalk(AbsEstimator):
@@ -37,13 +37,7 @@ class RandomWalk(AbsEstimator):
         super().estimate()
         document_degree_list = []
         frequency_number_nodes_dict = self._random_walk(document_degree_list)
-        n = len(document_degree_list)
-        dw = sum(document_degree_list) / n
-        dh = n / sum([1 / x for x in document_degree_list])
-        binomy_n_2 = math.factorial(n) / (math.factorial(n - 2) * 2)
-        c = sum([((math.factorial(x) / (math.factorial(x - 2) * 2)) * frequency_number_nodes_dict[x]) for x in
-                 frequency_number_nodes_dict.keys()])
-        estimation = (dw / dh) * binomy_n_2 * (1 / c)
+        estimation = EstimationMath.random_walk_estimation(document_degree_list, frequency_number_nodes_dict)
         return estimation
 
     def _random_walk(self, document_degree_list):
@@ -68,7 +62,7 @@ class RandomWalk(AbsEstimator):
                     number_matches = self.common_api.retrieve_number_matches(query)
                     continue
                 document = results[0]
-                words_buffer = self.common_api.extract_words(document.content)
+                words_buffer = self.common_api.extract_document_words(document)
                 number_words_buffer = len(words_buffer)
                 if number_words_buffer < RandomWalk._MIN_NUMBER_WORDS:
                     query = words[random.randrange(0, number_words)]
@@ -0,0 +1,26 @@
+from abs_transport import AbsTransport
+
+
+class RecordingTransport(AbsTransport):
+
+    @property
+    def archive(self):
+        return self.__archive
+
+    def __init__(self, archive):
+        self.__archive = archive
+
+    def fetch(self, key, download, decode):
+        response, value = download()
+        if response is not None:
+            self.__archive.save(key, response)
+        return value
+
+    async def fetch_async(self, key, download, decode):
+        response, value = await download()
+        if response is not None:
+            self.__archive.save(key, response)
+        return value
+
+    def close(self):
+        self.__archive.close()
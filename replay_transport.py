@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+from abs_transport import AbsTransport
+
+
+class ReplayTransport(AbsTransport):
+
+    @property
+    def archive(self):
+        return self.__archive
+
+    @property
+    def latency(self):
+        return self.__latency
+
+    def __init__(self, archive, latency=0.0):
+        self.__archive = archive
+        self.__latency = latency
+
+    def fetch(self, key, download, decode):
+        response = self._load(key)
+        if self.__latency > 0:
+            time.sleep(self.__latency)
+        return decode(response)
+
+    async def fetch_async(self, key, download, decode):
+        response = self._load(key)
+        if self.__latency > 0:
+            await asyncio.sleep(self.__latency)
+        return decode(response)
+
+    def close(self):
+        self.__archive.close()
+
+    def _load(self, key):
+        response = self.__archive.load(key)
+        if response is None:
+            raise LookupError("Response not recorded - " + key)
+        return response
@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+from threading import Lock
+
+from abs_request_tracer import AbsRequestTracer
+
+
+class RequestTracer(AbsRequestTracer):
+    _COUNT_KEY = "count"
+    _TOTAL_KEY = "total"
+    _PERCENTILE_KEY_DICT = {50: "p50", 95: "p95", 99: "p99"}
+
+    @property
+    def statistics(self):
+        statistics = {}
+        with self.__lock:
+            for stage, histogram in self.__histogram_dict.items():
+                stage_statistics = {RequestTracer._COUNT_KEY: histogram.count,
+                                    RequestTracer._TOTAL_KEY: histogram.total}
+                for percentage, key in RequestTracer._PERCENTILE_KEY_DICT.items():
+                    stage_statistics[key] = histogram.percentile(percentage)
+                statistics[stage] = stage_statistics
+        return statistics
+
+    def __init__(self, factory):
+        self.__factory = factory
+        self.__histogram_dict = {}
+        self.__lock = Lock()
+
+    @contextmanager
+    def trace(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage, duration):
+        with self.__lock:
+            histogram = self.__histogram_dict.get(stage)
+            if histogram is None:
+                histogram = self.__factory.create_latency_histogram()
+                self.__histogram_dict[stage] = histogram
+            histogram.record(duration)
+
+    def reset(self):
+        with self.__lock:
+            self.__histogram_dict = {}
@@ -0,0 +1,45 @@
+from threading import Lock
+
+from caching_common_api import CachingCommonApi
+
+
+class SessionCommonApi(CachingCommonApi):
+    """
+    View given to each estimator of an experiment session. It shares the caches of
+    the session, but counts only the downloads that the wrapped instance made for
+    its own requests and times them with its own request tracer, so estimators
+    running at the same time do not interfere with each other's measurements.
+    """
+
+    @property
+    def download_count(self):
+        with self.__lock_download_count:
+            return self.__download_count
+
+    @download_count.setter
+    def download_count(self, val):
+        with self.__lock_download_count:
+            self.__download_count = val
+        self.reset_statistics()
+
+    @property
+    def request_count(self):
+        # A request answered by the caches would otherwise have taken as many downloads as its cached result.
+        return self.download_count + self.cache_statistics[CachingCommonApi._SAVED_DOWNLOADS_KEY]
+
+    @property
+    def request_tracer(self):
+        return self.__request_tracer
+
+    def __init__(self, common_api, shared_with):
+        super().__init__(common_api, shared_with=shared_with)
+        self.__download_count = 0
+        self.__lock_download_count = Lock()
+        self.__request_tracer = common_api.factory.create_request_tracer()
+
+    def inc_download(self):
+        with self.__lock_download_count:
+            self.__download_count += 1
+
+    def _create_request(self):
+        return CachingCommonApi._Request(self.request_tracer, self.inc_download)
@@ -1,16 +1,19 @@
 from urllib.request import urlopen
+from urllib.parse import quote
 import json
 
 from abs_base_common_api import AbsBaseCommonApi
+from abs_request_tracer import AbsRequestTracer
 from config import Config
 
 
 class SolrCommonApi(AbsBaseCommonApi):
     DATA_SET_SIZE = 19994
     _QUERY_POOL_FILE_PATH = "/home/fabio/SolrCores/WordLists/new_shine.txt"
+    _DEGREE_CACHE_FILE_PATH = "/home/fabio/SolrCores/DegreeCaches/newsgroups2.pkl"
     _THREAD_LIMIT = 10
-    _URL = ("http://localhost:8984/solr/newsgroups2/select?"
-            + "q=::FIELD:::::QUERY::&start=::OFFSET::&rows=::LIMIT::&fl=::FIELDS_TO_RETURN::&wt=json")
+    _SELECT_URL = "http://localhost:8984/solr/newsgroups2/select?"
+    _URL_PARAMETERS = ("q=::FIELD:::::QUERY::&start=::OFFSET::&rows=::LIMIT::&fl=::FIELDS_TO_RETURN::&wt=json")
     _ID_FIELD = "id"
     _FIELD_TO_SEARCH = "text"
     _DOCUMENT_LIST_KEY = "docs"
@@ -22,6 +25,9 @@ class SolrCommonApi(AbsBaseCommonApi):
     _QUERY_MASK = "::QUERY::"
     _RESPONSE_KEY = "response"
     _ENCODING = "utf-8"
+    _CURSOR_PARAMETERS = "&sort=id+asc&cursorMark="
+    _INITIAL_CURSOR_MARK = "*"
+    _NEXT_CURSOR_MARK_KEY = "nextCursorMark"
 
     @property
     def thread_limit(self):
@@ -29,10 +35,22 @@ class SolrCommonApi(AbsBaseCommonApi):
 
     @property
     def query_pool_file_path(self):
-        return SolrCommonApi._QUERY_POOL_FILE_PATH
+        return self.__query_pool_file_path
 
-    def __init__(self):
+    @property
+    def degree_cache_file_path(self):
+        return self.__degree_cache_file_path
+
+    @property
+    def select_url(self):
+        return self.__select_url
+
+    def __init__(self, select_url=_SELECT_URL, query_pool_file_path=_QUERY_POOL_FILE_PATH,
+                 degree_cache_file_path=_DEGREE_CACHE_FILE_PATH):
         super().__init__()
+        self.__select_url = select_url
+        self.__query_pool_file_path = query_pool_file_path
+        self.__degree_cache_file_path = degree_cache_file_path
 
     def download_entire_data_set(self):
         return self._download("*", True, True, 0, 1000000, "*")
@@ -42,9 +60,72 @@ class SolrCommonApi(AbsBaseCommonApi):
         return self._download(query, is_to_download_id, is_to_download_content, offset, limit,
                               SolrCommonApi._FIELD_TO_SEARCH)
 
+    def download_if_in_range(self, query, min_number_matches, max_number_matches, is_to_download_id=True,
+                             is_to_download_content=True):
+        search_result = self.stream(query, is_to_download_id, is_to_download_content)
+        if not min_number_matches <= search_result.number_results <= max_number_matches:
+            return self.factory.create_search_result(search_result.number_results, [])
+        return search_result
+
+    def stream(self, query, is_to_download_id=True, is_to_download_content=True, page_size=Config.STREAM_PAGE_SIZE):
+        return self._stream(query, is_to_download_id, is_to_download_content, page_size,
+                            SolrCommonApi._FIELD_TO_SEARCH)
+
+    def _stream_entire_data_set(self):
+        return self._stream("*", True, True, Config.STREAM_PAGE_SIZE, "*").results
+
+    def _stream(self, query, is_to_download_id, is_to_download_content, page_size, field_to_search):
+        with self.request_tracer.trace(AbsRequestTracer.URL_BUILD_STAGE):
+            url = self._build_url(query, is_to_download_id, is_to_download_content, 0, page_size, field_to_search)
+        cursor_mark = SolrCommonApi._INITIAL_CURSOR_MARK
+        dictionary = self._fetch_page(url, cursor_mark)
+
+        def iterate_pages():
+            nonlocal url, cursor_mark, dictionary
+            while True:
+                with self.request_tracer.trace(AbsRequestTracer.CONSTRUCTION_STAGE):
+                    data_list = self._create_data_list(dictionary[SolrCommonApi._RESPONSE_KEY])
+                next_cursor_mark = dictionary[SolrCommonApi._NEXT_CURSOR_MARK_KEY]
+                dictionary = None
+                yield from data_list
+                if len(data_list) < page_size or next_cursor_mark == cursor_mark:
+                    return
+                cursor_mark = next_cursor_mark
+                dictionary = self._fetch_page(url, cursor_mark)
+
+        number_results = int(dictionary[SolrCommonApi._RESPONSE_KEY][SolrCommonApi._NUMBER_MATCHES_KEY])
+        return self.factory.create_streaming_search_result(number_results, iterate_pages())
+
+    def _fetch_page(self, url, cursor_mark):
+        return self._fetch_response(str(url) + SolrCommonApi._CURSOR_PARAMETERS + quote(cursor_mark),
+                                    self._decode_page)
+
     def _download(self, query, is_to_download_id, is_to_download_content, offset, limit, field_to_search):
-        url = SolrCommonApi._URL.replace(SolrCommonApi._LIMIT_MASK, str(limit))
-        url = url.replace(SolrCommonApi._QUERY_MASK, str(query))
+        with self.request_tracer.trace(AbsRequestTracer.URL_BUILD_STAGE):
+            url = self._build_url(query, is_to_download_id, is_to_download_content, offset, limit, field_to_search)
+        return self._fetch_response(str(url), self._create_search_result)
+
+    def _fetch_response(self, url, decode):
+        def download():
+            with self.request_tracer.trace(AbsRequestTracer.FETCH_STAGE):
+                body = urlopen(url).read()
+            return body, decode(body)
+
+        value = self.transport.fetch(self._create_transport_key(url), download, decode)
+        self.inc_download()
+        return value
+
+    def _create_transport_key(self, url):
+        # Recorded responses are keyed by the request parameters, so they can be replayed against any select URL.
+        return url[len(self.select_url):]
+
+    def _decode_page(self, body):
+        with self.request_tracer.trace(AbsRequestTracer.DECODE_STAGE):
+            return json.loads(body.decode(SolrCommonApi._ENCODING))
+
+    def _build_url(self, query, is_to_download_id, is_to_download_content, offset, limit, field_to_search):
+        url = (self.select_url + SolrCommonApi._URL_PARAMETERS).replace(SolrCommonApi._LIMIT_MASK, str(limit))
+        url = url.replace(SolrCommonApi._QUERY_MASK, self._escape_query(str(query)))
         url = url.replace(SolrCommonApi._FIELD_TO_SEARCH_MASK, field_to_search)
         url = url.replace(SolrCommonApi._OFFSET_MASK, str(offset))
         if is_to_download_id and is_to_download_content:
@@ -54,15 +135,22 @@ class SolrCommonApi(AbsBaseCommonApi):
             url = url.replace(SolrCommonApi._FIELDS_TO_RETURN_MASK, SolrCommonApi._FIELD_TO_SEARCH)
         else:
             url = url.replace(SolrCommonApi._FIELDS_TO_RETURN_MASK, SolrCommonApi._ID_FIELD)
-        response = urlopen(str(url))
-        self.inc_download()
-        data = response.read().decode(SolrCommonApi._ENCODING)
-        dictionary = json.loads(data)
+        return url
+
+    def _create_search_result(self, body):
+        with self.request_tracer.trace(AbsRequestTracer.DECODE_STAGE):
+            dictionary = json.loads(body.decode(SolrCommonApi._ENCODING))
         dictionary = dictionary[SolrCommonApi._RESPONSE_KEY]
-        result_list = [
+        with self.request_tracer.trace(AbsRequestTracer.CONSTRUCTION_STAGE):
+            document_list = dictionary[SolrCommonApi._DOCUMENT_LIST_KEY]
+            search_result = self.factory.create_columnar_search_result(
+                int(dictionary[SolrCommonApi._NUMBER_MATCHES_KEY]),
+                [x.get(SolrCommonApi._ID_FIELD, None) for x in document_list],
+                [x.get(SolrCommonApi._FIELD_TO_SEARCH, None) for x in document_list])
+        return search_result
+
+    def _create_data_list(self, dictionary):
+        return [
             self.factory.create_data(x.get(SolrCommonApi._ID_FIELD, None), x.get(SolrCommonApi._FIELD_TO_SEARCH, None))
             for x
             in dictionary[SolrCommonApi._DOCUMENT_LIST_KEY]]
-        search_result = self.factory.create_search_result(int(dictionary[SolrCommonApi._NUMBER_MATCHES_KEY]),
-                                                          result_list)
-        return search_result
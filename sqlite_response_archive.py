@@ -0,0 +1,64 @@
+import sqlite3
+import threading
+import zlib
+
+from abs_response_archive import AbsResponseArchive
+
+
+class SQLiteResponseArchive(AbsResponseArchive):
+    _TIMEOUT = 60
+    _COMPRESSION_LEVEL = 6
+    _ENCODING = "utf-8"
+    _PRAGMA_LIST = ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL"]
+    _CREATE_TABLE = ("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, is_text INTEGER NOT NULL, "
+                     + "data BLOB NOT NULL)")
+    _SELECT = "SELECT is_text, data FROM responses WHERE key = ?"
+    _INSERT = "INSERT OR REPLACE INTO responses (key, is_text, data) VALUES (?, ?, ?)"
+
+    def __init__(self, file_path):
+        self.__file_path = file_path
+        self.__local = threading.local()
+        self.__connection_list = []
+        self.__lock_connections = threading.Lock()
+        self.__lock_writes = threading.Lock()
+        connection = self._get_connection()
+        with connection:
+            connection.execute(SQLiteResponseArchive._CREATE_TABLE)
+
+    def load(self, key):
+        row = self._get_connection().execute(SQLiteResponseArchive._SELECT, (key,)).fetchone()
+        if row is None:
+            return None
+        is_text, data = row
+        response = zlib.decompress(data)
+        if is_text:
+            return response.decode(SQLiteResponseArchive._ENCODING)
+        return response
+
+    def save(self, key, response):
+        is_text = isinstance(response, str)
+        if is_text:
+            response = response.encode(SQLiteResponseArchive._ENCODING)
+        data = zlib.compress(response, SQLiteResponseArchive._COMPRESSION_LEVEL)
+        connection = self._get_connection()
+        with self.__lock_writes, connection:
+            connection.execute(SQLiteResponseArchive._INSERT, (key, int(is_text), data))
+
+    def close(self):
+        with self.__lock_connections:
+            for connection in self.__connection_list:
+                connection.close()
+            self.__connection_list = []
+            self.__local = threading.local()
+
+    def _get_connection(self):
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.__file_path, timeout=SQLiteResponseArchive._TIMEOUT,
+                                         check_same_thread=False)
+            for pragma in SQLiteResponseArchive._PRAGMA_LIST:
+                connection.execute(pragma)
+            self.__local.connection = connection
+            with self.__lock_connections:
+                self.__connection_list.append(connection)
+        return connection
@@ -0,0 +1,109 @@
+import pickle
+import sqlite3
+import threading
+
+from abs_result_store import AbsResultStore
+
+
+class SQLiteResultStore(AbsResultStore):
+    _TIMEOUT = 60
+    _PRAGMA_LIST = ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL"]
+    _CREATE_TABLE_LIST = ["CREATE TABLE IF NOT EXISTS queries (query TEXT PRIMARY KEY, "
+                          + "number_results INTEGER NOT NULL)",
+                          "CREATE TABLE IF NOT EXISTS pages (query TEXT NOT NULL, page_number INTEGER NOT NULL, "
+                          + "data BLOB NOT NULL, PRIMARY KEY (query, page_number))"]
+    _SELECT_NUMBER_RESULTS = "SELECT number_results FROM queries WHERE query = ?"
+    _SELECT_PAGES = "SELECT page_number, data FROM pages WHERE query = ? AND page_number BETWEEN ? AND ?"
+    _INSERT_QUERY = "INSERT OR IGNORE INTO queries (query, number_results) VALUES (?, ?)"
+    _INSERT_PAGE = "INSERT OR IGNORE INTO pages (query, page_number, data) VALUES (?, ?, ?)"
+    # Table of the previous layout, with one row per query holding all its results.
+    _SELECT_LEGACY_TABLE = "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'results'"
+    _SELECT_LEGACY_RESULTS = "SELECT query, number_results, data FROM results"
+    _DROP_LEGACY_TABLE = "DROP TABLE results"
+
+    @property
+    def page_size(self):
+        return self.__page_size
+
+    def __init__(self, file_path, page_size, factory):
+        self.__file_path = file_path
+        self.__page_size = page_size
+        self.__factory = factory
+        self.__local = threading.local()
+        self.__connection_list = []
+        self.__lock_connections = threading.Lock()
+        self.__lock_writes = threading.Lock()
+        connection = self._get_connection()
+        with connection:
+            for create_table in SQLiteResultStore._CREATE_TABLE_LIST:
+                connection.execute(create_table)
+            self._convert_legacy_table(connection)
+
+    def load_number_results(self, query):
+        row = self._get_connection().execute(SQLiteResultStore._SELECT_NUMBER_RESULTS, (query,)).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def load_pages(self, query, first_page_number, last_page_number):
+        cursor = self._get_connection().execute(SQLiteResultStore._SELECT_PAGES,
+                                                (query, first_page_number, last_page_number))
+        page_dictionary = {}
+        for page_number, data in cursor:
+            page_dictionary[page_number] = [self.__factory.create_data(x, y) for x, y in pickle.loads(data)]
+        return page_dictionary
+
+    def save_page(self, query, number_results, page_number, data_list):
+        pair_list = [(x.identifier, x.content) for x in data_list]
+        self._insert([(query, number_results)], [(query, page_number, self._serialize(pair_list))])
+
+    def save_many(self, query_result_list):
+        query_row_list = []
+        page_row_list = []
+        for query, search_result in query_result_list:
+            pair_list = [(x.identifier, x.content) for x in search_result.results]
+            query_row_list.append((query, search_result.number_results))
+            page_row_list.extend(self._create_page_rows(query, pair_list))
+        self._insert(query_row_list, page_row_list)
+
+    def close(self):
+        with self.__lock_connections:
+            for connection in self.__connection_list:
+                connection.close()
+            self.__connection_list = []
+            self.__local = threading.local()
+
+    def _insert(self, query_row_list, page_row_list):
+        connection = self._get_connection()
+        with self.__lock_writes, connection:
+            connection.executemany(SQLiteResultStore._INSERT_QUERY, query_row_list)
+            connection.executemany(SQLiteResultStore._INSERT_PAGE, page_row_list)
+
+    def _create_page_rows(self, query, pair_list):
+        if len(pair_list) == 0:
+            return [(query, 0, self._serialize([]))]
+        return [(query, i // self.__page_size, self._serialize(pair_list[i:i + self.__page_size]))
+                for i in range(0, len(pair_list), self.__page_size)]
+
+    def _convert_legacy_table(self, connection):
+        if connection.execute(SQLiteResultStore._SELECT_LEGACY_TABLE).fetchone() is None:
+            return
+        for query, number_results, data in connection.execute(SQLiteResultStore._SELECT_LEGACY_RESULTS):
+            connection.execute(SQLiteResultStore._INSERT_QUERY, (query, number_results))
+            connection.executemany(SQLiteResultStore._INSERT_PAGE, self._create_page_rows(query, pickle.loads(data)))
+        connection.execute(SQLiteResultStore._DROP_LEGACY_TABLE)
+
+    def _serialize(self, pair_list):
+        return pickle.dumps(pair_list, pickle.HIGHEST_PROTOCOL)
+
+    def _get_connection(self):
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.__file_path, timeout=SQLiteResultStore._TIMEOUT,
+                                         check_same_thread=False)
+            for pragma in SQLiteResultStore._PRAGMA_LIST:
+                connection.execute(pragma)
+            self.__local.connection = connection
+            with self.__lock_connections:
+                self.__connection_list.append(connection)
+        return connection
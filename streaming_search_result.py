@@ -0,0 +1,20 @@
+from abs_search_result import AbsSearchResult
+
+
+class StreamingSearchResult(AbsSearchResult):
+    """
+    Search result whose results are an iterator that can be consumed only once,
+    so that the documents do not need to be in memory at the same time.
+    """
+
+    def __init__(self, number_results, results):
+        self.__number_results = number_results
+        self.__results = results
+
+    @property
+    def number_results(self):
+        return self.__number_results
+
+    @property
+    def results(self):
+        return self.__results
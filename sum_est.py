@@ -1,7 +1,8 @@
-from threading import Lock
 import random
 
 from abs_estimator import AbsEstimator
+from abs_request_tracer import AbsRequestTracer
+from estimation_math import EstimationMath
 
 
 class SumEst(AbsEstimator):
@@ -31,20 +32,28 @@ class SumEst(AbsEstimator):
 
     def estimate(self):
         super().estimate()
-        estimation_acc = 0
         query_pool = self.common_api.read_query_pool()
+        query_matcher = self.common_api.factory.create_query_matcher(query_pool)
+        incidence_matrix = self.common_api.factory.create_incidence_matrix(self.common_api.degree_cache,
+                                                                           query_matcher)
         pool_size = self._estimate_pool_size(query_pool)
+        partial_estimation_list = self._calculate_partial_estimations(incidence_matrix, pool_size)
+        estimation = EstimationMath.mean(partial_estimation_list)
+        with self.common_api.request_tracer.trace(AbsRequestTracer.CACHE_WRITE_STAGE):
+            self.common_api.degree_cache.save()
+        return estimation
+
+    def _calculate_partial_estimations(self, incidence_matrix, pool_size):
+        partial_estimation_list = []
         for i in range(0, SumEst._ITERATION_NUMBER):
-            query_document_pair = self._select_query_document_pair(query_pool)
+            query_document_pair = self._select_query_document_pair(incidence_matrix.query_matcher.query_pool)
             document = query_document_pair[SumEst._PAIR_DOCUMENT_INDEX]
             query = query_document_pair[SumEst._PAIR_QUERY_INDEX]
-            document_inverse_degree = self._calculate_document_inverse_degree(document, query_pool)
+            document_inverse_degree = self._calculate_document_inverse_degree(document, incidence_matrix)
             degree_query = self._calculate_degree_query(query)
-            partial_estimation = pool_size * degree_query * document_inverse_degree
-            estimation_acc += partial_estimation
+            partial_estimation_list.append(pool_size * degree_query * document_inverse_degree)
             self.common_api.report_progress(i, SumEst._ITERATION_NUMBER)
-        estimation = estimation_acc / SumEst._ITERATION_NUMBER
-        return estimation
+        return partial_estimation_list
 
     def _verify_match(self, query, document):
         content = document.content.lower()
@@ -52,6 +61,12 @@ class SumEst(AbsEstimator):
             return True
         return False
 
+    def _verify_any_match(self, query, document_list):
+        for document in document_list:
+            if self._verify_match(query, document):
+                return True
+        return False
+
     def _select_query_document_pair(self, query_pool):
         list_size = len(query_pool)
         while True:
@@ -61,64 +76,54 @@ class SumEst(AbsEstimator):
                 document_list = self.common_api.download(random_query).results
             except:
                 continue
-            valid_list = []
-            for document in document_list:
-                if self._verify_match(random_query, document):
-                    valid_list.append(document)
-            if len(valid_list) > 0:
-                random_index = random.randrange(len(valid_list))
-                random_document = valid_list[random_index]
+            random_document = self._select_matching_document(random_query, document_list)
+            if random_document is not None:
                 return [random_query, random_document]
 
-    def _get_matching_query_list(self, document, query_pool):
-        lock = Lock()
-        matching_query_list = []
-
-        def iteration(query):
-            nonlocal document, matching_query_list, lock
+    def _select_matching_document(self, query, document_list, generator=random):
+        valid_list = []
+        for document in document_list:
             if self._verify_match(query, document):
-                with lock:
-                    matching_query_list.append(query)
+                valid_list.append(document)
+        if len(valid_list) > 0:
+            random_index = generator.randrange(len(valid_list))
+            return valid_list[random_index]
+        return None
 
-        self.common_api.execute_in_parallel(query_pool, iteration)
-        return matching_query_list
+    def _get_matching_query_list(self, document, incidence_matrix):
+        query_pool = incidence_matrix.query_matcher.query_pool
+        return [query_pool[x] for x in incidence_matrix.retrieve_columns(incidence_matrix.add_document(document))]
 
     def _calculate_degree_query(self, query):
-        lock = Lock()
-        count = 0
+        document_list = self.common_api.stream(query).results
+        return self._count_matching_documents(query, document_list)
+
+    def _count_matching_documents(self, query, document_list):
 
         def iteration(document):
-            nonlocal query, count, lock
-            if self._verify_match(query, document):
-                with lock:
-                    count += 1
+            nonlocal query
+            return self._verify_match(query, document)
 
-        document_list = self.common_api.download(query).results
-        self.common_api.execute_in_parallel(document_list, iteration)
-        return count
+        match_list = self.common_api.execute_in_parallel(document_list, iteration, True)
+        return sum(1 for x in match_list if x)
 
     def _estimate_pool_size(self, query_pool):
-        count = 0
         query_pool_size = len(query_pool)
-        lock = Lock()
 
         # noinspection PyUnusedLocal
         def iteration(iteration_number):
-            nonlocal query_pool, query_pool_size, count, lock
+            nonlocal query_pool, query_pool_size
             random_index = random.randrange(0, query_pool_size)
             query = query_pool[random_index]
             document_list = self.common_api.download(query).results
-            for document in document_list:
-                if self._verify_match(query, document):
-                    with lock:
-                        count += 1
-                    return
+            return self._verify_any_match(query, document_list)
 
-        self.common_api.execute_in_parallel(range(0, SumEst._POOL_SAMPLE_SIZE), iteration)
+        match_list = self.common_api.execute_in_parallel(range(0, SumEst._POOL_SAMPLE_SIZE), iteration, True)
+        count = sum(1 for x in match_list if x)
         return len(query_pool) * count / SumEst._POOL_SAMPLE_SIZE
 
-    def _calculate_document_inverse_degree(self, document, query_pool):
-        matching_query_list = self._get_matching_query_list(document, query_pool)
+    def _calculate_document_inverse_degree(self, document, incidence_matrix):
+        matching_query_list = self._get_matching_query_list(document, incidence_matrix)
         i = 1
         while True:
             random_index = random.randrange(0, len(matching_query_list))
@@ -127,7 +132,12 @@ class SumEst(AbsEstimator):
                 document_list = self.common_api.download(query).results
             except:
                 continue
-            for item in document_list:
-                if item.identifier == document.identifier:
-                    return i / len(matching_query_list)
+            if self._contains_document(document, document_list):
+                return i / len(matching_query_list)
             i += 1
+
+    def _contains_document(self, document, document_list):
+        for item in document_list:
+            if item.identifier == document.identifier:
+                return True
+        return False
@@ -0,0 +1,60 @@
+import random
+import string
+import itertools
+
+from abs_synthetic_corpus import AbsSyntheticCorpus
+
+
+class SyntheticCorpus(AbsSyntheticCorpus):
+    _IDENTIFIER_FORMAT = "doc{:08d}"
+    _MATCH_ALL = "*"
+    # Words are made of letters only and the content ends with a separator, as the word extraction expects.
+    _CONTENT_END = " ."
+    _FIRST_WORD_NUMBER = 27
+
+    @property
+    def size(self):
+        return len(self.__document_list)
+
+    @property
+    def vocabulary(self):
+        return self.__vocabulary
+
+    def __init__(self, number_documents, vocabulary_size, document_length, zipf_exponent=1.0, seed=0):
+        generator = random.Random(seed)
+        self.__vocabulary = [self._create_word(SyntheticCorpus._FIRST_WORD_NUMBER + i)
+                             for i in range(0, vocabulary_size)]
+        cumulative_weight_list = list(itertools.accumulate(1 / ((i + 1) ** zipf_exponent)
+                                                           for i in range(0, vocabulary_size)))
+        self.__document_list = []
+        self.__index = {}
+        for i in range(0, number_documents):
+            word_list = generator.choices(self.__vocabulary, cum_weights=cumulative_weight_list, k=document_length)
+            self.__document_list.append(" ".join(word_list) + SyntheticCorpus._CONTENT_END)
+            for word in set(word_list):
+                self.__index.setdefault(word, []).append(i)
+
+    def retrieve_document(self, index):
+        return SyntheticCorpus._IDENTIFIER_FORMAT.format(index), self.__document_list[index]
+
+    def match(self, word_list):
+        if SyntheticCorpus._MATCH_ALL in word_list:
+            return range(0, self.size)
+        if len(word_list) == 1:
+            return self.__index.get(word_list[0].lower(), [])
+        index_set = set()
+        for word in word_list:
+            index_set.update(self.__index.get(word.lower(), []))
+        return sorted(index_set)
+
+    def write_query_pool(self, file_path):
+        with open(file_path, "w") as file:
+            file.write("\n".join(self.vocabulary) + "\n")
+
+    @staticmethod
+    def _create_word(number):
+        word = ""
+        while number > 0:
+            number, remainder = divmod(number, len(string.ascii_lowercase))
+            word = string.ascii_lowercase[remainder] + word
+        return word
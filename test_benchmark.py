@@ -0,0 +1,27 @@
+import os
+import tempfile
+import unittest
+
+from benchmark import Benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    # Large enough for the document sample of BroderEtAl. RandomWalk is left out, since it takes the longest.
+    _NUMBER_DOCUMENTS = 1000
+    _ESTIMATOR_NAME_LIST = ["Mhr", "AsyncMhr", "BroderEtAl", "AsyncBroderEtAl", "SumEst", "AsyncSumEst"]
+    _ARCHIVE_FILE_NAME = "responses.sqlite"
+
+    def test_replay_reproduces_recorded_estimations(self):
+        with tempfile.TemporaryDirectory() as folder_path:
+            archive_file_path = os.path.join(folder_path, TestBenchmark._ARCHIVE_FILE_NAME)
+            recorded_report = Benchmark(TestBenchmark._ESTIMATOR_NAME_LIST, TestBenchmark._NUMBER_DOCUMENTS,
+                                        mode=Benchmark.RECORD_MODE, archive_file_path=archive_file_path).run()
+            replayed_report = Benchmark(TestBenchmark._ESTIMATOR_NAME_LIST, TestBenchmark._NUMBER_DOCUMENTS,
+                                        mode=Benchmark.REPLAY_MODE, archive_file_path=archive_file_path).run()
+        for estimator_name in TestBenchmark._ESTIMATOR_NAME_LIST:
+            self.assertEqual(replayed_report["estimators"][estimator_name]["estimation"],
+                             recorded_report["estimators"][estimator_name]["estimation"], estimator_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from caching_common_api import CachingCommonApi
+from mock_solr_server import MockSolrServer
+from session_common_api import SessionCommonApi
+from solr_common_api import SolrCommonApi
+from synthetic_corpus import SyntheticCorpus
+
+
+class TestCachingCommonApi(unittest.TestCase):
+    _NUMBER_DOCUMENTS = 300
+    _VOCABULARY_SIZE = 200
+    _DOCUMENT_LENGTH = 20
+
+    def setUp(self):
+        self.corpus = SyntheticCorpus(TestCachingCommonApi._NUMBER_DOCUMENTS, TestCachingCommonApi._VOCABULARY_SIZE,
+                                      TestCachingCommonApi._DOCUMENT_LENGTH)
+        self.server = MockSolrServer(self.corpus)
+        self.server.start()
+        self.common_api = SolrCommonApi(self.server.select_url, None, None)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_download_entire_data_set(self):
+        caching_common_api = CachingCommonApi(self.common_api)
+        search_result = caching_common_api.download_entire_data_set()
+        self.assertEqual(search_result.number_results, self.corpus.size)
+        self.assertEqual(len(list(search_result.results)), self.corpus.size)
+        self.assertEqual(caching_common_api.download_count, self.server.request_count)
+
+    def test_download_entire_data_set_through_session(self):
+        caching_common_api = CachingCommonApi(self.common_api)
+        session_common_api = SessionCommonApi(self.common_api, caching_common_api)
+        other_session_common_api = SessionCommonApi(self.common_api, caching_common_api)
+        search_result = session_common_api.download_entire_data_set()
+        self.assertEqual(len(list(search_result.results)), self.corpus.size)
+        self.assertEqual(session_common_api.download_count, self.server.request_count)
+        self.assertEqual(other_session_common_api.download_count, 0)
+
+    def test_request_count_of_cached_stream(self):
+        caching_common_api = CachingCommonApi(self.common_api)
+        session_common_api = SessionCommonApi(self.common_api, caching_common_api)
+        other_session_common_api = SessionCommonApi(self.common_api, caching_common_api)
+        query = self.corpus.vocabulary[0]
+        page_size = 10
+        number_results = len(list(session_common_api.stream(query, page_size=page_size).results))
+        self.assertGreater(session_common_api.download_count, 1)
+        self.assertEqual(session_common_api.download_count, self.server.request_count)
+        search_result = other_session_common_api.stream(query, page_size=page_size)
+        self.assertEqual(len(list(search_result.results)), number_results)
+        self.assertEqual(other_session_common_api.download_count, 0)
+        self.assertEqual(other_session_common_api.request_count, session_common_api.download_count)
+
+    def test_iterate_charged_keeps_none(self):
+        caching_common_api = CachingCommonApi(self.common_api)
+        request = caching_common_api._create_request()
+        self.assertEqual(list(caching_common_api._iterate_charged(iter([None, 1, None]), request)), [None, 1, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
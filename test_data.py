@@ -0,0 +1,30 @@
+import pickle
+import unittest
+
+from data import Data
+from search_result import SearchResult
+
+
+class TestData(unittest.TestCase):
+    # SearchResult(2, [Data("id-1", "first content"), Data("id-2", None)]) as pickled before Data had slots.
+    _BASELINE_PICKLE = (b"\x80\x04\x95\xd3\x00\x00\x00\x00\x00\x00\x00\x8c\rsearch_result\x94\x8c\x0cSearchResult"
+                        b"\x94\x93\x94)\x81\x94}\x94(\x8c\x1d_SearchResult__number_results\x94K\x02\x8c\x16"
+                        b"_SearchResult__results\x94]\x94(\x8c\x04data\x94\x8c\x04Data\x94\x93\x94)\x81\x94}\x94("
+                        b"\x8c\x11_Data__identifier\x94\x8c\x04id-1\x94\x8c\x0e_Data__content\x94\x8c\r"
+                        b"first content\x94ubh\n)\x81\x94}\x94(h\r\x8c\x04id-2\x94h\x0fNubeub.")
+
+    def test_load_baseline_pickle(self):
+        search_result = pickle.loads(TestData._BASELINE_PICKLE)
+        self.assertIsInstance(search_result, SearchResult)
+        self.assertEqual(search_result.number_results, 2)
+        self.assertEqual([(x.identifier, x.content) for x in search_result.results],
+                         [("id-1", "first content"), ("id-2", None)])
+
+    def test_pickle_round_trip(self):
+        for protocol in range(0, pickle.HIGHEST_PROTOCOL + 1):
+            data = pickle.loads(pickle.dumps(Data("id-1", "first content"), protocol))
+            self.assertEqual((data.identifier, data.content), ("id-1", "first content"))
+
+
+if __name__ == "__main__":
+    unittest.main()
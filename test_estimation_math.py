@@ -0,0 +1,55 @@
+import math
+import unittest
+
+from estimation_math import EstimationMath
+
+
+def old_random_walk_estimation(document_degree_list, frequency_number_nodes_dict):
+    n = len(document_degree_list)
+    dw = sum(document_degree_list) / n
+    dh = n / sum([1 / x for x in document_degree_list])
+    binomy_n_2 = math.factorial(n) / (math.factorial(n - 2) * 2)
+    c = sum([((math.factorial(x) / (math.factorial(x - 2) * 2)) * frequency_number_nodes_dict[x]) for x in
+             frequency_number_nodes_dict.keys()])
+    return (dw / dh) * binomy_n_2 * (1 / c)
+
+
+def old_mhr_estimation(total_matches, total_documents_returned, number_unique_documents_returned):
+    estimation = -1
+    if total_documents_returned != 0 and number_unique_documents_returned != 0:
+        overflow_rate = total_matches / total_documents_returned
+        overlapping_rate = total_documents_returned / number_unique_documents_returned
+        if overlapping_rate != 1:
+            estimation = overflow_rate * number_unique_documents_returned / (1 - overlapping_rate ** (-1.1))
+    return estimation
+
+
+class TestEstimationMath(unittest.TestCase):
+    _RANDOM_WALK_CASE_LIST = [([3, 1, 4, 1, 5, 9, 2, 6], {2: 3, 3: 1}),
+                              ([1, 1], {2: 1}),
+                              ([7, 2, 2, 11, 5, 3, 8, 1, 1, 4, 6, 2], {2: 4, 4: 2, 5: 1}),
+                              ([10] * 150, {2: 20, 3: 5, 10: 1})]
+    _MHR_CASE_LIST = [(5000, 1000, 800), (123456, 9876, 5432), (10, 3, 2), (0, 50, 49), (1, 1, 1), (7, 0, 0),
+                      (7, 5, 0), (100, 40, 40)]
+
+    def test_random_walk_estimation_equals_factorial_formula(self):
+        for degree_list, frequency_number_nodes_dict in TestEstimationMath._RANDOM_WALK_CASE_LIST:
+            self.assertAlmostEqual(EstimationMath.random_walk_estimation(degree_list, frequency_number_nodes_dict),
+                                   old_random_walk_estimation(degree_list, frequency_number_nodes_dict))
+
+    def test_mhr_estimation_equals_mhr_expression(self):
+        for total_matches, total_documents_returned, number_unique_documents_returned in \
+                TestEstimationMath._MHR_CASE_LIST:
+            self.assertAlmostEqual(EstimationMath.mhr_estimation(total_matches, total_documents_returned,
+                                                                 number_unique_documents_returned),
+                                   old_mhr_estimation(total_matches, total_documents_returned,
+                                                      number_unique_documents_returned))
+
+    def test_harmonic_mean_rejects_zero(self):
+        self.assertAlmostEqual(EstimationMath.harmonic_mean([1, 2, 4]), 3 / 1.75)
+        with self.assertRaises(ValueError):
+            EstimationMath.harmonic_mean([1, 0, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import time
+from threading import Lock
+
+from abs_rate_limiter import AbsRateLimiter
+
+
+class TokenBucketRateLimiter(AbsRateLimiter):
+
+    class _Bucket:
+        def __init__(self, number_tokens, last_refill_time):
+            self.number_tokens = number_tokens
+            self.last_refill_time = last_refill_time
+
+    def __init__(self, rate, burst_size):
+        self.__rate = rate
+        self.__burst_size = burst_size
+        self.__bucket_dict = {}
+        self.__lock = Lock()
+
+    def acquire(self, key):
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                bucket = self.__bucket_dict.get(key)
+                if bucket is None:
+                    bucket = TokenBucketRateLimiter._Bucket(self.__burst_size, now)
+                    self.__bucket_dict[key] = bucket
+                bucket.number_tokens = min(self.__burst_size,
+                                           bucket.number_tokens + (now - bucket.last_refill_time) * self.__rate)
+                bucket.last_refill_time = now
+                if bucket.number_tokens >= 1:
+                    bucket.number_tokens -= 1
+                    return
+                waiting_time = (1 - bucket.number_tokens) / self.__rate
+            time.sleep(waiting_time)
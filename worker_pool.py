@@ -0,0 +1,100 @@
+from queue import Queue
+from threading import Thread, Lock, Condition, get_ident
+
+from abs_worker_pool import AbsWorkerPool
+
+
+class WorkerPool(AbsWorkerPool):
+    _QUEUE_SIZE_PER_WORKER = 2
+
+    class _Batch:
+        def __init__(self, is_to_return_results):
+            self.condition = Condition()
+            self.number_pending_tasks = 0
+            self.exception = None
+            self.result_dict = {} if is_to_return_results else None
+
+        def add_task(self):
+            with self.condition:
+                self.number_pending_tasks += 1
+
+        def finish_task(self, index, result, exception):
+            with self.condition:
+                if exception is not None and self.exception is None:
+                    self.exception = exception
+                if self.result_dict is not None and exception is None:
+                    self.result_dict[index] = result
+                self.number_pending_tasks -= 1
+                if self.number_pending_tasks == 0:
+                    self.condition.notify_all()
+
+        def wait(self):
+            with self.condition:
+                while self.number_pending_tasks > 0:
+                    self.condition.wait()
+
+    @property
+    def size(self):
+        return self.__size
+
+    def __init__(self, size):
+        self.__size = size
+        self.__task_queue = Queue(size * WorkerPool._QUEUE_SIZE_PER_WORKER)
+        self.__thread_list = []
+        self.__worker_identifier_set = set()
+        self.__lock = Lock()
+
+    def execute(self, collection, callback, is_to_return_results=False):
+        if get_ident() in self.__worker_identifier_set:
+            return self._execute_in_current_thread(collection, callback, is_to_return_results)
+        self._start_workers()
+        batch = WorkerPool._Batch(is_to_return_results)
+        number_items = 0
+        for index, item in enumerate(collection):
+            if batch.exception is not None:
+                break
+            batch.add_task()
+            self.__task_queue.put((batch, index, item, callback))
+            number_items += 1
+        batch.wait()
+        if batch.exception is not None:
+            raise batch.exception
+        if is_to_return_results:
+            return [batch.result_dict[i] for i in range(0, number_items)]
+
+    def close(self):
+        with self.__lock:
+            for i in range(0, len(self.__thread_list)):
+                self.__task_queue.put(None)
+            for thread in self.__thread_list:
+                thread.join()
+            self.__thread_list = []
+            self.__worker_identifier_set = set()
+
+    def _execute_in_current_thread(self, collection, callback, is_to_return_results):
+        result_list = [callback(item) for item in collection]
+        if is_to_return_results:
+            return result_list
+
+    def _start_workers(self):
+        with self.__lock:
+            while len(self.__thread_list) < self.size:
+                thread = Thread(target=self._work, daemon=True)
+                thread.start()
+                self.__thread_list.append(thread)
+                self.__worker_identifier_set.add(thread.ident)
+
+    def _work(self):
+        while True:
+            task = self.__task_queue.get()
+            if task is None:
+                return
+            batch, index, item, callback = task
+            result = None
+            exception = None
+            if batch.exception is None:
+                try:
+                    result = callback(item)
+                except BaseException as callback_exception:
+                    exception = callback_exception
+            batch.finish_task(index, result, exception)